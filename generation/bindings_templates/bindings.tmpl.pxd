@@ -1,6 +1,8 @@
 # /!\ Autogenerated code, modifications will be lost /!\
 # see `generation/generate_bindings.py`
 
+from cpython.object cimport PyObject
+
 from godot._hazmat.gdnative_api_struct cimport *
 from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
 from godot.builtins cimport *
@@ -11,3 +13,7 @@ from godot.builtins cimport *
 {%- endfor %}
 
 cdef void _initialize_bindings()
+cdef void _report_method_binds_resolution()
+cdef Object _get_object_wrapper(godot_object *ptr, bint steal_ref)
+cdef void _set_object_wrapper(Object wrapper)
+cdef void _unregister_instance_binding_functions()
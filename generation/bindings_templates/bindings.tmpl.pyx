@@ -1,8 +1,15 @@
 # /!\ Autogenerated code, modifications will be lost /!\
 # see `generation/generate_bindings.py`
 
+cimport cython
+
 from godot._hazmat.gdnative_api_struct cimport *
-from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
+from libc.stdlib cimport malloc, free
+
+from godot._hazmat.gdapi cimport (
+    pythonscript_gdapi10 as gdapi10,
+    pythonscript_gdapi_ext_nativescript_1_1 as gdapi_ext_nativescript_1_1,
+)
 from godot._hazmat.conversion cimport *
 from godot.builtins cimport *
 
@@ -123,13 +130,443 @@ class VariantOperator(IntFlag):
     MAX = godot_variant_operator.GODOT_VARIANT_OP_MAX
 
 
+### Varargs method calls ###
+
+# Varargs calls pass their arguments on the stack up to this number
+DEF _VARARGS_CALL_STACK_SIZE = 16
+
+
+cdef object _call_method_bind_with_varargs(
+    godot_method_bind *methbind,
+    godot_object *ptr,
+    str name,
+    tuple args,
+    tuple varargs,
+    const godot_variant *p_first_arg=NULL,
+    bint check_error=True,
+):
+    # `p_first_arg` is an already converted argument passed before `args`
+    cdef int argcount = len(args) + len(varargs) + (p_first_arg != NULL)
+    cdef godot_variant vars_stack[_VARARGS_CALL_STACK_SIZE]
+    cdef const godot_variant *p_args_stack[_VARARGS_CALL_STACK_SIZE]
+    cdef godot_variant *vars = vars_stack
+    cdef const godot_variant **p_args = p_args_stack
+    if argcount > _VARARGS_CALL_STACK_SIZE:
+        vars = <godot_variant*>malloc(argcount * sizeof(godot_variant))
+        p_args = <const godot_variant**>malloc(argcount * sizeof(godot_variant*))
+        if vars == NULL or p_args == NULL:
+            free(vars)
+            free(p_args)
+            raise MemoryError()
+
+    cdef int offset = 0
+    cdef int converted = 0
+    cdef int i
+    cdef godot_variant_call_error error
+    cdef godot_variant ret
+    if p_first_arg != NULL:
+        p_args[0] = p_first_arg
+        offset = 1
+    try:
+        for arg in args:
+            pyobj_to_godot_variant(arg, &vars[converted])
+            p_args[offset + converted] = &vars[converted]
+            converted += 1
+        for arg in varargs:
+            pyobj_to_godot_variant(arg, &vars[converted])
+            p_args[offset + converted] = &vars[converted]
+            converted += 1
+        with nogil:
+            ret = gdapi10.godot_method_bind_call(methbind, ptr, p_args, argcount, &error)
+    finally:
+        with nogil:
+            for i in range(converted):
+                gdapi10.godot_variant_destroy(&vars[i])
+        if vars != vars_stack:
+            free(vars)
+            free(p_args)
+
+    if error.error != godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_OK:
+        with nogil:
+            gdapi10.godot_variant_destroy(&ret)
+        if not check_error:
+            return None
+        _raise_call_error(&error, name)
+    try:
+        return godot_variant_to_pyobj(&ret)
+    finally:
+        with nogil:
+            gdapi10.godot_variant_destroy(&ret)
+
+
+cdef int _raise_call_error(const godot_variant_call_error *error, str name) except -1:
+    if error.error == godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_TOO_MANY_ARGUMENTS:
+        raise TypeError(f"{name}() takes at most {error.argument} arguments")
+    elif error.error == godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_TOO_FEW_ARGUMENTS:
+        raise TypeError(f"{name}() takes at least {error.argument} arguments")
+    elif error.error == godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_ARGUMENT:
+        raise TypeError(
+            f"{name}() argument {error.argument + 1} must be of type {VariantType(error.expected).name}"
+        )
+    elif error.error == godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INSTANCE_IS_NULL:
+        raise RuntimeError(f"Cannot call {name}() on a null instance")
+    else:
+        raise RuntimeError(f"Invalid call to {name}()")
+
+
+### Lazy enums ###
+
+@cython.final
+cdef class _LazyIntFlag:
+    """
+    Class attribute building its IntFlag enum on first access.
+
+    Bindings classes define thousands of enums, creating them all at import
+    time would make loading the module much slower.
+    """
+    cdef str name
+    cdef dict values
+    cdef object enum
+
+    def __init__(self, str name, dict values):
+        self.name = name
+        self.values = values
+        self.enum = None
+
+    def __get__(self, instance, owner):
+        if self.enum is None:
+            self.enum = IntFlag(self.name, self.values)
+            self.values = None
+        return self.enum
+
+
 ### Classes ###
 
-{% from 'class.tmpl.pyx' import render_class, render_class_gdapi_ptrs_init -%}
+# Number of classes (and their methods) which method binds have been resolved
+cdef int __resolved_methbinds_classes_count = 0
+cdef int __resolved_methbinds_count = 0
+
+{% from 'method.tmpl.pyx' import get_method_bind_register_name_by_name with context %}
+{% from 'class.tmpl.pyx' import render_class, render_class_gdapi_ptrs_init with context -%}
 {%- for cls in classes %}
 {{ render_class(cls) }}
 {%- endfor %}
 
+### Godot class -> Python class resolution ###
+
+# Godot class name as provided by `Object.get_class` (e.g. singleton classes
+# have no leading underscore) -> Python wrapper class
+cdef dict __pyclass_from_godot_classname = {
+{% for cls in classes %}
+    "{{ cls.bind_register_name }}": {{ cls.name }},
+{% endfor %}
+}
+# Godot class name StringName's unique pointer -> Python wrapper class
+cdef dict __pyclass_from_godot_classname_ptr = {}
+cdef godot_object *__classdb_ptr = NULL
+cdef godot_method_bind *__methbind__ClassDB__get_parent_class = NULL
+
+
+cdef object _resolve_pyclass(str classname):
+    global __classdb_ptr
+    global __methbind__ClassDB__get_parent_class
+    cdef object pycls = __pyclass_from_godot_classname.get(classname)
+    if pycls is not None:
+        return pycls
+
+    if __classdb_ptr == NULL:
+        __classdb_ptr = gdapi10.godot_global_get_singleton("ClassDB")
+        __methbind__ClassDB__get_parent_class = gdapi10.godot_method_bind_get_method(
+            "_ClassDB", "get_parent_class"
+        )
+    if __classdb_ptr == NULL or __methbind__ClassDB__get_parent_class == NULL:
+        return Object
+
+    cdef GDString gdclassname
+    cdef GDString gdparentname
+    cdef const void *args[1]
+    # Class not present in the bindings (e.g. class provided by a GDNative
+    # module), use the nearest parent that is
+    while pycls is None:
+        gdclassname = GDString(classname)
+        gdparentname = GDString.__new__(GDString)
+        args[0] = &gdclassname._gd_data
+        with nogil:
+            gdapi10.godot_method_bind_ptrcall(
+                __methbind__ClassDB__get_parent_class,
+                __classdb_ptr,
+                args,
+                &gdparentname._gd_data
+            )
+        classname = str(gdparentname)
+        if not classname:
+            return Object
+        pycls = __pyclass_from_godot_classname.get(classname)
+    return pycls
+
+
+cdef size_t _get_godot_class_key(godot_object *ptr) except 0:
+    """
+    Return the unique pointer of the object's Godot class name StringName,
+    resolving the corresponding Python wrapper class the first time.
+    """
+    cdef godot_string classname
+    cdef godot_string_name classname_sn
+    __Object_resolve_methbinds()
+    with nogil:
+        gdapi10.godot_string_new(&classname)
+        gdapi10.godot_method_bind_ptrcall(
+            {{ get_method_bind_register_name_by_name("Object", "get_class") }},
+            ptr,
+            NULL,
+            &classname
+        )
+        gdapi10.godot_string_name_new(&classname_sn, &classname)
+    cdef size_t key = <size_t>gdapi10.godot_string_name_get_data_unique_pointer(&classname_sn)
+    if key in __pyclass_from_godot_classname_ptr:
+        gdapi10.godot_string_name_destroy(&classname_sn)
+        gdapi10.godot_string_destroy(&classname)
+        return key
+
+    try:
+        pycls = _resolve_pyclass(godot_string_to_pyobj(&classname))
+    finally:
+        gdapi10.godot_string_destroy(&classname)
+    # Note `classname_sn` is never destroyed: this keeps the StringName
+    # alive so it unique pointer cannot be reused for another name
+    __pyclass_from_godot_classname_ptr[key] = pycls
+    return key
+
+
+cdef object _get_pyclass_from_ptr(godot_object *ptr):
+    return __pyclass_from_godot_classname_ptr[_get_godot_class_key(ptr)]
+
+
+### Canonical wrapper of Godot objects ###
+
+# Each Godot object has at most one canonical Python wrapper (so `is` and
+# hashing work as expected), stored as a borrowed reference in the object's
+# instance binding data. The wrapper clears it on deallocation, and Godot
+# frees it along with the object.
+cdef int __instance_binding_index = -1
+
+
+cdef void *_alloc_instance_binding_data(void *data, const void *type_tag, godot_object *owner) nogil:
+    cdef PyObject **binding = <PyObject **>malloc(sizeof(PyObject *))
+    if binding != NULL:
+        binding[0] = NULL
+    return binding
+
+
+cdef void _free_instance_binding_data(void *data, void *binding) with gil:
+    cdef PyObject *wrapper = (<PyObject **>binding)[0]
+    if wrapper != NULL:
+        (<Object>wrapper)._gd_binding = NULL
+    free(binding)
+
+
+cdef void _register_instance_binding_functions():
+    global __instance_binding_index
+    if gdapi_ext_nativescript_1_1 == NULL:
+        return
+    cdef godot_instance_binding_functions functions
+    functions.alloc_instance_binding_data = &_alloc_instance_binding_data
+    functions.free_instance_binding_data = &_free_instance_binding_data
+    functions.refcount_incremented_instance_binding = NULL
+    functions.refcount_decremented_instance_binding = NULL
+    functions.data = NULL
+    functions.free_func = NULL
+    __instance_binding_index = gdapi_ext_nativescript_1_1.godot_nativescript_register_instance_binding_data_functions(
+        functions
+    )
+
+
+_register_instance_binding_functions()
+
+
+cdef void _unregister_instance_binding_functions():
+    # Must be called before the interpreter teardown: Godot frees the
+    # bindings of the remaining objects (which requires the GIL) either
+    # right now or when those objects get destroyed
+    global __instance_binding_index
+    if __instance_binding_index < 0:
+        return
+    gdapi_ext_nativescript_1_1.godot_nativescript_unregister_instance_binding_data_functions(
+        __instance_binding_index
+    )
+    __instance_binding_index = -1
+
+
+cdef inline PyObject **_get_instance_binding(godot_object *ptr):
+    if __instance_binding_index < 0:
+        return NULL
+    return <PyObject **>gdapi_ext_nativescript_1_1.godot_nativescript_get_instance_binding_data(
+        __instance_binding_index, ptr
+    )
+
+
+cdef Object _get_object_wrapper(godot_object *ptr, bint steal_ref):
+    """
+    Return the canonical wrapper of a Godot object, creating it if needed.
+
+    A Reference wrapper owns a reference on it object, `steal_ref` is for
+    callers passing their own reference on the object to the wrapper.
+    """
+    cdef godot_bool __ret
+    cdef Object wrapper
+    cdef PyObject **binding = _get_instance_binding(ptr)
+    if binding != NULL and binding[0] != NULL:
+        wrapper = <Object>binding[0]
+        if steal_ref and isinstance(wrapper, Reference):
+            # Wrapper already owns a reference, so refcount cannot drop to 0
+            __Reference_resolve_methbinds()
+            with nogil:
+                gdapi10.godot_method_bind_ptrcall(
+                    {{ get_method_bind_register_name_by_name("Reference", "unreference") }},
+                    ptr,
+                    NULL,
+                    &__ret
+                )
+        return wrapper
+
+    wrapper = _get_pyclass_from_ptr(ptr)._from_ptr(<size_t>ptr)
+    if not steal_ref and isinstance(wrapper, Reference):
+        __Reference_resolve_methbinds()
+        with nogil:
+            gdapi10.godot_method_bind_ptrcall(
+                {{ get_method_bind_register_name_by_name("Reference", "reference") }},
+                ptr,
+                NULL,
+                &__ret
+            )
+    if binding != NULL:
+        binding[0] = <PyObject *>wrapper
+        wrapper._gd_binding = binding
+    return wrapper
+
+
+cdef void _set_object_wrapper(Object wrapper):
+    # Replace the canonical wrapper (e.g. by the Python script instance)
+    cdef PyObject **binding = _get_instance_binding(wrapper._gd_ptr)
+    if binding == NULL or binding[0] == <PyObject *>wrapper:
+        return
+    if binding[0] != NULL:
+        (<Object>binding[0])._gd_binding = NULL
+    binding[0] = <PyObject *>wrapper
+    wrapper._gd_binding = binding
+
+
+### Members of the scripts attached to Godot objects ###
+
+# Looking up a script member by name (`has_method`, or scanning the whole
+# `get_property_list`) is much slower than using it, so members are cached
+# per (Godot class, attached script instance id). Instance ids are never
+# reused, hence replacing the object's script gives a new cache entry.
+# Least recently used entries are evicted (dict is kept in usage order).
+DEF _SCRIPT_MEMBERS_CACHE_SIZE = 256
+cdef dict __script_members_cache = {}
+
+
+@cython.final
+cdef class _ScriptMethodName:
+    # Method name converted once and for all into the variant passed to `call`
+    cdef godot_variant _gd_name
+
+    def __cinit__(self, str name):
+        pyobj_to_godot_variant(name, &self._gd_name)
+
+    def __dealloc__(self):
+        gdapi10.godot_variant_destroy(&self._gd_name)
+
+
+@cython.final
+cdef class _ScriptMembers:
+    # Source code of the script when the members were retrieved: reloading
+    # a script replaces it source buffer (the old one cannot be reused for
+    # the new source given it is kept alive here)
+    cdef GDString source
+    cdef dict methods  # name -> _ScriptMethodName (or None if not a method)
+    cdef dict properties  # name -> GDString
+
+    def __init__(self, Object obj, GDString source):
+        cdef GDString gdnamefield = GDString("name")
+        self.source = source
+        self.methods = {}
+        self.properties = {}
+        for prop in Object.get_property_list(obj):
+            gdname = prop[gdnamefield]
+            self.properties[str(gdname)] = gdname
+
+    cdef bint is_up_to_date(self, GDString source):
+        # Scripts without source code (e.g. exported GDScript bytecode) are
+        # never reloaded
+        return gdapi10.godot_string_wide_str(&source._gd_data) == gdapi10.godot_string_wide_str(
+            &self.source._gd_data
+        )
+
+    cdef _ScriptMethodName get_method(self, Object obj, str name):
+        cdef _ScriptMethodName method
+        try:
+            return self.methods[name]
+        except KeyError:
+            pass
+        method = _ScriptMethodName(name) if Object.has_method(obj, name) else None
+        self.methods[name] = method
+        return method
+
+
+@cython.final
+cdef class _ScriptMethodCall:
+    """
+    Method of the script attached to a Godot object, bound to this object.
+    """
+    cdef Object obj
+    cdef _ScriptMethodName method
+
+    def __repr__(self):
+        return f"<bound script method {godot_variant_to_pyobj(&self.method._gd_name)} of {self.obj!r}>"
+
+    def __call__(self, *args):
+        __Object_resolve_methbinds()
+        if {{ get_method_bind_register_name_by_name("Object", "call") }} == NULL:
+            raise NotImplementedError(__ERR_MSG_BINDING_NOT_AVAILABLE)
+        # Errors are ignored (e.g. invalid arguments), the call returns None
+        # just like `Object.callv` does
+        return _call_method_bind_with_varargs(
+            {{ get_method_bind_register_name_by_name("Object", "call") }},
+            self.obj._gd_ptr,
+            "call",
+            (),
+            args,
+            &self.method._gd_name,
+            False,
+        )
+
+
+cdef _ScriptMembers _get_script_members(Object obj):
+    # Return None if no script is attached to the object
+    script = Object.get_script(obj)
+    if script is None:
+        return None
+    key = (_get_godot_class_key(obj._gd_ptr), Object.get_instance_id(script))
+    cdef GDString source = Script.get_source_code(script)
+    cdef _ScriptMembers members = __script_members_cache.pop(key, None)
+    if members is None or not members.is_up_to_date(source):
+        # First use of the script or script has been reloaded since
+        members = _ScriptMembers(obj, source)
+        if len(__script_members_cache) >= _SCRIPT_MEMBERS_CACHE_SIZE:
+            del __script_members_cache[next(iter(__script_members_cache))]
+    __script_members_cache[key] = members
+    return members
+
+
+cdef _ScriptMethodCall _bind_script_method(Object obj, _ScriptMethodName method):
+    cdef _ScriptMethodCall bound = _ScriptMethodCall.__new__(_ScriptMethodCall)
+    bound.obj = obj
+    bound.method = method
+    return bound
+
+
 ### Global constants ###
 
 {% for key, value in constants.items() %}
@@ -189,3 +626,11 @@ cdef void _initialize_bindings():
 {%- endfor %}
 
     _bindings_initialized = True
+
+
+cdef void _report_method_binds_resolution():
+    print(
+        f"Pythonscript: method binds resolved for {__resolved_methbinds_classes_count}"
+        f"/{{ classes | length }} classes ({__resolved_methbinds_count}"
+        f"/{{ classes | map(attribute="bound_methods") | map("length") | sum }} methods)"
+    )
@@ -5,6 +5,9 @@
 cdef class {{ cls.name }}({{ cls.base_class }}):
 {% if not cls.base_class %}
     cdef godot_object *_gd_ptr
+    # Slot in the Godot object's instance binding data pointing to this
+    # wrapper, NULL if this wrapper is not the object's canonical one
+    cdef PyObject **_gd_binding
 
     @staticmethod
     cdef inline Object cast_from_variant(const godot_variant *p_gdvar)
@@ -8,9 +8,9 @@ class {{ cls.name }}({{ cls.base_class }}):
     def __repr__(self) -> str: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
     def __getattr__(self, name: str) -> Any: ...
     def __setattr__(self, name: str, value: Any): ...
-    def call(self, name: str, *args) -> Any: ...
 
 {% endif %}
 
@@ -59,6 +59,9 @@ class {{ cls.name }}({{ cls.base_class }}):
 {%- endif %}
 ,
 {%- endfor %}
+{%- if method.has_varargs %}
+ *varargs
+{%- endif %}
 ) -> {{ method.return_type.py_type }}: ...
 {% endif %}
 {% endfor %}
@@ -1,4 +1,4 @@
-{% from 'method.tmpl.pyx' import render_method, get_method_bind_register_name %}
+{% from 'method.tmpl.pyx' import render_method, render_property, get_method_bind_register_name, get_method_bind_register_name_by_name with context %}
 
 
 {% macro render_class_gdapi_ptrs_init(cls) %}
@@ -8,11 +8,33 @@ global __{{ cls.name }}_constructor
 __{{ cls.name }}_constructor = gdapi10.godot_get_class_constructor("{{ cls.name }}")
 {% endif %}
 
-{% for method in cls.methods %}
-global {{ get_method_bind_register_name(cls, method) }}
-{{ get_method_bind_register_name(cls, method) }} = gdapi10.godot_method_bind_get_method("{{ cls.bind_register_name }}", "{{ method.name }}")
-{% endfor %}
+{% endmacro %}
+
 
+{% macro render_class_method_binds(cls) %}
+{% set bound_methods = cls.bound_methods %}
+{% if bound_methods %}
+# Method binds are resolved all at once the first time one of them is needed
+# (resolving the binds of all the classes takes thousands of lookups).
+# Resolution holds the GIL so concurrent first uses don't race on the flag
+# and the counters, callers in a nogil section must resolve before entering it
+cdef godot_method_bind *__{{ cls.name }}_methbinds[{{ bound_methods | length }}]
+cdef bint __{{ cls.name }}_methbinds_resolved = False
+
+
+cdef void __{{ cls.name }}_resolve_methbinds():
+    global __{{ cls.name }}_methbinds_resolved
+    global __resolved_methbinds_classes_count
+    global __resolved_methbinds_count
+    if __{{ cls.name }}_methbinds_resolved:
+        return
+{% for method in bound_methods %}
+    {{ get_method_bind_register_name(cls, method) }} = gdapi10.godot_method_bind_get_method("{{ cls.bind_register_name }}", "{{ method.name }}")
+{% endfor %}
+    __{{ cls.name }}_methbinds_resolved = True
+    __resolved_methbinds_classes_count += 1
+    __resolved_methbinds_count += {{ bound_methods | length }}
+{% endif %}
 {% endmacro %}
 
 
@@ -27,9 +49,7 @@ from cpython.object cimport PyObject_GenericGetAttr, PyObject_GenericSetAttr
 cdef godot_class_constructor __{{ cls.name }}_constructor = NULL
 {% endif %}
 
-{% for method in cls.methods %}
-cdef godot_method_bind *{{ get_method_bind_register_name(cls, method) }} = NULL
-{% endfor %}
+{{ render_class_method_binds(cls) }}
 
 cdef class {{ cls.name }}({{ cls.base_class }}):
 {% if not cls.base_class %}
@@ -46,32 +66,22 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
     def __repr__(self):
         return f"<{type(self).__name__} wrapper on 0x{<size_t>self._gd_ptr:x}>"
 
+    def __dealloc__(self):
+        # The Godot object may outlive it wrapper
+        if self._gd_binding != NULL:
+            self._gd_binding[0] = NULL
+            self._gd_binding = NULL
+
     @staticmethod
     cdef inline Object cast_from_variant(const godot_variant *p_gdvar):
         cdef godot_object *ptr = gdapi10.godot_variant_as_object(p_gdvar)
-        # Retreive class
-        cdef GDString classname = GDString.__new__(GDString)
-        with nogil:
-            gdapi10.godot_method_bind_ptrcall(
-                __methbind__Object__get_class,
-                ptr,
-                NULL,
-                &classname._gd_data
-            )
-        return globals()[str(classname)]._from_ptr(<size_t>ptr)
+        # Variant keeps it reference on the object
+        return _get_object_wrapper(ptr, False)
 
     @staticmethod
     cdef inline Object cast_from_ptr(godot_object *ptr):
-        # Retreive class
-        cdef GDString classname = GDString.__new__(GDString)
-        with nogil:
-            gdapi10.godot_method_bind_ptrcall(
-                __methbind__Object__get_class,
-                ptr,
-                NULL,
-                &classname._gd_data
-            )
-        return globals()[str(classname)]._from_ptr(<size_t>ptr)
+        # Reference returned by ptrcall is passed to the wrapper
+        return _get_object_wrapper(ptr, True)
 
     def __eq__(self, other):
         try:
@@ -85,32 +95,51 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
         except TypeError:
             return True
 
+    def __hash__(self):
+        return hash(<size_t>self._gd_ptr)
+
     def __getattr__(self, name):
-        cdef GDString gdname = GDString(name)
-        cdef GDString gdnamefield = GDString("name")
+        cdef _ScriptMembers members
+        cdef _ScriptMethodName method
+        cdef GDString gdname
+        cdef GDString gdnamefield
 
         # If a script is attached to the object, we expose here it methods
         if not hasattr(type(self), '__exposed_python_class'):
-            if self.has_method(name):
+            members = _get_script_members(self)
+            if members is not None:
+                method = members.get_method(self, name)
+                if method is not None:
+                    return _bind_script_method(self, method)
+                gdname = members.properties.get(name)
+                if gdname is not None:
+                    return {{ cls.name }}.get(self, gdname)
+
+            # No script, only non-Python GDNative classes can provide members
+            # unknown to the bindings
+            elif self.has_method(name):
+                gdname = GDString(name)
 
                 def _call(*args):
                     return {{ cls.name }}.callv(self, gdname, Array(args))
 
                 return _call
-                # from functools import partial
-                # return partial(self.call, gdname)
 
-            elif any(x for x in self.get_property_list() if x[gdnamefield] == gdname):
-                # TODO: Godot currently lacks a `has_property` method
-                return self.get(gdname)
+            else:
+                gdname = GDString(name)
+                gdnamefield = GDString("name")
+                if any(x for x in self.get_property_list() if x[gdnamefield] == gdname):
+                    # TODO: Godot currently lacks a `has_property` method
+                    return self.get(gdname)
 
         raise AttributeError(
             f"`{type(self).__name__}` object has no attribute `{name}`"
         )
 
     def __setattr__(self, name, value):
-        cdef GDString gdname = GDString(name)
-        cdef GDString gdnamefield = GDString("name")
+        cdef _ScriptMembers members
+        cdef GDString gdname
+        cdef GDString gdnamefield
 
         if hasattr(type(self), '__exposed_python_class'):
             PyObject_GenericSetAttr(self, name, value)
@@ -118,19 +147,25 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
 
         # Could retrieve the item inside the Godot class, try to look into
         # the attached script if it has one
+        members = _get_script_members(self)
+        if members is not None:
+            gdname = members.properties.get(name)
+            if gdname is not None:
+                {{ cls.name }}.set(self, gdname, value)
+                return
+
         else:
+            gdname = GDString(name)
+            gdnamefield = GDString("name")
             if any(x for x in self.get_property_list() if x[gdnamefield] == gdname):
                 # TODO: Godot currently lacks a `has_property` method
-                self.set(name, value)
+                self.set(gdname, value)
                 return
 
         raise AttributeError(
             f"`{type(self).__name__}` object has no attribute `{name}`"
         )
 
-    def call(self, name, *args):
-        return self.callv(name, Array(args))
-
 {% endif %}
 
 {% if not cls.singleton and cls.instantiable %}
@@ -140,6 +175,7 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
         if __{{ cls.name }}_constructor == NULL:
             raise NotImplementedError(__ERR_MSG_BINDING_NOT_AVAILABLE)
         cdef godot_bool __ret
+        __Reference_resolve_methbinds()
         with nogil:
             self._gd_ptr = __{{ cls["name"] }}_constructor()
 
@@ -147,11 +183,12 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
                 raise MemoryError
 
             gdapi10.godot_method_bind_ptrcall(
-                __methbind__Reference__init_ref,
+                {{ get_method_bind_register_name_by_name("Reference", "init_ref") }},
                 self._gd_ptr,
                 NULL,
                 &__ret
             )
+        _set_object_wrapper(self)
 {% else %}
     @staticmethod
     def new():
@@ -163,6 +200,7 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
             wrapper._gd_ptr = __{{ cls.name }}_constructor()
         if wrapper._gd_ptr is NULL:
             raise MemoryError
+        _set_object_wrapper(wrapper)
         return wrapper
 {% endif %}
 
@@ -173,11 +211,16 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
 
     def __dealloc__(self):
         cdef godot_bool __ret
+        # Must be done before unreferencing given it may destroy the object
+        if self._gd_binding != NULL:
+            self._gd_binding[0] = NULL
+            self._gd_binding = NULL
         if self._gd_ptr == NULL:
             return
+        __Reference_resolve_methbinds()
         with nogil:
             gdapi10.godot_method_bind_ptrcall(
-                __methbind__Reference__unreference,
+                {{ get_method_bind_register_name_by_name("Reference", "unreference") }},
                 self._gd_ptr,
                 NULL,
                 &__ret
@@ -231,7 +274,7 @@ cdef class {{ cls.name }}({{ cls.base_class }}):
     # Enums
 {% endif %}
 {% for enum in cls.enums %}
-    {{ enum.name }} = IntFlag("{{ enum.name }}", {
+    {{ enum.name }} = _LazyIntFlag("{{ enum.name }}", {
 {% for key, value in enum.values.items() %}
     "{{ key }}": {{ value }},
 {% endfor %}
@@ -257,24 +300,7 @@ TODO: see PinJoint.params/bias for a good example
 #}
 {% for prop in cls.properties %}
 
-    @property
-    def {{ prop.name }}(self):
-{% if prop.is_supported %}
-        return self.{{ prop.getter }}({% if prop.index is not none %}{{ prop.index }}{% endif %})
-{% else %}
-        raise NotImplementedError("{{prop.unsupported_reason}}")
-{% endif %}
-
-{% if prop.setter %}
-    @{{ prop.name }}.setter
-    def {{ prop.name }}(self, val):
-{% if prop.is_supported %}
-        self.{{ prop.setter }}({% if prop.index is not none %}{{ prop.index }},{% endif %}val)
-{% else %}
-        raise NotImplementedError("{{prop.unsupported_reason}}")
-{% endif %}
-{% endif %}
-
+    {{ render_property(cls, prop) | indent }}
 {% endfor %}
 
 {% endmacro %}
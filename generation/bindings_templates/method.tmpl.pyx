@@ -1,5 +1,12 @@
 {% macro get_method_bind_register_name(cls, method) -%}
-__methbind__{{ cls.name }}__{{ method.name }}
+__{{ cls.name }}_methbinds[{{ cls.get_method_bind_index(method.name) }}]
+{%- endmacro %}
+
+
+{# Only for templates rendered with the `classes` context #}
+{% macro get_method_bind_register_name_by_name(cls_name, method_name) -%}
+{% set cls = classes | selectattr("name", "equalto", cls_name) | first %}
+__{{ cls.name }}_methbinds[{{ cls.get_method_bind_index(method_name) }}]
 {%- endmacro %}
 
 
@@ -30,6 +37,9 @@ __methbind__{{ cls.name }}__{{ method.name }}
 {%- endif %}
 ,
 {%- endfor %}
+{%- if method.has_varargs %}
+ *varargs
+{%- endif %}
 )
 {%- endmacro %}
 
@@ -56,6 +66,20 @@ return {{ retval }}
 {%- endmacro %}
 
 
+{% macro _render_method_check_args(method) %}
+{# Arguments that may raise a TypeError are checked before any Godot value is allocated #}
+{% for arg in method.arguments %}
+{% if arg.type.c_type == "godot_string" %}
+if type({{ arg.name }}) is not str:
+    {{ arg.name }} = ensure_is_gdstring({{ arg.name }})
+{% elif arg.type.c_type == "godot_node_path" %}
+if type({{ arg.name }}) is not str:
+    {{ arg.name }} = ensure_is_nodepath({{ arg.name }})
+{% endif %}
+{% endfor %}
+{%- endmacro %}
+
+
 {% macro _render_method_cook_args(method, argsval="__args") %}
 {% if (method.arguments | length )  != 0 %}
 cdef const void *{{ argsval }}[{{ method.arguments | length }}]
@@ -64,11 +88,24 @@ cdef const void *{{ argsval }}[{{ method.arguments | length }}]
 {% set i = loop.index - 1 %}
 # {{ arg.type.c_type }} {{ arg.name }}
 {% if arg.type.c_type == "godot_string" %}
-cdef GDString __gdstr_{{ arg.name }} = ensure_is_gdstring({{ arg.name }})
-{{ argsval }}[{{ i }}] = <void*>(&__gdstr_{{ arg.name }}._gd_data)
+# Plain `str` (the most common case) is converted without Python wrapper
+cdef godot_string __gdstr_{{ arg.name }}
+if type({{ arg.name }}) is str:
+    pyobj_to_godot_string({{ arg.name }}, &__gdstr_{{ arg.name }})
+    {{ argsval }}[{{ i }}] = <void*>(&__gdstr_{{ arg.name }})
+else:
+    {{ argsval }}[{{ i }}] = <void*>(&(<GDString>{{ arg.name }})._gd_data)
 {% elif arg.type.c_type == "godot_node_path" %}
-cdef NodePath __nodepath_{{ arg.name }} = ensure_is_nodepath({{ arg.name }})
-{{ argsval }}[{{ i }}] = <void*>(&__nodepath_{{ arg.name }}._gd_data)
+# Plain `str` (the most common case) is converted without Python wrapper
+cdef godot_string __gdstr_{{ arg.name }}
+cdef godot_node_path __gdnodepath_{{ arg.name }}
+if type({{ arg.name }}) is str:
+    pyobj_to_godot_string({{ arg.name }}, &__gdstr_{{ arg.name }})
+    gdapi10.godot_node_path_new(&__gdnodepath_{{ arg.name }}, &__gdstr_{{ arg.name }})
+    gdapi10.godot_string_destroy(&__gdstr_{{ arg.name }})
+    {{ argsval }}[{{ i }}] = <void*>(&__gdnodepath_{{ arg.name }})
+else:
+    {{ argsval }}[{{ i }}] = <void*>(&(<NodePath>{{ arg.name }})._gd_data)
 {% elif arg.type.is_object %}
 {%- if arg.has_default_value and arg.default_value == "None" %}
 {{ argsval }}[{{ i }}] = <void*>{{ arg.name }}._gd_ptr if {{ arg.name }} is not None else NULL
@@ -98,6 +135,14 @@ cdef double {{ arg.name }}_d = <double>{{ arg.name }};
 {% if arg.type.c_type == "godot_variant" %}
 with nogil:
     gdapi10.godot_variant_destroy(&__var_{{ arg.name }})
+{% elif arg.type.c_type == "godot_string" %}
+if type({{ arg.name }}) is str:
+    with nogil:
+        gdapi10.godot_string_destroy(&__gdstr_{{ arg.name }})
+{% elif arg.type.c_type == "godot_node_path" %}
+if type({{ arg.name }}) is str:
+    with nogil:
+        gdapi10.godot_node_path_destroy(&__gdnodepath_{{ arg.name }})
 {% endif %}
 {% endfor %}
 {%- endmacro %}
@@ -128,8 +173,6 @@ cdef double {{ retval }}
 cdef {{ method.return_type.c_type }} {{ retval }}
 {% set retval_as_arg = "&{}".format(retval) %}
 {% endif %}
-if {{ get_method_bind_register_name(cls, method) }} == NULL:
-    raise NotImplementedError(__ERR_MSG_BINDING_NOT_AVAILABLE)
 with nogil:
     gdapi10.godot_method_bind_ptrcall(
         {{ get_method_bind_register_name(cls, method) }},
@@ -144,6 +187,35 @@ with nogil:
 {%- endmacro %}
 
 
+{% macro _render_varargs_method_call(cls, method) %}
+{# Varargs methods cannot be ptrcalled, arguments are passed as variants #}
+{% set call %}
+_call_method_bind_with_varargs(
+    {{ get_method_bind_register_name(cls, method) }},
+    self._gd_ptr,
+    "{{ method.name }}",
+    (
+{% for arg in method.arguments %}
+{% if arg.type.c_type == "godot_node_path" %}
+        ensure_is_nodepath({{ arg.name }}),
+{% else %}
+        {{ arg.name }},
+{% endif %}
+{% endfor %}
+    ),
+    varargs,
+)
+{%- endset %}
+{% if method.return_type.c_type == "void" %}
+{{ call }}
+{% elif method.return_type.is_enum %}
+return {{ method.return_type.py_type }}({{ call | indent }})
+{% else %}
+return {{ call }}
+{% endif %}
+{%- endmacro %}
+
+
 {% macro render_method(cls, method) %}
 # {{ render_method_c_signature(method) }}
 def {{ render_method_signature(method) }}:
@@ -155,12 +227,104 @@ def {{ render_method_signature(method) }}:
     return Object.callv(self, "{{ method.name }}", args)
 {% else %}
 {%   if method.is_supported %}
+    if {{ get_method_bind_register_name(cls, method) }} == NULL:
+        __{{ cls.name }}_resolve_methbinds()
+        if {{ get_method_bind_register_name(cls, method) }} == NULL:
+            raise NotImplementedError(__ERR_MSG_BINDING_NOT_AVAILABLE)
+    {{ _render_method_check_args(method) | indent }}
+{%     if method.has_varargs %}
+    {{ _render_varargs_method_call(cls, method) | indent }}
+{%     else %}
     {{ _render_method_cook_args(method) | indent }}
     {{ _render_method_call(cls, method) | indent }}
     {{ _render_method_destroy_args(method) | indent }}
     {{ _render_method_return(method) | indent }}
+{%     endif %}
 {%   else %}
     raise NotImplementedError("{{method.unsupported_reason}}")
 {%   endif %}
 {% endif %}
 {% endmacro %}
+
+
+{# Property accessors ptrcall their method bind directly (with the index
+argument baked in), unless the accessor method is not bound by this class
+(e.g. defined by a parent or virtual) or has an unusual signature #}
+{% macro _get_direct_property_accessor(cls, prop, accessor, is_setter) -%}
+{% set method = cls.get_bound_method(accessor) if accessor else none %}
+{% set expected_args = (0 if prop.index is none else 1) + (1 if is_setter else 0) %}
+{% if method is not none
+   and not method.has_varargs
+   and (method.arguments | length) == expected_args
+   and (prop.index is none or method.arguments[0].type.is_base_type)
+   and (not is_setter or method.return_type.c_type == "void") %}
+{{ method.name }}
+{%- endif %}
+{%- endmacro %}
+
+
+{% macro _render_property_index_arg(method, prop) %}
+{% if prop.index is not none %}
+{% set arg = method.arguments[0] %}
+cdef {{ arg.type.c_type }} {{ arg.name }} = <{{ arg.type.c_type }}>{{ prop.index }}
+{% endif %}
+{%- endmacro %}
+
+
+{% macro _render_property_check_method_bind(cls, method) %}
+if {{ get_method_bind_register_name(cls, method) }} == NULL:
+    __{{ cls.name }}_resolve_methbinds()
+    if {{ get_method_bind_register_name(cls, method) }} == NULL:
+        raise NotImplementedError(__ERR_MSG_BINDING_NOT_AVAILABLE)
+{%- endmacro %}
+
+
+{% macro render_property(cls, prop) %}
+{% set getter = _get_direct_property_accessor(cls, prop, prop.getter, false) %}
+{% set setter = _get_direct_property_accessor(cls, prop, prop.setter, true) %}
+@property
+def {{ prop.name }}(self):
+{% if not prop.is_supported %}
+    raise NotImplementedError("{{prop.unsupported_reason}}")
+{% elif getter %}
+{% set method = cls.get_bound_method(getter) %}
+    {{ _render_property_check_method_bind(cls, method) | indent }}
+    {{ _render_property_index_arg(method, prop) | indent }}
+    {{ _render_method_cook_args(method) | indent }}
+    {{ _render_method_call(cls, method) | indent }}
+    {{ _render_method_return(method) | indent }}
+{% else %}
+    return self.{{ prop.getter }}({% if prop.index is not none %}{{ prop.index }}{% endif %})
+{% endif %}
+
+{% if prop.setter %}
+@{{ prop.name }}.setter
+{% if not prop.is_supported %}
+def {{ prop.name }}(self, val):
+    raise NotImplementedError("{{prop.unsupported_reason}}")
+{% elif setter %}
+{% set method = cls.get_bound_method(setter) %}
+{% set value_arg = method.arguments[-1] %}
+{# Same argument checks as the setter method, only the value is passed #}
+def {{ prop.name }}(self,
+{%- if value_arg.type.c_type in ("godot_string", "godot_node_path") %}
+ object {{ value_arg.name }}
+{%- else %}
+ {{ value_arg.type.cy_type }} {{ value_arg.name }}
+{%- if not value_arg.type.is_base_type and not (value_arg.has_default_value and value_arg.default_value == "None") %}
+ not None
+{%- endif %}
+{%- endif %}
+):
+    {{ _render_property_check_method_bind(cls, method) | indent }}
+    {{ _render_method_check_args(method) | indent }}
+    {{ _render_property_index_arg(method, prop) | indent }}
+    {{ _render_method_cook_args(method) | indent }}
+    {{ _render_method_call(cls, method) | indent }}
+    {{ _render_method_destroy_args(method) | indent }}
+{% else %}
+def {{ prop.name }}(self, val):
+    self.{{ prop.setter }}({% if prop.index is not none %}{{ prop.index }},{% endif %}val)
+{% endif %}
+{% endif %}
+{% endmacro %}
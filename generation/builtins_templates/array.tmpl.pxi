@@ -1,6 +1,228 @@
 {%- block pxd_header %}
 {% endblock -%}
 {%- block pyx_header %}
+
+# Bulk conversions between Array/Dictionary and list/dict, done in a single
+# loop over the Godot container (no per-item Python method call)
+
+cdef object _godot_variant_to_pyobj_bulk(const godot_variant *p_var, bint deep, bint gdstring_as_str):
+    cdef godot_variant_type gdtype = gdapi10.godot_variant_get_type(p_var)
+    cdef godot_string gdstr
+    cdef godot_array gdarr
+    cdef godot_dictionary gddict
+    cdef object ret
+    if gdstring_as_str and gdtype == godot_variant_type.GODOT_VARIANT_TYPE_STRING:
+        gdstr = gdapi10.godot_variant_as_string(p_var)
+        ret = godot_string_to_pyobj(&gdstr)
+        gdapi10.godot_string_destroy(&gdstr)
+        return ret
+    elif deep and gdtype == godot_variant_type.GODOT_VARIANT_TYPE_ARRAY:
+        gdarr = gdapi10.godot_variant_as_array(p_var)
+        try:
+            return _godot_array_to_list(&gdarr, deep, gdstring_as_str)
+        finally:
+            gdapi10.godot_array_destroy(&gdarr)
+    elif deep and gdtype == godot_variant_type.GODOT_VARIANT_TYPE_DICTIONARY:
+        gddict = gdapi10.godot_variant_as_dictionary(p_var)
+        try:
+            return _godot_dictionary_to_dict(&gddict, deep, gdstring_as_str)
+        finally:
+            gdapi10.godot_dictionary_destroy(&gddict)
+    else:
+        return godot_variant_to_pyobj(p_var)
+
+
+cdef list _godot_array_to_list(godot_array *p_arr, bint deep, bint gdstring_as_str):
+    cdef godot_int size = gdapi10.godot_array_size(p_arr)
+    cdef list ret = [None] * size
+    cdef godot_int i
+    for i in range(size):
+        ret[i] = _godot_variant_to_pyobj_bulk(
+            gdapi10.godot_array_operator_index(p_arr, i), deep, gdstring_as_str
+        )
+    return ret
+
+
+cdef dict _godot_dictionary_to_dict(godot_dictionary *p_dict, bint deep, bint gdstring_as_str):
+    cdef dict ret = {}
+    cdef godot_variant *p_key = NULL
+    cdef godot_variant *p_value
+    while True:
+        p_key = gdapi10.godot_dictionary_next(p_dict, p_key)
+        if p_key == NULL:
+            return ret
+        p_value = gdapi10.godot_dictionary_operator_index(p_dict, p_key)
+        # Keys must stay hashable, so nested containers are never converted
+        ret[_godot_variant_to_pyobj_bulk(p_key, False, gdstring_as_str)] = _godot_variant_to_pyobj_bulk(
+            p_value, deep, gdstring_as_str
+        )
+
+
+cdef int _pyobj_to_godot_variant_bulk(object pyobj, godot_variant *p_var) except -1:
+    cdef godot_array gdarr
+    cdef godot_dictionary gddict
+    if type(pyobj) is list or type(pyobj) is tuple:
+        gdapi10.godot_array_new(&gdarr)
+        try:
+            _godot_array_extend_from_sequence(&gdarr, pyobj)
+            gdapi10.godot_variant_new_array(p_var, &gdarr)
+        finally:
+            gdapi10.godot_array_destroy(&gdarr)
+    elif type(pyobj) is dict:
+        gdapi10.godot_dictionary_new(&gddict)
+        try:
+            _godot_dictionary_update_from_dict(&gddict, pyobj)
+            gdapi10.godot_variant_new_dictionary(p_var, &gddict)
+        finally:
+            gdapi10.godot_dictionary_destroy(&gddict)
+    else:
+        pyobj_to_godot_variant(pyobj, p_var)
+    return 0
+
+
+cdef int _godot_array_extend_from_sequence(godot_array *p_arr, object items) except -1:
+    cdef godot_int offset = gdapi10.godot_array_size(p_arr)
+    cdef godot_int i
+    cdef godot_variant *p_item
+    gdapi10.godot_array_resize(p_arr, offset + len(items))
+    for i, item in enumerate(items, offset):
+        p_item = gdapi10.godot_array_operator_index(p_arr, i)
+        # Item is a nil variant after resize
+        _pyobj_to_godot_variant_bulk(item, p_item)
+    return 0
+
+
+# Raw manipulations of the array's variants: Godot stores them contiguously
+# and a variant can be moved around with a plain memory copy. A nil variant
+# is all zeros, which is used to reset slots left behind by a memory move so
+# that Godot doesn't destroy them a second time on resize.
+
+
+cdef godot_variant *_godot_variants_from_iterable(object items, godot_int *p_count) except NULL:
+    # Return a buffer (to be freed with `PyMem_Free`) of new variants
+    cdef godot_int count
+    cdef godot_int converted = 0
+    cdef godot_int i
+    cdef godot_variant *variants
+    cdef godot_array *p_items
+    if isinstance(items, Array):
+        # Also covers the case where `items` is the array being modified
+        p_items = &(<Array>items)._gd_data
+        count = gdapi10.godot_array_size(p_items)
+        variants = <godot_variant*>PyMem_Malloc(count * sizeof(godot_variant))
+        if variants == NULL:
+            raise MemoryError()
+        for i in range(count):
+            gdapi10.godot_variant_new_copy(&variants[i], gdapi10.godot_array_operator_index(p_items, i))
+    else:
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        count = len(items)
+        variants = <godot_variant*>PyMem_Malloc(count * sizeof(godot_variant))
+        if variants == NULL:
+            raise MemoryError()
+        try:
+            for i in range(count):
+                pyobj_to_godot_variant(items[i], &variants[i])
+                converted += 1
+        except:
+            # Don't leak the variants converted so far
+            for i in range(converted):
+                gdapi10.godot_variant_destroy(&variants[i])
+            PyMem_Free(variants)
+            raise
+    p_count[0] = count
+    return variants
+
+
+cdef void _godot_array_replace_range(
+    godot_array *p_arr, godot_int start, godot_int stop, godot_variant *variants, godot_int count
+):
+    # Replace items [start, stop) by `variants`, which are moved into the array
+    cdef godot_int size = gdapi10.godot_array_size(p_arr)
+    cdef godot_int removed = stop - start
+    cdef godot_int tail = size - stop
+    cdef godot_variant *ptr = NULL
+    cdef godot_int i
+    if size:
+        # Retrieving a writable item also makes the array's data unique
+        # (copy-on-write) before it is modified in place
+        ptr = gdapi10.godot_array_operator_index(p_arr, 0)
+        for i in range(start, stop):
+            gdapi10.godot_variant_destroy(&ptr[i])
+    if count > removed:
+        gdapi10.godot_array_resize(p_arr, size + count - removed)
+        ptr = gdapi10.godot_array_operator_index(p_arr, 0)
+        memmove(&ptr[start + count], &ptr[stop], tail * sizeof(godot_variant))
+    elif count < removed:
+        memmove(&ptr[start + count], &ptr[stop], tail * sizeof(godot_variant))
+        memset(&ptr[size - removed + count], 0, (removed - count) * sizeof(godot_variant))
+        gdapi10.godot_array_resize(p_arr, size + count - removed)
+        if count:
+            ptr = gdapi10.godot_array_operator_index(p_arr, 0)
+    if count:
+        memcpy(&ptr[start], variants, count * sizeof(godot_variant))
+
+
+cdef void _godot_array_remove_every(godot_array *p_arr, godot_int start, godot_int step, godot_int count):
+    # Remove `count` items every `step` items from `start` (step > 0)
+    cdef godot_int size = gdapi10.godot_array_size(p_arr)
+    cdef godot_variant *ptr = gdapi10.godot_array_operator_index(p_arr, 0)
+    cdef godot_int removed = 0
+    cdef godot_int src
+    cdef godot_int dst = start
+    for src in range(start, size):
+        if removed < count and src == start + removed * step:
+            gdapi10.godot_variant_destroy(&ptr[src])
+            removed += 1
+        else:
+            memcpy(&ptr[dst], &ptr[src], sizeof(godot_variant))
+            dst += 1
+    memset(&ptr[dst], 0, (size - dst) * sizeof(godot_variant))
+    gdapi10.godot_array_resize(p_arr, dst)
+
+
+cdef int _godot_array_sort_by_key(godot_array *p_arr, object key, bint reverse) except -1:
+    # Decorate-sort-undecorate: `key` is called once per item, then the
+    # variants are moved (not copied) to their sorted position
+    cdef godot_int size = gdapi10.godot_array_size(p_arr)
+    cdef list keys = [None] * size
+    cdef godot_int i
+    for i in range(size):
+        keys[i] = key(godot_variant_to_pyobj(gdapi10.godot_array_operator_index(p_arr, i)))
+    # Python's sort is stable (even in reverse) and runs in C
+    cdef list order = sorted(range(size), key=keys.__getitem__, reverse=reverse)
+    if gdapi10.godot_array_size(p_arr) != size:
+        raise ValueError("Array modified during sort")
+    if size < 2:
+        return 0
+
+    cdef godot_variant *sorted_variants = <godot_variant*>PyMem_Malloc(size * sizeof(godot_variant))
+    if sorted_variants == NULL:
+        raise MemoryError()
+    cdef godot_variant *ptr = gdapi10.godot_array_operator_index(p_arr, 0)
+    for i in range(size):
+        memcpy(&sorted_variants[i], &ptr[<godot_int>order[i]], sizeof(godot_variant))
+    memcpy(ptr, sorted_variants, size * sizeof(godot_variant))
+    PyMem_Free(sorted_variants)
+    return 0
+
+
+cdef int _godot_dictionary_update_from_dict(godot_dictionary *p_dict, dict items) except -1:
+    cdef godot_variant var_key
+    cdef godot_variant var_value
+    for key, value in items.items():
+        _pyobj_to_godot_variant_bulk(key, &var_key)
+        try:
+            _pyobj_to_godot_variant_bulk(value, &var_value)
+        except:
+            gdapi10.godot_variant_destroy(&var_key)
+            raise
+        gdapi10.godot_dictionary_set(p_dict, &var_key, &var_value)
+        gdapi10.godot_variant_destroy(&var_key)
+        gdapi10.godot_variant_destroy(&var_value)
+    return 0
+
 {% endblock -%}
 
 {# TODO: conversion from pool arrays is not supported #}
@@ -26,6 +248,8 @@ cdef class Array:
     cdef inline Array from_ptr(const godot_array *_ptr)
 
     cdef inline Array operator_getslice(self, godot_int start, godot_int stop, godot_int step)
+    cdef inline operator_setslice(self, slice index, object value)
+    cdef inline operator_delslice(self, slice index)
     cdef inline bint operator_equal(self, Array other)
     cdef inline Array operator_add(self, Array items)
     cdef inline operator_iadd(self, Array items)
@@ -108,8 +332,11 @@ cdef class Array:
         cdef godot_variant *p_ret = gdapi10.godot_array_operator_index(&self._gd_data, index)
         return godot_variant_to_pyobj(p_ret)
 
-    # TODO: support slice
-    def __setitem__(self, godot_int index, object value):
+    def __setitem__(self, index, object value):
+        if isinstance(index, slice):
+            self.operator_setslice(index, value)
+            return
+
         cdef godot_int size = self.size()
         index = size + index if index < 0 else index
         if abs(index) >= size:
@@ -119,8 +346,39 @@ cdef class Array:
         gdapi10.godot_variant_destroy(p_ret)
         pyobj_to_godot_variant(value, p_ret)
 
-    # TODO: support slice
-    def __delitem__(self, godot_int index):
+    cdef inline operator_setslice(self, slice index, object value):
+        cdef Py_ssize_t start
+        cdef Py_ssize_t stop
+        cdef Py_ssize_t step
+        start, stop, step = index.indices(self.size())
+        cdef godot_int count
+        cdef godot_variant *variants = _godot_variants_from_iterable(value, &count)
+        cdef godot_int slice_size
+        cdef godot_variant *ptr
+        cdef godot_int i
+        try:
+            if step == 1:
+                _godot_array_replace_range(&self._gd_data, start, max(start, stop), variants, count)
+                return
+            slice_size = len(range(start, stop, step))
+            if count != slice_size:
+                for i in range(count):
+                    gdapi10.godot_variant_destroy(&variants[i])
+                raise ValueError(
+                    f"attempt to assign sequence of size {count} to extended slice of size {slice_size}"
+                )
+            for i in range(count):
+                ptr = gdapi10.godot_array_operator_index(&self._gd_data, start + i * step)
+                gdapi10.godot_variant_destroy(ptr)
+                memcpy(ptr, &variants[i], sizeof(godot_variant))
+        finally:
+            PyMem_Free(variants)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            self.operator_delslice(index)
+            return
+
         cdef godot_int size = self.size()
         index = size + index if index < 0 else index
         if abs(index) >= size:
@@ -128,12 +386,41 @@ cdef class Array:
 
         gdapi10.godot_array_remove(&self._gd_data, index)
 
+    cdef inline operator_delslice(self, slice index):
+        cdef object indices = range(*index.indices(self.size()))
+        if indices.step < 0:
+            indices = indices[::-1]
+        cdef godot_int count = len(indices)
+        if count == 0:
+            return
+        if indices.step == 1:
+            _godot_array_replace_range(&self._gd_data, indices.start, indices.start + count, NULL, 0)
+        else:
+            _godot_array_remove_every(&self._gd_data, indices.start, indices.step, count)
+
     def __iter__(self):
         # TODO: mid iteration mutation should throw exception ?
         cdef int i
         for i in range(self.size()):
             yield self.get(i)
 
+    def to_list(self, bint deep=False, bint gdstring_as_str=False):
+        """
+        Convert into a Python list, `deep` also converts the nested Array and
+        Dictionary, `gdstring_as_str` converts GDString items into str.
+        """
+        return _godot_array_to_list(&self._gd_data, deep, gdstring_as_str)
+
+    @staticmethod
+    def from_list(items not None):
+        """
+        Build an Array from a list or tuple, nested list, tuple and dict are
+        converted into Array and Dictionary.
+        """
+        cdef Array ret = Array.new()
+        _godot_array_extend_from_sequence(&ret._gd_data, items)
+        return ret
+
     def __copy__(self):
         return self.duplicate(False)
 
@@ -205,6 +492,15 @@ cdef class Array:
                 ret.append(x)
             return ret
 
+    def sort(Array self, key=None, bint reverse=False) -> None:
+        {{ force_mark_rendered("godot_array_sort") }}
+        if key is None:
+            gdapi10.godot_array_sort(&self._gd_data)
+            if reverse:
+                gdapi10.godot_array_invert(&self._gd_data)
+        else:
+            _godot_array_sort_by_key(&self._gd_data, key, reverse)
+
     {{ render_method("size", py_name="__len__") | indent }}
     {{ render_method("hash", py_name="__hash__") | indent }}
     {{ render_method("has", py_name="__contains__") | indent }}
@@ -232,7 +528,6 @@ cdef class Array:
     {{ render_method("remove") | indent }}
     {{ render_method("resize") | indent }}
     {{ render_method("rfind") | indent }}
-    {{ render_method("sort") | indent }}
     {#- TODO: opaque object as param is not supported #}
     {{- force_mark_rendered("godot_array_sort_custom") }}
     {#- {{ render_method("sort_custom") | indent }} #}
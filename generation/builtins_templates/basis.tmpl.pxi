@@ -14,6 +14,58 @@ cdef inline Basis Basis_multiply_scalar(Basis self, godot_real b):
     ret._gd_data = gdapi10.godot_basis_operator_multiply_scalar(&self._gd_data, b)
     return ret
 
+cdef PoolVector3Array _xform_vector3_array(
+    const godot_real *basis,
+    const godot_real *origin,
+    bint inverse,
+    PoolVector3Array points,
+    PoolVector3Array out,
+):
+    # `basis` is 3 rows of 3 components, `origin` can be NULL.
+    # Inverse transformation uses the transposed basis (same as Godot, this
+    # is only correct for orthonormal basis).
+    cdef godot_int size = points.size()
+    if out is None:
+        out = PoolVector3Array.new()
+    out.resize(size)
+    # Write access first, it may trigger a copy-on-write (not allowed
+    # on a locked pool array) if `out` shares its data with `points`
+    cdef godot_pool_vector3_array_write_access *dst_access = gdapi10.godot_pool_vector3_array_write(&out._gd_data)
+    cdef godot_pool_vector3_array_read_access *src_access = gdapi10.godot_pool_vector3_array_read(&points._gd_data)
+    cdef godot_real *dst = <godot_real*>gdapi10.godot_pool_vector3_array_write_access_ptr(dst_access)
+    cdef const godot_real *src = <const godot_real*>gdapi10.godot_pool_vector3_array_read_access_ptr(src_access)
+    cdef godot_real ox = 0
+    cdef godot_real oy = 0
+    cdef godot_real oz = 0
+    if origin != NULL:
+        ox = origin[0]
+        oy = origin[1]
+        oz = origin[2]
+    cdef godot_real x
+    cdef godot_real y
+    cdef godot_real z
+    cdef godot_int i
+    with nogil:
+        if inverse:
+            for i in range(size):
+                x = src[3 * i] - ox
+                y = src[3 * i + 1] - oy
+                z = src[3 * i + 2] - oz
+                dst[3 * i] = basis[0] * x + basis[3] * y + basis[6] * z
+                dst[3 * i + 1] = basis[1] * x + basis[4] * y + basis[7] * z
+                dst[3 * i + 2] = basis[2] * x + basis[5] * y + basis[8] * z
+        else:
+            for i in range(size):
+                x = src[3 * i]
+                y = src[3 * i + 1]
+                z = src[3 * i + 2]
+                dst[3 * i] = basis[0] * x + basis[1] * y + basis[2] * z + ox
+                dst[3 * i + 1] = basis[3] * x + basis[4] * y + basis[5] * z + oy
+                dst[3 * i + 2] = basis[6] * x + basis[7] * y + basis[8] * z + oz
+    gdapi10.godot_pool_vector3_array_read_access_destroy(src_access)
+    gdapi10.godot_pool_vector3_array_write_access_destroy(dst_access)
+    return out
+
 {%- endblock %}
 
 @cython.final
@@ -127,6 +179,21 @@ cdef class Basis:
     {{ render_method("tdotz") | indent }}
     {{ render_method("xform") | indent }}
     {{ render_method("xform_inv") | indent }}
+
+    def xform_array(Basis self, PoolVector3Array points not None, PoolVector3Array out=None):
+        """
+        Transform all the points at once, result is stored in `out` (resized
+        if needed) if provided, or in a new PoolVector3Array.
+        """
+        return _xform_vector3_array(<const godot_real*>&self._gd_data, NULL, False, points, out)
+
+    def xform_inv_array(Basis self, PoolVector3Array points not None, PoolVector3Array out=None):
+        """
+        Inverse transform all the points at once, result is stored in `out`
+        (resized if needed) if provided, or in a new PoolVector3Array.
+        """
+        return _xform_vector3_array(<const godot_real*>&self._gd_data, NULL, True, points, out)
+
     {{ render_method("get_orthogonal_index") | indent }}
     {{ render_method("get_elements") | indent }}
     {{ render_method("get_row") | indent }}
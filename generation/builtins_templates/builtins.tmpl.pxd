@@ -28,6 +28,8 @@ from godot.pool_arrays cimport (
 {% include 'render.tmpl.pxd' with context  %}
 {% set render_target = "gdstring" %}
 {% include 'render.tmpl.pxd' with context  %}
+{% set render_target = "string_name" %}
+{% include 'render.tmpl.pxd' with context  %}
 {% set render_target = "rect2" %}
 {% include 'render.tmpl.pxd' with context  %}
 {% set render_target = "transform2d" %}
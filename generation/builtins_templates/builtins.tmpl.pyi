@@ -17,6 +17,8 @@ from typing import Union
 {% include 'render.tmpl.pyi' with context  %}
 {% set render_target = "gdstring" %}
 {% include 'render.tmpl.pyi' with context  %}
+{% set render_target = "string_name" %}
+{% include 'render.tmpl.pyi' with context  %}
 {% set render_target = "rect2" %}
 {% include 'render.tmpl.pyi' with context  %}
 {% set render_target = "transform2d" %}
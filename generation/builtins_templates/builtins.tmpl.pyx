@@ -4,6 +4,9 @@
 from typing import Union
 
 cimport cython
+from libc.math cimport acos, sin
+from libc.string cimport memcpy, memmove, memset
+from cpython.mem cimport PyMem_Malloc
 
 from godot._hazmat.gdnative_api_struct cimport *
 from godot._hazmat.gdapi cimport (
@@ -36,6 +39,8 @@ from godot.pool_arrays cimport (
 {% include 'render.tmpl.pyx' with context  %}
 {% set render_target = "gdstring" %}
 {% include 'render.tmpl.pyx' with context  %}
+{% set render_target = "string_name" %}
+{% include 'render.tmpl.pyx' with context  %}
 {% set render_target = "rect2" %}
 {% include 'render.tmpl.pyx' with context  %}
 {% set render_target = "transform2d" %}
@@ -109,6 +109,24 @@ cdef class Dictionary:
                 return
             yield godot_variant_to_pyobj(p_key)
 
+    def to_dict(self, bint deep=False, bint gdstring_as_str=False):
+        """
+        Convert into a Python dict, `deep` also converts the nested Array and
+        Dictionary values, `gdstring_as_str` converts GDString keys and values
+        into str.
+        """
+        return _godot_dictionary_to_dict(&self._gd_data, deep, gdstring_as_str)
+
+    @staticmethod
+    def from_dict(dict items not None):
+        """
+        Build a Dictionary from a dict, nested list, tuple and dict are
+        converted into Array and Dictionary.
+        """
+        cdef Dictionary ret = Dictionary.new()
+        _godot_dictionary_update_from_dict(&ret._gd_data, items)
+        return ret
+
     def __copy__(self):
         return self.duplicate(False)
 
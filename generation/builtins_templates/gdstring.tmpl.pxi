@@ -47,14 +47,6 @@ from libc.stdint cimport int8_t
 {{ force_mark_rendered("godot_string_lpad") }}
 {{ force_mark_rendered("godot_string_lpad_with_custom_character") }}
 {{ force_mark_rendered("godot_string_md5") }}
-{{ force_mark_rendered("godot_string_name_destroy") }}
-{{ force_mark_rendered("godot_string_name_get_data_unique_pointer") }}
-{{ force_mark_rendered("godot_string_name_get_hash") }}
-{{ force_mark_rendered("godot_string_name_get_name") }}
-{{ force_mark_rendered("godot_string_name_new") }}
-{{ force_mark_rendered("godot_string_name_new_data") }}
-{{ force_mark_rendered("godot_string_name_operator_equal") }}
-{{ force_mark_rendered("godot_string_name_operator_less") }}
 {{ force_mark_rendered("godot_string_naturalnocasecmp_to") }}
 {{ force_mark_rendered("godot_string_num") }}
 {{ force_mark_rendered("godot_string_num_int64") }}
@@ -1,6 +1,41 @@
 {%- block pxd_header %}
 {% endblock -%}
 {%- block pyx_header %}
+
+# Same as Godot's CMP_EPSILON
+DEF _QUAT_SLERP_EPSILON = 0.00001
+
+
+@cython.cdivision(True)
+cdef inline void _quat_slerp(const godot_real *q1, const godot_real *q2, godot_real weight, godot_real *dst) nogil:
+    # Mirror Godot's `Quat::slerp`
+    cdef godot_real to[4]
+    cdef godot_real cosom = q1[0] * q2[0] + q1[1] * q2[1] + q1[2] * q2[2] + q1[3] * q2[3]
+    cdef int i
+    if cosom < 0:
+        cosom = -cosom
+        for i in range(4):
+            to[i] = -q2[i]
+    else:
+        for i in range(4):
+            to[i] = q2[i]
+    cdef godot_real omega
+    cdef godot_real sinom
+    cdef godot_real scale0
+    cdef godot_real scale1
+    if 1 - cosom > _QUAT_SLERP_EPSILON:
+        # Standard case (slerp)
+        omega = acos(cosom)
+        sinom = sin(omega)
+        scale0 = sin((1 - weight) * omega) / sinom
+        scale1 = sin(weight * omega) / sinom
+    else:
+        # Quaternions are very close, fall back on linear interpolation
+        scale0 = 1 - weight
+        scale1 = weight
+    for i in range(4):
+        dst[i] = scale0 * q1[i] + scale1 * to[i]
+
 {% endblock -%}
 
 
@@ -76,6 +111,63 @@ cdef class Quat:
     {{ render_method("dot") | indent }}
     {{ render_method("xform") | indent }}
     {{ render_method("slerp") | indent }}
+
+    def xform_array(Quat self, PoolVector3Array points not None, PoolVector3Array out=None):
+        """
+        Rotate all the points at once, result is stored in `out` (resized if
+        needed) if provided, or in a new PoolVector3Array.
+        """
+        cdef godot_int size = points.size()
+        if out is None:
+            out = PoolVector3Array.new()
+        out.resize(size)
+        # Write access first, it may trigger a copy-on-write (not allowed
+        # on a locked pool array) if `out` shares its data with `points`
+        cdef godot_pool_vector3_array_write_access *dst_access = gdapi10.godot_pool_vector3_array_write(&out._gd_data)
+        cdef godot_pool_vector3_array_read_access *src_access = gdapi10.godot_pool_vector3_array_read(&points._gd_data)
+        cdef godot_real *dst = <godot_real*>gdapi10.godot_pool_vector3_array_write_access_ptr(dst_access)
+        cdef const godot_real *src = <const godot_real*>gdapi10.godot_pool_vector3_array_read_access_ptr(src_access)
+        cdef const godot_real *q = <const godot_real*>&self._gd_data
+        # Same as Godot's `q * v * q.inverse()`, with q = (u, w):
+        # v' = (w² - u.u) v + 2 (u.v) u + 2 w (u x v)
+        cdef godot_real k = q[3] * q[3] - (q[0] * q[0] + q[1] * q[1] + q[2] * q[2])
+        cdef godot_real x
+        cdef godot_real y
+        cdef godot_real z
+        cdef godot_real d
+        cdef godot_int i
+        with nogil:
+            for i in range(size):
+                x = src[3 * i]
+                y = src[3 * i + 1]
+                z = src[3 * i + 2]
+                d = 2 * (q[0] * x + q[1] * y + q[2] * z)
+                dst[3 * i] = k * x + d * q[0] + 2 * q[3] * (q[1] * z - q[2] * y)
+                dst[3 * i + 1] = k * y + d * q[1] + 2 * q[3] * (q[2] * x - q[0] * z)
+                dst[3 * i + 2] = k * z + d * q[2] + 2 * q[3] * (q[0] * y - q[1] * x)
+        gdapi10.godot_pool_vector3_array_read_access_destroy(src_access)
+        gdapi10.godot_pool_vector3_array_write_access_destroy(dst_access)
+        return out
+
+    def slerp_array(Quat self, Quat to not None, PoolRealArray weights not None):
+        """
+        Return the list of the spherical interpolations toward `to` for each
+        of the `weights`.
+        """
+        cdef godot_int size = weights.size()
+        cdef list ret = [None] * size
+        cdef godot_pool_real_array_read_access *access = gdapi10.godot_pool_real_array_read(&weights._gd_data)
+        cdef const godot_real *weights_ptr = gdapi10.godot_pool_real_array_read_access_ptr(access)
+        cdef const godot_real *q1 = <const godot_real*>&self._gd_data
+        cdef const godot_real *q2 = <const godot_real*>&to._gd_data
+        cdef Quat item
+        cdef godot_int i
+        for i in range(size):
+            item = Quat.__new__(Quat)
+            _quat_slerp(q1, q2, weights_ptr[i], <godot_real*>&item._gd_data)
+            ret[i] = item
+        gdapi10.godot_pool_real_array_read_access_destroy(access)
+        return ret
     {{ render_method("slerpni") | indent }}
     {{ render_method("cubic_slerp") | indent }}
     {{ render_method("set_axis_angle") | indent }}
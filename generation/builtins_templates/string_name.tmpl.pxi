@@ -0,0 +1,51 @@
+{%- block pxd_header %}
+{% endblock -%}
+{%- block pyx_header %}
+{% endblock -%}
+
+{# Godot's StringName are created from a godot_string #}
+{{ force_mark_rendered("godot_string_name_new_data") }}
+{{ force_mark_rendered("godot_string_name_get_data_unique_pointer") }}
+
+@cython.final
+cdef class StringName:
+{% block cdef_attributes %}
+    cdef godot_string_name _gd_data
+{% endblock %}
+
+{% block python_defs %}
+    def __init__(self, from_):
+        {{ force_mark_rendered("godot_string_name_new") }}
+        cdef godot_string gd_from
+        if isinstance(from_, GDString):
+            gdapi10.godot_string_name_new(&self._gd_data, &(<GDString>from_)._gd_data)
+        elif isinstance(from_, str):
+            pyobj_to_godot_string(from_, &gd_from)
+            gdapi10.godot_string_name_new(&self._gd_data, &gd_from)
+            gdapi10.godot_string_destroy(&gd_from)
+        else:
+            raise TypeError("`from_` must be str or GDString")
+
+    def __dealloc__(StringName self):
+        {{ force_mark_rendered("godot_string_name_destroy") }}
+        gdapi10.godot_string_name_destroy(&self._gd_data)
+
+    def __repr__(StringName self):
+        return f"<StringName({self.get_name()})>"
+
+    def __str__(StringName self):
+        return str(self.get_name())
+
+    def __hash__(StringName self):
+        return self.get_hash()
+
+    {{ render_operator_eq() | indent }}
+    {{ render_operator_ne() | indent }}
+    {{ render_operator_lt() | indent }}
+
+    {{ render_method("get_name") | indent }}
+    {{ render_method("get_hash") | indent }}
+{% endblock %}
+
+{%- block python_consts %}
+{% endblock %}
@@ -64,6 +64,23 @@ cdef class Transform:
     {{ render_method("xform_inv_vector3") | indent }}
     {{ render_method("xform_aabb") | indent }}
     {{ render_method("xform_inv_aabb") | indent }}
+
+    def xform_array(Transform self, PoolVector3Array points not None, PoolVector3Array out=None):
+        """
+        Transform all the points at once, result is stored in `out` (resized
+        if needed) if provided, or in a new PoolVector3Array.
+        """
+        # Transform is a basis (3x3 components) followed by the origin
+        cdef const godot_real *data = <const godot_real*>&self._gd_data
+        return _xform_vector3_array(data, data + 9, False, points, out)
+
+    def xform_inv_array(Transform self, PoolVector3Array points not None, PoolVector3Array out=None):
+        """
+        Inverse transform all the points at once, result is stored in `out`
+        (resized if needed) if provided, or in a new PoolVector3Array.
+        """
+        cdef const godot_real *data = <const godot_real*>&self._gd_data
+        return _xform_vector3_array(data, data + 9, True, points, out)
 {% endblock %}
 
 {%- block python_consts %}
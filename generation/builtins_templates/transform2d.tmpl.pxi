@@ -1,6 +1,46 @@
 {%- block pxd_header %}
 {% endblock -%}
 {%- block pyx_header %}
+
+cdef PoolVector2Array _xform_vector2_array(
+    const godot_real *transform,
+    bint inverse,
+    PoolVector2Array points,
+    PoolVector2Array out,
+):
+    # `transform` is x axis, y axis and origin (2 components each).
+    # Inverse transformation uses the transposed basis (same as Godot, this
+    # is only correct for orthonormal basis).
+    cdef godot_int size = points.size()
+    if out is None:
+        out = PoolVector2Array.new()
+    out.resize(size)
+    # Write access first, it may trigger a copy-on-write (not allowed
+    # on a locked pool array) if `out` shares its data with `points`
+    cdef godot_pool_vector2_array_write_access *dst_access = gdapi10.godot_pool_vector2_array_write(&out._gd_data)
+    cdef godot_pool_vector2_array_read_access *src_access = gdapi10.godot_pool_vector2_array_read(&points._gd_data)
+    cdef godot_real *dst = <godot_real*>gdapi10.godot_pool_vector2_array_write_access_ptr(dst_access)
+    cdef const godot_real *src = <const godot_real*>gdapi10.godot_pool_vector2_array_read_access_ptr(src_access)
+    cdef godot_real x
+    cdef godot_real y
+    cdef godot_int i
+    with nogil:
+        if inverse:
+            for i in range(size):
+                x = src[2 * i] - transform[4]
+                y = src[2 * i + 1] - transform[5]
+                dst[2 * i] = transform[0] * x + transform[1] * y
+                dst[2 * i + 1] = transform[2] * x + transform[3] * y
+        else:
+            for i in range(size):
+                x = src[2 * i]
+                y = src[2 * i + 1]
+                dst[2 * i] = transform[0] * x + transform[2] * y + transform[4]
+                dst[2 * i + 1] = transform[1] * x + transform[3] * y + transform[5]
+    gdapi10.godot_pool_vector2_array_read_access_destroy(src_access)
+    gdapi10.godot_pool_vector2_array_write_access_destroy(dst_access)
+    return out
+
 {% endblock -%}
 
 
@@ -88,6 +128,20 @@ cdef class Transform2D:
         except TypeError:
             raise TypeError("`v` must be Vector2 or Rect2")
 
+    def xform_array(Transform2D self, PoolVector2Array points not None, PoolVector2Array out=None):
+        """
+        Transform all the points at once, result is stored in `out` (resized
+        if needed) if provided, or in a new PoolVector2Array.
+        """
+        return _xform_vector2_array(<const godot_real*>&self._gd_data, False, points, out)
+
+    def xform_inv_array(Transform2D self, PoolVector2Array points not None, PoolVector2Array out=None):
+        """
+        Inverse transform all the points at once, result is stored in `out`
+        (resized if needed) if provided, or in a new PoolVector2Array.
+        """
+        return _xform_vector2_array(<const godot_real*>&self._gd_data, True, points, out)
+
     {{ render_method("basis_xform_vector2", py_name="basis_xform") | indent }}
     {{ render_method("basis_xform_inv_vector2", py_name="basis_xform_inv") | indent }}
     {{ render_method("interpolate_with") | indent }}
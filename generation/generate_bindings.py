@@ -102,6 +102,19 @@ class ClassInfo:
     methods: List[MethodInfo]
     enums: List[EnumInfo]
 
+    @property
+    def bound_methods(self) -> List[MethodInfo]:
+        # Methods called through a method bind (virtual methods are called
+        # by name, unsupported ones are never called)
+        return [meth for meth in self.methods if meth.is_supported and not meth.is_virtual]
+
+    def get_method_bind_index(self, method_name: str) -> int:
+        # Index of the method bind in the class's method binds array
+        return [meth.name for meth in self.bound_methods].index(method_name)
+
+    def get_bound_method(self, method_name: str) -> Optional[MethodInfo]:
+        return next((meth for meth in self.bound_methods if meth.name == method_name), None)
+
 
 TYPES = {t.gdapi_type: t for t in ALL_TYPES_EXCEPT_OBJECTS}
 
@@ -270,8 +283,6 @@ def strip_unsupported_stuff(classes):
                 unsupported_reason = "attribute `is_editor=True` not supported"
             if meth.is_reverse:
                 unsupported_reason = "attribute `is_reverse=True` not supported"
-            if meth.has_varargs:
-                unsupported_reason = "attribute `has_varargs=True` not supported"
             if not _is_supported_type(meth.return_type):
                 unsupported_reason = f"return type {meth.return_type} not supported"
             bad_arg = next(
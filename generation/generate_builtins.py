@@ -36,6 +36,13 @@ from type_specs import (
 
 
 # Bonus types
+TYPE_STRING_NAME = TypeSpec(
+    gdapi_type="StringName",
+    c_type="godot_string_name",
+    cy_type="StringName",
+    py_type="StringName",
+    is_builtin=True,
+)
 TYPES_SIZED_INT = [
     TypeSpec(
         gdapi_type=f"{signed}int{size}_t",
@@ -99,6 +106,7 @@ ALL_TYPES = [
         is_base_type=True,
         is_stack_only=True,
     ),
+    TYPE_STRING_NAME,
     TypeSpec(
         gdapi_type="godot_char_string",
         c_type="godot_char_string",
@@ -106,13 +114,6 @@ ALL_TYPES = [
         py_type="str",
         is_builtin=True,
     ),
-    TypeSpec(
-        gdapi_type="godot_string_name",
-        c_type="godot_string_name",
-        cy_type="godot_string_name",
-        py_type="str",
-        is_builtin=True,
-    ),
     TypeSpec(
         gdapi_type="bool",
         c_type="bool",
@@ -134,6 +135,7 @@ TARGET_TO_TYPE_SPEC = {
     "basis": TYPE_BASIS,
     "color": TYPE_COLOR,
     "gdstring": TYPE_STRING,
+    "string_name": TYPE_STRING_NAME,
     "rect2": TYPE_RECT2,
     "transform2d": TYPE_TRANSFORM2D,
     "plane": TYPE_PLANE,
@@ -187,7 +189,8 @@ env.filters["merge"] = lambda x, **kwargs: {**x, **kwargs}
 def load_builtin_method_spec(func: dict, gdapi: str) -> BuiltinMethodSpec:
     c_name = func["name"]
     assert c_name.startswith("godot_"), func
-    for builtin_type in BUILTINS_TYPES:
+    # Longest prefix first (e.g. `godot_string_name_` before `godot_string_`)
+    for builtin_type in sorted(BUILTINS_TYPES, key=lambda t: len(t.c_type), reverse=True):
         prefix = f"{builtin_type.c_type}_"
         if c_name.startswith(prefix):
             py_name = c_name[len(prefix) :]
@@ -20,6 +20,16 @@ class TypeItem:
         self.__dict__.update(**kwargs)
 
 
+# `buffer_format` is the struct format of a single component exposed through
+# the buffer protocol (`None` if the pool array cannot be exposed as a buffer),
+# `buffer_accepted_formats` the formats (of the same size) that can be copied
+# into the pool array,
+# `buffer_item_type` is the C type of this component and `buffer_components`
+# the number of components per item (`None` for scalar items).
+# `math_components` is the number of float components per item for the pool
+# arrays providing element-wise math (`None` if not supported).
+# `is_sortable` is set for the pool arrays whose items are ordered (so they
+# provide sort and search methods).
 TYPES = [
     # Base types
     TypeItem(
@@ -29,6 +39,12 @@ TYPES = [
         py_value=f"godot_int",
         is_base_type=True,
         is_stack_only=True,
+        buffer_format="i",
+        buffer_accepted_formats=("i", "l"),
+        buffer_item_type="godot_int",
+        buffer_components=None,
+        math_components=None,
+        is_sortable=True,
     ),
     TypeItem(
         gd_pool=f"godot_pool_real_array",
@@ -37,6 +53,12 @@ TYPES = [
         py_value=f"godot_real",
         is_base_type=True,
         is_stack_only=True,
+        buffer_format="f",
+        buffer_accepted_formats=("f",),
+        buffer_item_type="godot_real",
+        buffer_components=None,
+        math_components=1,
+        is_sortable=True,
     ),
     TypeItem(
         gd_pool="godot_pool_byte_array",
@@ -45,6 +67,12 @@ TYPES = [
         py_value="uint8_t",
         is_base_type=True,
         is_stack_only=True,
+        buffer_format="B",
+        buffer_accepted_formats=("B", "b", "c"),
+        buffer_item_type="uint8_t",
+        buffer_components=None,
+        math_components=None,
+        is_sortable=False,
     ),
     # Stack only builtin types
     TypeItem(
@@ -54,6 +82,12 @@ TYPES = [
         py_value=f"Vector2",
         is_base_type=False,
         is_stack_only=True,
+        buffer_format="f",
+        buffer_accepted_formats=("f",),
+        buffer_item_type="godot_real",
+        buffer_components=2,
+        math_components=2,
+        is_sortable=False,
     ),
     TypeItem(
         gd_pool=f"godot_pool_vector3_array",
@@ -62,6 +96,12 @@ TYPES = [
         py_value=f"Vector3",
         is_base_type=False,
         is_stack_only=True,
+        buffer_format="f",
+        buffer_accepted_formats=("f",),
+        buffer_item_type="godot_real",
+        buffer_components=3,
+        math_components=3,
+        is_sortable=False,
     ),
     TypeItem(
         gd_pool=f"godot_pool_color_array",
@@ -70,6 +110,12 @@ TYPES = [
         py_value=f"Color",
         is_base_type=False,
         is_stack_only=True,
+        buffer_format="f",
+        buffer_accepted_formats=("f",),
+        buffer_item_type="float",
+        buffer_components=4,
+        math_components=4,
+        is_sortable=False,
     ),
     # Stack&heap builtin types
     TypeItem(
@@ -79,6 +125,12 @@ TYPES = [
         py_value="GDString",
         is_base_type=False,
         is_stack_only=False,
+        buffer_format=None,
+        buffer_accepted_formats=None,
+        buffer_item_type=None,
+        buffer_components=None,
+        math_components=None,
+        is_sortable=True,
     ),
 ]
 
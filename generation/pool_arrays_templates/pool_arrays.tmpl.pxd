@@ -26,6 +26,9 @@ from godot.builtins cimport (
 )
 
 
+{% from 'pool_x_array_math.tmpl.pxd' import render_pool_array_math_pxd_header %}
+{{ render_pool_array_math_pxd_header() }}
+
 {% from 'pool_x_array.tmpl.pxd' import render_pool_array_pxd %}
 {% for t in types %}
 {{ render_pool_array_pxd(t) }}
@@ -3,6 +3,21 @@
 
 cimport cython
 from libc.stdint cimport uintptr_t
+from libc.stdlib cimport qsort
+from libc.string cimport memcpy, memmove, memset
+from libc.math cimport sqrt
+from cpython.buffer cimport (
+    PyObject_CheckBuffer,
+    PyObject_GetBuffer,
+    PyBuffer_Release,
+    PyBuffer_IsContiguous,
+    PyBUF_WRITABLE,
+    PyBUF_FORMAT,
+    PyBUF_ND,
+    PyBUF_STRIDES,
+    PyBUF_F_CONTIGUOUS,
+)
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 
 from godot._hazmat.gdapi cimport (
     pythonscript_gdapi10 as gdapi10,
@@ -19,6 +34,8 @@ from godot._hazmat.gdnative_api_struct cimport (
 )
 from godot.builtins cimport (
 	Array,
+	Rect2,
+	AABB,
 {% for t in types %}
 {% if not t.is_base_type %}
 	{{ t.py_value }},
@@ -26,9 +43,86 @@ from godot.builtins cimport (
 {% endfor %}
 )
 
+import sys
 from contextlib import contextmanager
 
 
+# Byte order prefixes meaning the native layout in a buffer format string
+cdef str _NATIVE_BYTE_ORDERS = "@=" + ("<" if sys.byteorder == "little" else ">")
+
+
+# Number of items retrieved at once when iterating over a pool array
+DEF _ITER_CHUNK_SIZE = 64
+
+
+cdef int _fill_pool_array_buffer(
+    Py_buffer *buffer,
+    object obj,
+    int flags,
+    void *buf,
+    bint readonly,
+    godot_int size,
+    Py_ssize_t item_size,
+    const char *component_format,
+    Py_ssize_t component_size,
+    int components,
+) except -1:
+    # Items are made of `components` components (0 for scalar items)
+    cdef int ndim = 2 if components else 1
+    if ndim > 1 and (flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS:
+        raise BufferError(f"{type(obj).__name__} buffer is not Fortran contiguous")
+    cdef Py_ssize_t *shape_and_strides = NULL
+    if flags & PyBUF_ND:
+        shape_and_strides = <Py_ssize_t*>PyMem_Malloc(2 * ndim * sizeof(Py_ssize_t))
+        if shape_and_strides == NULL:
+            raise MemoryError()
+        shape_and_strides[0] = size
+        if components:
+            shape_and_strides[1] = components
+            shape_and_strides[2] = item_size
+            shape_and_strides[3] = component_size
+        else:
+            shape_and_strides[1] = component_size
+
+    buffer.buf = buf
+    buffer.obj = obj
+    buffer.readonly = readonly
+    buffer.len = size * item_size
+    buffer.itemsize = component_size
+    if flags & PyBUF_FORMAT:
+        buffer.format = <char*>component_format
+    else:
+        buffer.format = NULL
+    buffer.suboffsets = NULL
+    buffer.shape = shape_and_strides
+    if shape_and_strides == NULL:
+        # Consumer only wants a plain contiguous chunk of bytes
+        buffer.ndim = 1
+        buffer.strides = NULL
+    else:
+        buffer.ndim = ndim
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = shape_and_strides + ndim
+        else:
+            buffer.strides = NULL
+    return 0
+
+
+cdef str _buffer_item_format(const Py_buffer *view):
+    if view.format == NULL:
+        return "B"
+    cdef str format = (<bytes>view.format).decode("ascii")
+    if format and format[0] in _NATIVE_BYTE_ORDERS:
+        format = format[1:]
+    return format
+
+
+{% from 'pool_x_array_math.tmpl.pyx' import render_pool_array_math_helpers %}
+{{ render_pool_array_math_helpers() }}
+
+{% from 'pool_x_array_sort.tmpl.pyx' import render_pool_array_sort_helpers %}
+{{ render_pool_array_sort_helpers(types) }}
+
 {% from 'pool_x_array.tmpl.pyx' import render_pool_array_pyx %}
 {% for t in types %}
 {{ render_pool_array_pyx(t) }}
@@ -1,3 +1,4 @@
+{% from 'pool_x_array_math.tmpl.pxd' import render_pool_array_math_pxd %}
 {% macro render_pool_array_pxd(t) %}
 @cython.final
 cdef class {{ t.py_pool }}:
@@ -11,9 +12,17 @@ cdef class {{ t.py_pool }}:
 
     # Operators
 
+{% if t.buffer_format %}
+    cdef inline int operator_set_from_buffer(self, object obj, bint strict) except -1
+{% endif %}
     cdef inline bint operator_equal(self, {{ t.py_pool }} other)
     cdef inline {{ t.py_value }} operator_getitem(self, godot_int index)
     cdef inline {{ t.py_pool }} operator_getslice(self, godot_int start, godot_int end, godot_int step)
+    cdef inline void operator_setitem(self, godot_int index, {{ t.py_value }} value) except *
+    cdef inline void operator_setslice(self, slice index, object value) except *
+    cdef inline void operator_replace_range(self, godot_int start, godot_int stop, {{ t.py_pool }} values)
+    cdef inline void operator_delitem(self, godot_int index) except *
+    cdef inline void operator_delslice(self, slice index) except *
 
     # Methods
 
@@ -24,6 +33,22 @@ cdef class {{ t.py_pool }}:
     cpdef inline void push_back(self, {{ t.py_value }} data)
     cpdef inline void resize(self, godot_int size)
     cdef inline godot_int size(self)
+{% if t.math_components %}
+
+{{ render_pool_array_math_pxd(t) }}
+{% endif %}
+
+
+@cython.final
+cdef class {{ t.py_pool }}ReadAccess:
+    # Keep the array alive as long as the access
+    cdef {{ t.py_pool }} _array
+    cdef {{ t.gd_pool }}_read_access *_gd_access
+    cdef const {{ t.gd_value }} *_gd_ptr
+    cdef godot_int _size
+    cdef int _exports
+
+    cdef inline void check_released(self) except *
 
 
 @cython.final
@@ -1,3 +1,5 @@
+{% from 'pool_x_array_math.tmpl.pyx' import render_pool_array_math_pyx %}
+{% from 'pool_x_array_sort.tmpl.pyx' import render_pool_array_sort_pyx %}
 {% macro gd_to_py(type, src, dst) %}
 {% if type['gd_value'] == type['py_value'] %}
 {{ dst }} = {{ src }}
@@ -10,6 +12,35 @@ gdapi10.godot_string_destroy(&src)
 {% macro py_to_gd(target) %}
 {% endmacro %}
 
+{% macro render_item_to_pyobj(t, src, dst) %}
+{# `src` is the Godot item, `dst` a `{{ t.py_value }}` (untyped for base types) #}
+{% if t.is_base_type %}
+{{ dst }} = {{ src }}
+{% else %}
+{{ dst }} = {{ t.py_value }}.__new__({{ t.py_value }})
+{% if t.is_stack_only %}
+{{ dst }}._gd_data = {{ src }}
+{% else %}
+gdapi10.{{ t.gd_value }}_new_copy(&{{ dst }}._gd_data, &{{ src }})
+{% endif %}
+{% endif %}
+{% endmacro %}
+
+{% macro render_fill_buffer(t, ptr, size, readonly) %}
+_fill_pool_array_buffer(
+    buffer,
+    self,
+    flags,
+    <void*>{{ ptr }},
+    {{ "True" if readonly else "False" }},
+    {{ size }},
+    sizeof({{ t.gd_value }}),
+    b"{{ t.buffer_format }}",
+    sizeof({{ t.buffer_item_type }}),
+    {{ t.buffer_components or 0 }},
+)
+{%- endmacro %}
+
 {% macro render_pool_array_pyx(t) %}
 @cython.final
 cdef class {{ t.py_pool }}:
@@ -29,6 +60,10 @@ cdef class {{ t.py_pool }}:
                     gdapi10.{{ t.gd_pool }}_new_with_array(&self._gd_data, &other_as_array._gd_data)
                 except TypeError:
                     gdapi10.{{ t.gd_pool }}_new(&self._gd_data)
+{% if t.buffer_format %}
+                    if {{ t.py_pool }}.operator_set_from_buffer(self, other, False):
+                        return
+{% endif %}
                     for item in other:
 {% if t.is_base_type %}
                         {{ t.py_pool }}.append(self, item)
@@ -55,8 +90,78 @@ cdef class {{ t.py_pool }}:
         gdapi10.{{ t.gd_pool }}_new_with_array(&ret._gd_data, &other._gd_data)
         return ret
 
+{% if t.buffer_format %}
+    @staticmethod
+    def from_buffer(object buffer):
+        """
+        Build the pool array from a copy of any object exporting the buffer
+        protocol (bytes, array.array, numpy array, memoryview etc.) with a
+        `{{ t.buffer_format }}` item format.
+        """
+        cdef {{ t.py_pool }} ret = {{ t.py_pool }}.new()
+        {{ t.py_pool }}.operator_set_from_buffer(ret, buffer, True)
+        return ret
+
+    cdef inline int operator_set_from_buffer(self, object obj, bint strict) except -1:
+        # Return 0 without touching the array if `obj` is not a compatible
+        # buffer (raise an exception instead if `strict`)
+        if not PyObject_CheckBuffer(obj):
+            if strict:
+                raise TypeError(f"a bytes-like object is required, not '{type(obj).__name__}'")
+            return 0
+        # Strided buffers are accepted here so that a non contiguous one can
+        # be converted item per item when not `strict`
+        cdef Py_buffer view
+        PyObject_GetBuffer(obj, &view, PyBUF_STRIDES | PyBUF_FORMAT)
+        cdef godot_int size
+        cdef {{ t.gd_pool }}_write_access *access
+        try:
+            if not PyBuffer_IsContiguous(&view, c'C'):
+                if strict:
+                    raise BufferError("Buffer is not C contiguous")
+                return 0
+            if _buffer_item_format(&view) not in {{ t.buffer_accepted_formats }} or view.itemsize != sizeof({{ t.buffer_item_type }}):
+                if strict:
+                    raise ValueError(
+                        f"Buffer item format must be `{{ t.buffer_format }}`, not `{_buffer_item_format(&view)}`"
+                    )
+                return 0
+            if view.len % sizeof({{ t.gd_value }}):
+                raise ValueError(
+                    f"Buffer size ({view.len} bytes) must be a multiple of {sizeof({{ t.gd_value }})} bytes"
+                )
+            size = view.len // sizeof({{ t.gd_value }})
+            gdapi10.{{ t.gd_pool }}_resize(&self._gd_data, size)
+            if size:
+                access = gdapi10.{{ t.gd_pool }}_write(&self._gd_data)
+                memcpy(gdapi10.{{ t.gd_pool }}_write_access_ptr(access), view.buf, view.len)
+                gdapi10.{{ t.gd_pool }}_write_access_destroy(access)
+            return 1
+        finally:
+            PyBuffer_Release(&view)
+{% endif %}
+
     def __repr__(self):
-        return f"<{{ t.py_pool }}([{', '.join(repr(x) for x in self)}])>"
+        return f"<{{ t.py_pool }}([{', '.join(repr(x) for x in self.to_list())}])>"
+
+    def to_list(self):
+        """
+        Convert into a Python list (items are all retrieved under a single
+        read access).
+        """
+        cdef godot_int size = self.size()
+        cdef list ret = [None] * size
+        cdef {{ t.gd_pool }}_read_access *access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef const {{ t.gd_value }} *ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(access)
+        cdef godot_int i
+{% if not t.is_base_type %}
+        cdef {{ t.py_value }} item
+{% endif %}
+        for i in range(size):
+            {{ render_item_to_pyobj(t, "ptr[i]", "item") | trim | indent(12) }}
+            ret[i] = item
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(access)
+        return ret
 
     # Operators
 
@@ -149,8 +254,13 @@ cdef class {{ t.py_pool }}:
 
         return ret
 
-    # TODO: support slice
-    def __setitem__(self, godot_int index, {{ t.py_value }} value):
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.operator_setslice(index, value)
+        else:
+            self.operator_setitem(index, value)
+
+    cdef inline void operator_setitem(self, godot_int index, {{ t.py_value }} value) except *:
         cdef godot_int size
         size = self.size()
         if index < 0:
@@ -163,8 +273,94 @@ cdef class {{ t.py_pool }}:
         gdapi10.{{ t.gd_pool }}_set(&self._gd_data, index, &value._gd_data)
 {% endif %}
 
-    # TODO: support slice
-    def __delitem__(self, godot_int index):
+    cdef inline void operator_setslice(self, slice index, object value) except *:
+        # Always work on a copy (cheap given Godot's copy-on-write) so that
+        # `value` can be the array itself
+        cdef {{ t.py_pool }} values = {{ t.py_pool }}(value)
+        cdef Py_ssize_t start
+        cdef Py_ssize_t stop
+        cdef Py_ssize_t step
+        start, stop, step = index.indices(self.size())
+        if step == 1:
+            self.operator_replace_range(start, max(start, stop), values)
+            return
+
+        cdef godot_int count = values.size()
+        cdef godot_int slice_size = len(range(start, stop, step))
+        if count != slice_size:
+            raise ValueError(
+                f"attempt to assign sequence of size {count} to extended slice of size {slice_size}"
+            )
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(
+            &self._gd_data
+        )
+        cdef {{ t.gd_pool }}_read_access *src_access = gdapi10.{{ t.gd_pool }}_read(
+            &values._gd_data
+        )
+        cdef {{ t.gd_value }} *dst_ptr = gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+        cdef const {{ t.gd_value }} *src_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(src_access)
+        cdef godot_int i
+        for i in range(count):
+{% if t.is_stack_only %}
+            dst_ptr[start + i * step] = src_ptr[i]
+{% else %}
+            gdapi10.{{ t.gd_value }}_destroy(&dst_ptr[start + i * step])
+            gdapi10.{{ t.gd_value }}_new_copy(&dst_ptr[start + i * step], &src_ptr[i])
+{% endif %}
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(src_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+
+    cdef inline void operator_replace_range(self, godot_int start, godot_int stop, {{ t.py_pool }} values):
+        # Replace items [start, stop) by `values` with at most one resize and
+        # a single memory move of the items past the range
+        cdef godot_int size = self.size()
+        cdef godot_int removed = stop - start
+        cdef godot_int count = values.size()
+        # Resizing is not possible while an access is held
+        if count > removed:
+            self.resize(size + count - removed)
+
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(
+            &self._gd_data
+        )
+        cdef {{ t.gd_value }} *dst_ptr = gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+{% if not t.is_stack_only %}
+        cdef godot_int i
+        for i in range(start, stop):
+            gdapi10.{{ t.gd_value }}_destroy(&dst_ptr[i])
+{% endif %}
+        memmove(&dst_ptr[start + count], &dst_ptr[stop], (size - stop) * sizeof({{ t.gd_value }}))
+{% if not t.is_stack_only %}
+        # Slots left behind by the move are duplicates of moved items, reset
+        # them to empty values so they don't get destroyed twice on resize
+        if count < removed:
+            memset(&dst_ptr[size - removed + count], 0, (removed - count) * sizeof({{ t.gd_value }}))
+{% endif %}
+
+        cdef {{ t.gd_pool }}_read_access *src_access = gdapi10.{{ t.gd_pool }}_read(
+            &values._gd_data
+        )
+        cdef const {{ t.gd_value }} *src_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(src_access)
+{% if t.is_stack_only %}
+        memcpy(&dst_ptr[start], src_ptr, count * sizeof({{ t.gd_value }}))
+{% else %}
+        # Target slots are either destroyed or duplicates, no destroy needed
+        for i in range(count):
+            gdapi10.{{ t.gd_value }}_new_copy(&dst_ptr[start + i], &src_ptr[i])
+{% endif %}
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(src_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+
+        if count < removed:
+            self.resize(size + count - removed)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            self.operator_delslice(index)
+        else:
+            self.operator_delitem(index)
+
+    cdef inline void operator_delitem(self, godot_int index) except *:
         cdef godot_int size
         size = self.size()
         if index < 0:
@@ -173,23 +369,105 @@ cdef class {{ t.py_pool }}:
             raise IndexError("list index out of range")
         gdapi10.{{ t.gd_pool }}_remove(&self._gd_data, index)
 
+    cdef inline void operator_delslice(self, slice index) except *:
+        cdef object indices = range(*index.indices(self.size()))
+        if indices.step < 0:
+            indices = indices[::-1]
+        cdef godot_int count = len(indices)
+        if count == 0:
+            return
+        cdef godot_int start = indices.start
+        cdef godot_int step = indices.step
+        if step == 1:
+            self.operator_replace_range(start, start + count, {{ t.py_pool }}.new())
+            return
+
+        # Compact the kept items in place, then shrink once
+        cdef godot_int size = self.size()
+        cdef {{ t.gd_pool }}_write_access *access = gdapi10.{{ t.gd_pool }}_write(&self._gd_data)
+        cdef {{ t.gd_value }} *ptr = gdapi10.{{ t.gd_pool }}_write_access_ptr(access)
+        cdef godot_int removed = 0
+        cdef godot_int dst = start
+        cdef godot_int src
+        for src in range(start, size):
+            if removed < count and src == start + removed * step:
+{% if not t.is_stack_only %}
+                gdapi10.{{ t.gd_value }}_destroy(&ptr[src])
+{% endif %}
+                removed += 1
+            else:
+{% if t.is_stack_only %}
+                ptr[dst] = ptr[src]
+{% else %}
+                memcpy(&ptr[dst], &ptr[src], sizeof({{ t.gd_value }}))
+{% endif %}
+                dst += 1
+{% if not t.is_stack_only %}
+        memset(&ptr[dst], 0, (size - dst) * sizeof({{ t.gd_value }}))
+{% endif %}
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(access)
+        self.resize(dst)
+
     def __len__(self):
         return self.size()
 
     def __iter__(self):
+        # Items are retrieved by chunks under a single read access: holding
+        # the access while the loop body runs would lock the array (i.e.
+        # prevent it from being resized).
         # TODO: mid iteration mutation should throw exception ?
-        cdef int i
-        {% if not t.is_base_type %}
+        cdef godot_int i = 0
+        cdef godot_int j
+        cdef godot_int chunk_size
+        cdef {{ t.gd_pool }}_read_access *access
+        cdef const {{ t.gd_value }} *ptr
+        cdef list chunk
+{% if not t.is_base_type %}
         cdef {{ t.py_value }} item
-        {% endif %}
-        for i in range(self.size()):
+{% endif %}
+        while i < self.size():
+            chunk_size = min(self.size() - i, _ITER_CHUNK_SIZE)
+            chunk = [None] * chunk_size
+            access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+            ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(access)
+            for j in range(chunk_size):
+                {{ render_item_to_pyobj(t, "ptr[i + j]", "item") | trim | indent(16) }}
+                chunk[j] = item
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(access)
+            yield from chunk
+            i += chunk_size
+
+    def __contains__(self, value):
 {% if t.is_base_type %}
-            yield gdapi10.{{ t.gd_pool }}_get(&self._gd_data, i)
+        cdef {{ t.gd_value }} gd_value
+{% if t.gd_value != "godot_real" %}
+        if not isinstance(value, int):
+            return False
+{% endif %}
+        try:
+            gd_value = value
+        except (TypeError, OverflowError):
+            return False
 {% else %}
-            item = {{ t.py_value }}.__new__({{ t.py_value }})
-            item._gd_data = gdapi10.{{ t.gd_pool }}_get(&self._gd_data, i)
-            yield item
+        if not isinstance(value, {{ t.py_value }}):
+            return False
+        cdef {{ t.py_value }} py_value = <{{ t.py_value }}>value
 {% endif %}
+        cdef godot_int size = self.size()
+        cdef {{ t.gd_pool }}_read_access *access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef const {{ t.gd_value }} *ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(access)
+        cdef godot_int i
+        cdef bint found = False
+        for i in range(size):
+{% if t.is_base_type %}
+            if ptr[i] == gd_value:
+{% else %}
+            if gdapi10.{{ t.gd_value }}_operator_equal(&ptr[i], &py_value._gd_data):
+{% endif %}
+                found = True
+                break
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(access)
+        return found
 
     def __copy__(self):
         return self.copy()
@@ -206,6 +484,7 @@ cdef class {{ t.py_pool }}:
         except TypeError:
             return True
 
+{% if not t.math_components %}
     def __iadd__(self, {{ t.py_pool }} items not None):
         self.append_array(items)
         return self
@@ -214,6 +493,7 @@ cdef class {{ t.py_pool }}:
         cdef {{ t.py_pool }} ret = {{ t.py_pool }}.copy(self)
         ret.append_array(items)
         return ret
+{% endif %}
 
     cdef inline bint operator_equal(self, {{ t.py_pool }} other):
         if other is None:
@@ -263,6 +543,9 @@ cdef class {{ t.py_pool }}:
     cdef inline void append_array(self, {{ t.py_pool }} array):
         gdapi10.{{ t.gd_pool }}_append_array(&self._gd_data, &array._gd_data)
 
+    def extend(self, {{ t.py_pool }} items not None):
+        self.append_array(items)
+
     cpdef inline void invert(self):
         gdapi10.{{ t.gd_pool }}_invert(&self._gd_data)
 
@@ -279,6 +562,14 @@ cdef class {{ t.py_pool }}:
     cdef inline godot_int size(self):
         return gdapi10.{{ t.gd_pool }}_size(&self._gd_data)
 
+{% if t.math_components %}
+{{ render_pool_array_math_pyx(t).rstrip() }}
+
+{% endif %}
+{% if t.is_sortable %}
+{{ render_pool_array_sort_pyx(t).rstrip() }}
+
+{% endif %}
     # Raw access
 
     @contextmanager
@@ -294,6 +585,121 @@ cdef class {{ t.py_pool }}:
         finally:
             gdapi10.{{ t.gd_pool }}_write_access_destroy(access)
 
+    def read_access(self):
+        """
+        Return a read-only access to the items, to be used as a context manager.
+
+        Unlike `raw_access`, this never triggers a copy of a pool array sharing
+        its data with another one. The array cannot be resized until the access
+        is released.
+        """
+        cdef {{ t.py_pool }}ReadAccess pyaccess = {{ t.py_pool }}ReadAccess.__new__({{ t.py_pool }}ReadAccess)
+        pyaccess._array = self
+        pyaccess._gd_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        pyaccess._gd_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(pyaccess._gd_access)
+        pyaccess._size = self.size()
+        return pyaccess
+{% if t.buffer_format %}
+
+    # Buffer protocol
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        # The access (and hence Godot's lock on the pool array, which also
+        # prevents it from being resized) is kept until the buffer is
+        # released. A write access is only taken for writable buffers, given
+        # it triggers a copy of a pool array sharing its data with another one.
+        cdef {{ t.gd_pool }}_write_access *write_access
+        cdef {{ t.gd_pool }}_read_access *read_access
+        if flags & PyBUF_WRITABLE:
+            write_access = gdapi10.{{ t.gd_pool }}_write(&self._gd_data)
+            try:
+                {{ render_fill_buffer(t, "gdapi10." ~ t.gd_pool ~ "_write_access_ptr(write_access)", "self.size()", False) | indent(16) }}
+            except:
+                gdapi10.{{ t.gd_pool }}_write_access_destroy(write_access)
+                raise
+            buffer.internal = write_access
+        else:
+            read_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+            try:
+                {{ render_fill_buffer(t, "gdapi10." ~ t.gd_pool ~ "_read_access_ptr(read_access)", "self.size()", True) | indent(16) }}
+            except:
+                gdapi10.{{ t.gd_pool }}_read_access_destroy(read_access)
+                raise
+            buffer.internal = read_access
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        if buffer.readonly:
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(<{{ t.gd_pool }}_read_access*>buffer.internal)
+        else:
+            gdapi10.{{ t.gd_pool }}_write_access_destroy(<{{ t.gd_pool }}_write_access*>buffer.internal)
+        # Shape and strides share the same allocation
+        PyMem_Free(buffer.shape)
+{% endif %}
+
+
+@cython.final
+cdef class {{ t.py_pool }}ReadAccess:
+
+    def __dealloc__(self):
+        if self._gd_access != NULL:
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(self._gd_access)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def release(self):
+        """
+        Release the access (also done when leaving the `with` block).
+        """
+        if self._gd_access == NULL:
+            return
+        if self._exports:
+            raise BufferError(f"cannot release access, {self._exports} buffer(s) still exported")
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(self._gd_access)
+        self._gd_access = NULL
+        self._gd_ptr = NULL
+
+    cdef inline void check_released(self) except *:
+        if self._gd_access == NULL:
+            raise ValueError("operation forbidden on released read access")
+
+    def get_address(self):
+        self.check_released()
+        return <uintptr_t>self._gd_ptr
+
+    def __len__(self):
+        self.check_released()
+        return self._size
+
+    def __getitem__(self, godot_int idx):
+        self.check_released()
+        if idx < 0:
+            idx += self._size
+        if idx < 0 or idx >= self._size:
+            raise IndexError("list index out of range")
+{% if not t.is_base_type %}
+        cdef {{ t.py_value }} item
+{% endif %}
+        {{ render_item_to_pyobj(t, "self._gd_ptr[idx]", "item") | trim | indent(8) }}
+        return item
+{% if t.buffer_format %}
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        self.check_released()
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("read access is readonly")
+        {{ render_fill_buffer(t, "self._gd_ptr", "self._size", True) | indent(8) }}
+        self._exports += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self._exports -= 1
+        # Shape and strides share the same allocation
+        PyMem_Free(buffer.shape)
+{% endif %}
+
 
 @cython.final
 cdef class {{ t.py_pool }}WriteAccess:
@@ -0,0 +1,23 @@
+{% macro render_pool_array_math_pxd_header() %}
+cdef enum _PoolArrayOperator:
+    _POOL_ARRAY_OPERATOR_ADD
+    _POOL_ARRAY_OPERATOR_SUB
+    _POOL_ARRAY_OPERATOR_RSUB
+    _POOL_ARRAY_OPERATOR_MUL
+    _POOL_ARRAY_OPERATOR_DIV
+    _POOL_ARRAY_OPERATOR_RDIV
+
+
+cdef enum _PoolArrayOperand:
+    _POOL_ARRAY_OPERAND_UNSUPPORTED
+    _POOL_ARRAY_OPERAND_ITEM
+    _POOL_ARRAY_OPERAND_ARRAY
+{% endmacro %}
+
+{% macro render_pool_array_math_pxd(t) %}
+    # Element-wise math
+
+    cdef inline int math_operand(self, object other, float *item) except -1
+    cdef inline object operator_math(self, object other, _PoolArrayOperator op, bint inplace)
+    cdef inline void math_reduce(self, double *sum, float *min, float *max)
+{% endmacro %}
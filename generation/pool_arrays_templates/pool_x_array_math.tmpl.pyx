@@ -0,0 +1,467 @@
+{#
+Element-wise math on the pool arrays made of floats (PoolRealArray,
+PoolVector2Array, PoolVector3Array and PoolColorArray): items are handled
+as a flat array of `t.math_components` float components.
+#}
+
+{% set OPERATORS = [
+    ("ADD", "a[i * components + j] + b[i * b_step + j]"),
+    ("SUB", "a[i * components + j] - b[i * b_step + j]"),
+    ("RSUB", "b[i * b_step + j] - a[i * components + j]"),
+    ("MUL", "a[i * components + j] * b[i * b_step + j]"),
+    ("DIV", "a[i * components + j] / b[i * b_step + j]"),
+    ("RDIV", "b[i * b_step + j] / a[i * components + j]"),
+] %}
+
+{% macro render_pool_array_math_helpers() %}
+# In the following kernels `a` is an array of `size` items of `components`
+# floats, and `b` is either a single item (`b_step` is 0) or an array of the
+# same shape as `a` (`b_step` is `components`)
+
+
+@cython.cdivision(True)
+cdef void _pool_array_operator(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+    const float *b,
+    Py_ssize_t b_step,
+    _PoolArrayOperator op,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+{% for name, expression in OPERATORS %}
+    {{ "if" if loop.first else "elif" }} op == _POOL_ARRAY_OPERATOR_{{ name }}:
+        for i in range(size):
+            for j in range(components):
+                dst[i * components + j] = {{ expression }}
+{% endfor %}
+
+
+cdef void _pool_array_lerp(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+    const float *b,
+    Py_ssize_t b_step,
+    float weight,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for i in range(size):
+        for j in range(components):
+            x = a[i * components + j]
+            dst[i * components + j] = x + (b[i * b_step + j] - x) * weight
+
+
+cdef void _pool_array_clamp(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+    const float *lower,
+    const float *upper,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for i in range(size):
+        for j in range(components):
+            x = a[i * components + j]
+            if x < lower[j]:
+                x = lower[j]
+            elif x > upper[j]:
+                x = upper[j]
+            dst[i * components + j] = x
+
+
+cdef void _pool_array_reduce(
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+    double *sum,
+    float *min,
+    float *max,
+) nogil:
+    # `size` must be > 0
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for j in range(components):
+        sum[j] = min[j] = max[j] = a[j]
+    for i in range(1, size):
+        for j in range(components):
+            x = a[i * components + j]
+            sum[j] += x
+            if x < min[j]:
+                min[j] = x
+            elif x > max[j]:
+                max[j] = x
+
+
+cdef void _pool_array_dot(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+    const float *b,
+    Py_ssize_t b_step,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for i in range(size):
+        x = 0
+        for j in range(components):
+            x += a[i * components + j] * b[i * b_step + j]
+        dst[i] = x
+
+
+cdef void _pool_array_length(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for i in range(size):
+        x = 0
+        for j in range(components):
+            x += a[i * components + j] * a[i * components + j]
+        dst[i] = sqrt(x)
+
+
+@cython.cdivision(True)
+cdef void _pool_array_normalized(
+    float *dst,
+    const float *a,
+    Py_ssize_t size,
+    Py_ssize_t components,
+) nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef float x
+    for i in range(size):
+        x = 0
+        for j in range(components):
+            x += a[i * components + j] * a[i * components + j]
+        # Same as Godot, a zero vector stays zero once normalized
+        if x != 0:
+            x = sqrt(x)
+        else:
+            x = 1
+        for j in range(components):
+            dst[i * components + j] = a[i * components + j] / x
+{% endmacro %}
+
+{% macro render_item_from_components(t, components) %}
+{% if t.is_base_type %}
+        return {{ components }}[0]
+{% else %}
+        cdef {{ t.py_value }} item = {{ t.py_value }}.__new__({{ t.py_value }})
+        memcpy(&item._gd_data, {{ components }}, sizeof({{ t.gd_value }}))
+        return item
+{% endif %}
+{% endmacro %}
+
+{% macro render_pool_array_math_pyx(t) %}
+    # Element-wise math
+
+    cdef inline int math_operand(self, object other, float *item) except -1:
+        # Scalars and single items are copied into `item`
+        cdef int i
+        if isinstance(other, (int, float)):
+            for i in range({{ t.math_components }}):
+                item[i] = other
+            return _POOL_ARRAY_OPERAND_ITEM
+{% if not t.is_base_type %}
+        elif isinstance(other, {{ t.py_value }}):
+            memcpy(item, &(<{{ t.py_value }}>other)._gd_data, sizeof({{ t.gd_value }}))
+            return _POOL_ARRAY_OPERAND_ITEM
+{% endif %}
+        elif isinstance(other, {{ t.py_pool }}):
+            if (<{{ t.py_pool }}>other).size() != self.size():
+                raise ValueError(
+                    f"Operands must have the same size (got {self.size()} and {(<{{ t.py_pool }}>other).size()})"
+                )
+            return _POOL_ARRAY_OPERAND_ARRAY
+        else:
+            return _POOL_ARRAY_OPERAND_UNSUPPORTED
+
+    cdef inline object operator_math(self, object other, _PoolArrayOperator op, bint inplace):
+        cdef float item[4]
+        cdef int operand = {{ t.py_pool }}.math_operand(self, other, item)
+        if operand == _POOL_ARRAY_OPERAND_UNSUPPORTED:
+            return NotImplemented
+        cdef godot_int size = self.size()
+        cdef {{ t.py_pool }} ret
+        if inplace:
+            ret = self
+        else:
+            ret = {{ t.py_pool }}.new()
+            ret.resize(size)
+        # Write access must be taken before any read access given it may
+        # trigger a copy-on-write, which is not allowed on a locked pool array
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef {{ t.gd_pool }}_read_access *b_access = NULL
+        cdef const float *b = item
+        cdef Py_ssize_t b_step = 0
+        if operand == _POOL_ARRAY_OPERAND_ARRAY:
+            b_access = gdapi10.{{ t.gd_pool }}_read(&(<{{ t.py_pool }}>other)._gd_data)
+            b = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(b_access)
+            b_step = {{ t.math_components }}
+        cdef float *dst = <float*>gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_operator(dst, a, size, {{ t.math_components }}, b, b_step, op)
+        if b_access != NULL:
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(b_access)
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+        return ret
+
+    def __add__(self, other):
+        # Unlike for the other pool arrays, adding two pool arrays is
+        # element-wise (same as - * /), use `extend` to concatenate
+        if isinstance(self, {{ t.py_pool }}):
+            return {{ t.py_pool }}.operator_math(self, other, _POOL_ARRAY_OPERATOR_ADD, False)
+        else:
+            return {{ t.py_pool }}.operator_math(other, self, _POOL_ARRAY_OPERATOR_ADD, False)
+
+    def __sub__(self, other):
+        if isinstance(self, {{ t.py_pool }}):
+            return {{ t.py_pool }}.operator_math(self, other, _POOL_ARRAY_OPERATOR_SUB, False)
+        else:
+            return {{ t.py_pool }}.operator_math(other, self, _POOL_ARRAY_OPERATOR_RSUB, False)
+
+    def __mul__(self, other):
+        if isinstance(self, {{ t.py_pool }}):
+            return {{ t.py_pool }}.operator_math(self, other, _POOL_ARRAY_OPERATOR_MUL, False)
+        else:
+            return {{ t.py_pool }}.operator_math(other, self, _POOL_ARRAY_OPERATOR_MUL, False)
+
+    def __truediv__(self, other):
+        if isinstance(self, {{ t.py_pool }}):
+            return {{ t.py_pool }}.operator_math(self, other, _POOL_ARRAY_OPERATOR_DIV, False)
+        else:
+            return {{ t.py_pool }}.operator_math(other, self, _POOL_ARRAY_OPERATOR_RDIV, False)
+
+    def __iadd__(self, other):
+        return self.operator_math(other, _POOL_ARRAY_OPERATOR_ADD, True)
+
+    def __isub__(self, other):
+        return self.operator_math(other, _POOL_ARRAY_OPERATOR_SUB, True)
+
+    def __imul__(self, other):
+        return self.operator_math(other, _POOL_ARRAY_OPERATOR_MUL, True)
+
+    def __itruediv__(self, other):
+        return self.operator_math(other, _POOL_ARRAY_OPERATOR_DIV, True)
+
+{% for name, _ in OPERATORS if not name.startswith("R") %}
+    def {{ name | lower }}(self, other):
+        """
+        Element-wise {{ name | lower }} with a scalar, a {{ t.py_value if not t.is_base_type else "float" }} or a {{ t.py_pool }} of the same size.
+        """
+        ret = self.operator_math(other, _POOL_ARRAY_OPERATOR_{{ name }}, False)
+        if ret is NotImplemented:
+            raise TypeError(f"Unsupported operand type: {type(other).__name__}")
+        return ret
+
+{% endfor %}
+    def lerp(self, other, float weight):
+        """
+        Element-wise linear interpolation toward a scalar, a {{ t.py_value if not t.is_base_type else "float" }} or a {{ t.py_pool }} of the same size.
+        """
+        cdef float item[4]
+        cdef int operand = self.math_operand(other, item)
+        if operand == _POOL_ARRAY_OPERAND_UNSUPPORTED:
+            raise TypeError(f"Unsupported operand type: {type(other).__name__}")
+        cdef godot_int size = self.size()
+        cdef {{ t.py_pool }} ret = {{ t.py_pool }}.new()
+        ret.resize(size)
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef {{ t.gd_pool }}_read_access *b_access = NULL
+        cdef const float *b = item
+        cdef Py_ssize_t b_step = 0
+        if operand == _POOL_ARRAY_OPERAND_ARRAY:
+            b_access = gdapi10.{{ t.gd_pool }}_read(&(<{{ t.py_pool }}>other)._gd_data)
+            b = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(b_access)
+            b_step = {{ t.math_components }}
+        cdef float *dst = <float*>gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_lerp(dst, a, size, {{ t.math_components }}, b, b_step, weight)
+        if b_access != NULL:
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(b_access)
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+        return ret
+
+    def clamp(self, lower, upper):
+        """
+        Clamp each component between `lower` and `upper` (scalars or {{ t.py_value if not t.is_base_type else "float" }}).
+        """
+        cdef float lower_item[4]
+        cdef float upper_item[4]
+        if (
+            self.math_operand(lower, lower_item) != _POOL_ARRAY_OPERAND_ITEM
+            or self.math_operand(upper, upper_item) != _POOL_ARRAY_OPERAND_ITEM
+        ):
+            raise TypeError("Clamp bounds must be scalars or {{ t.py_value if not t.is_base_type else "float" }}")
+        cdef godot_int size = self.size()
+        cdef {{ t.py_pool }} ret = {{ t.py_pool }}.new()
+        ret.resize(size)
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef float *dst = <float*>gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_clamp(dst, a, size, {{ t.math_components }}, lower_item, upper_item)
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+        return ret
+
+    # Reductions
+
+    cdef inline void math_reduce(self, double *sum, float *min, float *max):
+        cdef {{ t.gd_pool }}_read_access *access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(access)
+        cdef godot_int size = self.size()
+        with nogil:
+            _pool_array_reduce(a, size, {{ t.math_components }}, sum, min, max)
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(access)
+
+    def sum(self):
+        cdef double sum[4]
+        cdef float min[4]
+        cdef float max[4]
+        cdef float components[4]
+        cdef int i
+        if self.size() == 0:
+            for i in range({{ t.math_components }}):
+                components[i] = 0
+        else:
+            self.math_reduce(sum, min, max)
+            for i in range({{ t.math_components }}):
+                components[i] = <float>sum[i]
+{{ render_item_from_components(t, "components") }}
+    def mean(self):
+        cdef double sum[4]
+        cdef float min[4]
+        cdef float max[4]
+        cdef float components[4]
+        cdef int i
+        cdef godot_int size = self.size()
+        if size == 0:
+            raise ValueError("mean() arg is an empty {{ t.py_pool }}")
+        self.math_reduce(sum, min, max)
+        for i in range({{ t.math_components }}):
+            components[i] = <float>(sum[i] / size)
+{{ render_item_from_components(t, "components") }}
+{% for reduction in ("min", "max") %}
+    def {{ reduction }}(self):
+{% if t.is_base_type %}
+        """
+        {{ "Smallest" if reduction == "min" else "Biggest" }} item of the array.
+        """
+{% else %}
+        """
+        {{ t.py_value }} made of the {{ "smallest" if reduction == "min" else "biggest" }} components of the array's items.
+        """
+{% endif %}
+        cdef double sum[4]
+        cdef float min[4]
+        cdef float max[4]
+        if self.size() == 0:
+            raise ValueError("{{ reduction }}() arg is an empty {{ t.py_pool }}")
+        self.math_reduce(sum, min, max)
+{{ render_item_from_components(t, reduction) }}
+{% endfor %}
+{% if t.py_value in ("Vector2", "Vector3") %}
+    def bounding_box(self):
+        cdef double sum[4]
+        cdef float min[4]
+        cdef float max[4]
+        if self.size() == 0:
+            raise ValueError("bounding_box() arg is an empty {{ t.py_pool }}")
+        self.math_reduce(sum, min, max)
+{% if t.py_value == "Vector2" %}
+        return Rect2(min[0], min[1], max[0] - min[0], max[1] - min[1])
+{% else %}
+        return AABB(
+            Vector3(min[0], min[1], min[2]),
+            Vector3(max[0] - min[0], max[1] - min[1], max[2] - min[2]),
+        )
+{% endif %}
+
+    # Vector math
+
+    def dot(self, other):
+        """
+        Dot product of each item with a {{ t.py_value }}, or with the item of
+        same index in a {{ t.py_pool }} of the same size.
+        """
+        cdef float item[4]
+        cdef int operand = self.math_operand(other, item)
+        if operand == _POOL_ARRAY_OPERAND_UNSUPPORTED:
+            raise TypeError(f"Unsupported operand type: {type(other).__name__}")
+        cdef godot_int size = self.size()
+        cdef PoolRealArray ret = PoolRealArray.new()
+        ret.resize(size)
+        cdef godot_pool_real_array_write_access *dst_access = gdapi10.godot_pool_real_array_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef {{ t.gd_pool }}_read_access *b_access = NULL
+        cdef const float *b = item
+        cdef Py_ssize_t b_step = 0
+        if operand == _POOL_ARRAY_OPERAND_ARRAY:
+            b_access = gdapi10.{{ t.gd_pool }}_read(&(<{{ t.py_pool }}>other)._gd_data)
+            b = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(b_access)
+            b_step = {{ t.math_components }}
+        cdef float *dst = <float*>gdapi10.godot_pool_real_array_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_dot(dst, a, size, {{ t.math_components }}, b, b_step)
+        if b_access != NULL:
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(b_access)
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.godot_pool_real_array_write_access_destroy(dst_access)
+        return ret
+
+    def length(self):
+        cdef godot_int size = self.size()
+        cdef PoolRealArray ret = PoolRealArray.new()
+        ret.resize(size)
+        cdef godot_pool_real_array_write_access *dst_access = gdapi10.godot_pool_real_array_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef float *dst = <float*>gdapi10.godot_pool_real_array_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_length(dst, a, size, {{ t.math_components }})
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.godot_pool_real_array_write_access_destroy(dst_access)
+        return ret
+
+    def normalized(self):
+        cdef godot_int size = self.size()
+        cdef {{ t.py_pool }} ret = {{ t.py_pool }}.new()
+        ret.resize(size)
+        cdef {{ t.gd_pool }}_write_access *dst_access = gdapi10.{{ t.gd_pool }}_write(&ret._gd_data)
+        cdef {{ t.gd_pool }}_read_access *a_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef float *dst = <float*>gdapi10.{{ t.gd_pool }}_write_access_ptr(dst_access)
+        cdef const float *a = <const float*>gdapi10.{{ t.gd_pool }}_read_access_ptr(a_access)
+        with nogil:
+            _pool_array_normalized(dst, a, size, {{ t.math_components }})
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(a_access)
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(dst_access)
+        return ret
+
+{% endif %}
+{% endmacro %}
@@ -0,0 +1,284 @@
+{#
+Sorting and searching on the pool arrays whose items are ordered
+(PoolIntArray, PoolRealArray and PoolStringArray): items are sorted in place
+with `qsort` through a per type comparison function.
+#}
+
+{% macro render_pool_array_sort_helpers(types) %}
+# Sorting `_PoolArraySortKey` items instead of the items themselves allows to
+# retrieve the sort permutation, ties are broken by index to keep it stable
+cdef struct _PoolArraySortKey:
+    const void *value
+    godot_int index
+{% for t in types if t.is_sortable %}
+
+
+cdef int _{{ t.py_pool }}_compare(const void *a, const void *b):
+{% if t.gd_value == "godot_string" %}
+    if gdapi10.godot_string_operator_less(<const godot_string*>a, <const godot_string*>b):
+        return -1
+    elif gdapi10.godot_string_operator_less(<const godot_string*>b, <const godot_string*>a):
+        return 1
+    return 0
+{% else %}
+    cdef {{ t.gd_value }} x = (<const {{ t.gd_value }}*>a)[0]
+    cdef {{ t.gd_value }} y = (<const {{ t.gd_value }}*>b)[0]
+{% if t.gd_value == "godot_real" %}
+    # NaNs are sorted last, otherwise the ordering would be inconsistent
+    if x != x:
+        return 0 if y != y else 1
+    elif y != y:
+        return -1
+{% endif %}
+    return (x > y) - (x < y)
+{% endif %}
+
+
+cdef int _{{ t.py_pool }}_compare_keys(const void *a, const void *b):
+    cdef const _PoolArraySortKey *key_a = <const _PoolArraySortKey*>a
+    cdef const _PoolArraySortKey *key_b = <const _PoolArraySortKey*>b
+    cdef int ret = _{{ t.py_pool }}_compare(key_a.value, key_b.value)
+    if ret == 0:
+        ret = (key_a.index > key_b.index) - (key_a.index < key_b.index)
+    return ret
+
+
+cdef int _{{ t.py_pool }}_compare_keys_reversed(const void *a, const void *b):
+    cdef const _PoolArraySortKey *key_a = <const _PoolArraySortKey*>a
+    cdef const _PoolArraySortKey *key_b = <const _PoolArraySortKey*>b
+    cdef int ret = _{{ t.py_pool }}_compare(key_b.value, key_a.value)
+    if ret == 0:
+        ret = (key_a.index > key_b.index) - (key_a.index < key_b.index)
+    return ret
+{% endfor %}
+{% endmacro %}
+
+{% macro render_search_item(t) %}
+{% if t.gd_value == "godot_int" %}
+if not isinstance(value, int):
+    raise TypeError(f"an integer is required (got type {type(value).__name__})")
+cdef godot_int item = value
+{% elif t.is_base_type %}
+cdef {{ t.gd_value }} item = value
+{% else %}
+if not isinstance(value, {{ t.py_value }}):
+    raise TypeError(f"a {{ t.py_value }} is required (got type {type(value).__name__})")
+# Borrowed, only used for comparisons while `value` is alive
+cdef {{ t.gd_value }} item = (<{{ t.py_value }}>value)._gd_data
+{% endif %}
+{% endmacro %}
+
+{% macro render_pool_array_sort_pyx(t) %}
+    # Sorting and searching
+
+    def sort(self, bint reverse=False):
+        cdef godot_int size = self.size()
+        if size < 2:
+            return
+        cdef {{ t.gd_pool }}_write_access *access = gdapi10.{{ t.gd_pool }}_write(&self._gd_data)
+        qsort(
+            gdapi10.{{ t.gd_pool }}_write_access_ptr(access),
+            size,
+            sizeof({{ t.gd_value }}),
+            _{{ t.py_pool }}_compare,
+        )
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(access)
+        if reverse:
+            self.invert()
+
+    def argsort(self, bint reverse=False):
+        """
+        Return the indices that would sort the array (equal items keep
+        their relative order).
+        """
+        cdef godot_int size = self.size()
+        cdef PoolIntArray ret = PoolIntArray.new()
+        if size == 0:
+            return ret
+        cdef _PoolArraySortKey *keys = <_PoolArraySortKey*>PyMem_Malloc(size * sizeof(_PoolArraySortKey))
+        if keys == NULL:
+            raise MemoryError()
+        ret.resize(size)
+
+        cdef godot_pool_int_array_write_access *dst_access = gdapi10.godot_pool_int_array_write(
+            &ret._gd_data
+        )
+        cdef {{ t.gd_pool }}_read_access *src_access = gdapi10.{{ t.gd_pool }}_read(
+            &self._gd_data
+        )
+        cdef godot_int *dst_ptr = gdapi10.godot_pool_int_array_write_access_ptr(dst_access)
+        cdef const {{ t.gd_value }} *src_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(src_access)
+        cdef godot_int i
+        for i in range(size):
+            keys[i].value = &src_ptr[i]
+            keys[i].index = i
+        qsort(
+            keys,
+            size,
+            sizeof(_PoolArraySortKey),
+            _{{ t.py_pool }}_compare_keys_reversed if reverse else _{{ t.py_pool }}_compare_keys,
+        )
+        for i in range(size):
+            dst_ptr[i] = keys[i].index
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(src_access)
+        gdapi10.godot_pool_int_array_write_access_destroy(dst_access)
+        PyMem_Free(keys)
+        return ret
+
+    def searchsorted(self, value, str side="left"):
+        """
+        Return the index where `value` should be inserted to keep the
+        (already sorted) array sorted.
+        """
+        if side not in ("left", "right"):
+            raise ValueError(f"side must be 'left' or 'right' (got {side!r})")
+        cdef bint right = side == "right"
+        {{ render_search_item(t) | trim | indent(8) }}
+        cdef godot_int low = 0
+        cdef godot_int high = self.size()
+        cdef godot_int middle
+        cdef int cmp
+        cdef {{ t.gd_pool }}_read_access *access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        cdef const {{ t.gd_value }} *ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(access)
+        while low < high:
+            middle = low + (high - low) // 2
+            cmp = _{{ t.py_pool }}_compare(&ptr[middle], &item)
+            if cmp < 0 or (right and cmp == 0):
+                low = middle + 1
+            else:
+                high = middle
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(access)
+        return low
+
+    def unique(self, bint return_counts=False):
+        """
+        Return the sorted unique items of the array (and the number of
+        occurrences of each of them if `return_counts` is set).
+        """
+        cdef {{ t.py_pool }} ret = {{ t.py_pool }}.copy(self)
+        ret.sort()
+        cdef PoolIntArray counts = PoolIntArray.new()
+        cdef godot_int size = ret.size()
+        if size == 0:
+            return (ret, counts) if return_counts else ret
+        if return_counts:
+            counts.resize(size)
+
+        cdef {{ t.gd_pool }}_write_access *access = gdapi10.{{ t.gd_pool }}_write(&ret._gd_data)
+        cdef {{ t.gd_value }} *ptr = gdapi10.{{ t.gd_pool }}_write_access_ptr(access)
+        cdef godot_pool_int_array_write_access *counts_access = NULL
+        cdef godot_int *counts_ptr = NULL
+        if return_counts:
+            counts_access = gdapi10.godot_pool_int_array_write(&counts._gd_data)
+            counts_ptr = gdapi10.godot_pool_int_array_write_access_ptr(counts_access)
+            counts_ptr[0] = 1
+        # Duplicates are contiguous once sorted, compact them in place
+        cdef godot_int kept = 0
+        cdef godot_int i
+        for i in range(1, size):
+            if _{{ t.py_pool }}_compare(&ptr[i], &ptr[kept]) == 0:
+{% if not t.is_stack_only %}
+                gdapi10.{{ t.gd_value }}_destroy(&ptr[i])
+{% endif %}
+                if counts_ptr != NULL:
+                    counts_ptr[kept] += 1
+            else:
+                kept += 1
+{% if t.is_stack_only %}
+                ptr[kept] = ptr[i]
+{% else %}
+                memcpy(&ptr[kept], &ptr[i], sizeof({{ t.gd_value }}))
+{% endif %}
+                if counts_ptr != NULL:
+                    counts_ptr[kept] = 1
+        kept += 1
+{% if not t.is_stack_only %}
+        # Reset the slots left behind so they don't get destroyed on resize
+        memset(&ptr[kept], 0, (size - kept) * sizeof({{ t.gd_value }}))
+{% endif %}
+        gdapi10.{{ t.gd_pool }}_write_access_destroy(access)
+        ret.resize(kept)
+        if return_counts:
+            gdapi10.godot_pool_int_array_write_access_destroy(counts_access)
+            counts.resize(kept)
+            return ret, counts
+        return ret
+{% if t.is_base_type %}
+
+    def histogram(self, godot_int bins=10, bounds=None):
+        """
+        Count the items in `bins` equal-width bins between `bounds` (the
+        array's min and max by default), the last bin includes its upper
+        edge and items out of bounds are ignored.
+
+        Return the counts and the `bins + 1` bin edges.
+        """
+        if bins <= 0:
+            raise ValueError("bins must be a positive integer")
+        cdef godot_int size = self.size()
+        cdef {{ t.gd_pool }}_read_access *src_access
+        cdef const {{ t.gd_value }} *src_ptr
+        cdef double lower = 0
+        cdef double upper = 1
+        cdef bint found = False
+        cdef godot_int i
+        cdef double x
+        if bounds is not None:
+            lower, upper = bounds
+            if lower > upper:
+                raise ValueError("bounds upper value must be larger than lower one")
+        elif size:
+            src_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+            src_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(src_access)
+            for i in range(size):
+                x = src_ptr[i]
+                if x != x:
+                    continue
+                if not found:
+                    lower = upper = x
+                    found = True
+                elif x < lower:
+                    lower = x
+                elif x > upper:
+                    upper = x
+            gdapi10.{{ t.gd_pool }}_read_access_destroy(src_access)
+        if lower == upper:
+            lower -= 0.5
+            upper += 0.5
+
+        cdef double width = (upper - lower) / bins
+        cdef PoolIntArray counts = PoolIntArray.new()
+        cdef PoolRealArray edges = PoolRealArray.new()
+        counts.resize(bins)
+        edges.resize(bins + 1)
+        cdef godot_pool_int_array_write_access *counts_access = gdapi10.godot_pool_int_array_write(
+            &counts._gd_data
+        )
+        cdef godot_pool_real_array_write_access *edges_access = gdapi10.godot_pool_real_array_write(
+            &edges._gd_data
+        )
+        cdef godot_int *counts_ptr = gdapi10.godot_pool_int_array_write_access_ptr(counts_access)
+        cdef godot_real *edges_ptr = gdapi10.godot_pool_real_array_write_access_ptr(edges_access)
+        memset(counts_ptr, 0, bins * sizeof(godot_int))
+        for i in range(bins):
+            edges_ptr[i] = lower + i * width
+        edges_ptr[bins] = upper
+
+        cdef godot_int bin
+        src_access = gdapi10.{{ t.gd_pool }}_read(&self._gd_data)
+        src_ptr = gdapi10.{{ t.gd_pool }}_read_access_ptr(src_access)
+        for i in range(size):
+            x = src_ptr[i]
+            # Also skips NaNs
+            if not (lower <= x <= upper):
+                continue
+            bin = <godot_int>((x - lower) / width)
+            if bin >= bins:
+                bin = bins - 1
+            counts_ptr[bin] += 1
+        gdapi10.{{ t.gd_pool }}_read_access_destroy(src_access)
+        gdapi10.godot_pool_real_array_write_access_destroy(edges_access)
+        gdapi10.godot_pool_int_array_write_access_destroy(counts_access)
+        return counts, edges
+{% endif %}
+{% endmacro %}
@@ -7,6 +7,7 @@
 # idea to make the `godot` module depend on it...
 include "_godot_editor.pxi"
 include "_godot_profiling.pxi"
+include "_godot_errors.pxi"
 include "_godot_script.pxi"
 include "_godot_instance.pxi"
 include "_godot_io.pxi"
@@ -16,7 +17,9 @@ from godot._hazmat.gdnative_api_struct cimport (
     godot_pluginscript_language_data,
 )
 from godot._hazmat.internal cimport set_pythonscript_verbose, get_pythonscript_verbose
+from godot._hazmat.conversion cimport set_strings_cache_max_length
 from godot.builtins cimport GDString
+from godot.bindings cimport _report_method_binds_resolution, _unregister_instance_binding_functions
 
 import sys
 
@@ -51,6 +54,12 @@ cdef api godot_pluginscript_language_data *pythonscript_init() with gil:
         # Godot print API is available until after the Python interpreter is teardown
         install_io_streams_capture()
 
+    # Minimal delay in seconds between two reports of the same error
+    set_error_report_rate_limit(float(_setup_config_entry("python_script/error_report_rate_limit", 1.0)))
+
+    # Cache short strings converted from Godot (e.g. names), 0 to disable
+    set_strings_cache_max_length(int(_setup_config_entry("python_script/strings_cache_max_length", 0)))
+
     # Enable verbose output from pythonscript framework
     if _setup_config_entry("python_script/verbose", False):
         set_pythonscript_verbose(True)
@@ -71,4 +80,8 @@ cdef api void pythonscript_finish(godot_pluginscript_language_data *data) with g
     # and might be running user-created threads doing concurrent stuff.
     # That will continue until `godot_gdnative_terminate` is called (which is
     # responsible for the actual teardown of the interpreter).
-    pass
+    if get_pythonscript_verbose():
+        _report_method_binds_resolution()
+    # Godot objects may outlive the interpreter, their wrappers bindings
+    # must not be freed through a Python callback once it is gone
+    _unregister_instance_binding_functions()
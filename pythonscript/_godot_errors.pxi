@@ -0,0 +1,69 @@
+# Report exceptions raised by Python code called from Godot.
+#
+# Callbacks such as `_process` are called every frame, so a bug in them
+# would print the same traceback over and over (each print going through
+# the stdout capture and Godot's console). Instead errors are deduplicated
+# by the code location that raised them and repeats are rate limited.
+
+import sys
+import traceback
+from time import monotonic
+
+from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
+
+
+# Minimal delay (in seconds) between two reports of errors raised from the
+# same code location, 0 to report every single error
+cdef double __error_report_rate_limit = 1.0
+# Maps error location to `[last report time, suppressed errors count]`
+cdef dict __error_reports = {}
+
+
+cdef void set_error_report_rate_limit(double seconds):
+    global __error_report_rate_limit
+    __error_report_rate_limit = seconds
+
+
+cdef void report_exception():
+    """
+    Report the exception currently being handled through Godot's error
+    system (so it shows up in the editor's debugger with file and line).
+    """
+    exc_type, exc, tb = sys.exc_info()
+    if exc_type is None:
+        return
+
+    # Error is located where it has been raised
+    last_tb = tb
+    while last_tb is not None and last_tb.tb_next is not None:
+        last_tb = last_tb.tb_next
+    if last_tb is not None:
+        code = last_tb.tb_frame.f_code
+        key = (exc_type, code, last_tb.tb_lineno)
+        function = code.co_name
+        filename = code.co_filename
+        line = last_tb.tb_lineno
+    else:
+        key = (exc_type, None, 0)
+        function = "<unknown>"
+        filename = "<unknown>"
+        line = 0
+
+    cdef double now = monotonic()
+    cdef list report = __error_reports.get(key)
+    cdef int suppressed = 0
+    if report is not None:
+        if now - <double>report[0] < __error_report_rate_limit:
+            report[1] += 1
+            return
+        suppressed = report[1]
+    __error_reports[key] = [now, 0]
+
+    description = "".join(traceback.format_exception(exc_type, exc, tb)).rstrip()
+    if suppressed:
+        description += f"\n(similar error occurred {suppressed} more times)"
+
+    cdef bytes raw_description = description.encode("utf8")
+    cdef bytes raw_function = function.encode("utf8")
+    cdef bytes raw_filename = filename.encode("utf8")
+    gdapi10.godot_print_error(raw_description, raw_function, raw_filename, line)
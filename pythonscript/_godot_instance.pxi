@@ -2,6 +2,7 @@
 
 from libc.stddef cimport wchar_t
 from cpython cimport Py_INCREF, Py_DECREF, PyObject
+from cpython.ref cimport Py_XDECREF
 
 from godot._hazmat.gdnative_api_struct cimport (
     godot_string,
@@ -20,26 +21,148 @@ from godot._hazmat.gdnative_api_struct cimport (
 )
 from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
 from godot._hazmat.conversion cimport (
+    godot_string_to_pyobj,
     godot_variant_to_pyobj,
     pyobj_to_godot_variant,
-    godot_string_name_to_pyobj,
 )
+from godot.bindings cimport Object, Reference, _set_object_wrapper
+from godot._hazmat.internal cimport (
+    ExposedClassInfo,
+    MethodDispatchEntry,
+    PropertyDispatchEntry,
+    ARG_TYPE_ANY,
+    ARG_TYPE_PYSTR,
+    TYPED_METHOD_MAX_ARGS,
+)
+
+
+cdef extern from *:
+    """
+    #if PY_VERSION_HEX < 0x03090000
+    #define __pythonscript_vectorcall _PyObject_Vectorcall
+    #else
+    #define __pythonscript_vectorcall PyObject_Vectorcall
+    #endif
+    """
+    object __pythonscript_vectorcall(object callable, PyObject **args, size_t nargsf, PyObject *kwnames)
+
+
+cdef class ScriptInstanceHolder:
+    """
+    Pluginscript instance data, links a Godot object to it Python instance.
+
+    A refcounted Godot object's Python instance owns a reference on it owner
+    (released when the Python instance is deallocated). On top of that, the
+    holder keeps the Python instance alive only as long as Godot has other
+    references on the owner. Once the Python instance is the last one
+    referencing the owner, the holder drops it strong reference so the pair
+    gets reclaimed as soon as Python (including the garbage collector for
+    reference cycles) doesn't use it anymore.
+    """
+    # Strong reference on the Python instance, None when only weakly held
+    cdef object instance
+    cdef PyObject *instance_ptr
+    cdef ExposedClassInfo info
+    cdef bint refcounted
+    # Strong reference is going to be dropped at the next safe point
+    cdef bint release_pending
+    # Python instance is being deallocated, it must not be accessed anymore
+    cdef bint dying
+
+
+# Dropping the Python instance can destroy the Godot object, which is not
+# possible from within Godot's refcount callbacks (the object is still in
+# use by the caller), hence the release is delayed to the next Godot -> Python call
+cdef list __instances_pending_release = []
+
+
+cdef void _release_pending_instances(ScriptInstanceHolder current):
+    global __instances_pending_release
+    cdef ScriptInstanceHolder holder
+    cdef list pending = __instances_pending_release
+    __instances_pending_release = []
+    for holder in pending:
+        if holder is current:
+            # Caller still uses the object, wait for another safe point
+            __instances_pending_release.append(holder)
+        elif holder.release_pending:
+            holder.release_pending = False
+            # From now on the Python instance is weakly held, this may
+            # deallocate it (and destroy it owner with it)
+            holder.instance = None
 
 
 cdef api godot_pluginscript_instance_data* pythonscript_instance_init(
     godot_pluginscript_script_data *p_data,
     godot_object *p_owner
 ) with gil:
-    cdef object instance = (<object>p_data)()
+    if __instances_pending_release:
+        _release_pending_instances(None)
+
+    cdef object cls = <object>p_data
+    cdef object instance = cls()
     (<Object>instance)._gd_ptr = p_owner
-    Py_INCREF(instance)
-    return <void *>instance
+    # Godot object crossing into Python now resolves into the script instance
+    _set_object_wrapper(instance)
+
+    cdef ScriptInstanceHolder holder = ScriptInstanceHolder.__new__(ScriptInstanceHolder)
+    holder.instance = instance
+    holder.instance_ptr = <PyObject*>instance
+    holder.info = <ExposedClassInfo>cls.__exposed_info
+    holder.info.live_instances += 1
+    if isinstance(instance, Reference):
+        # The script instance is not attached yet to the owner, hence this
+        # doesn't trigger `pythonscript_instance_refcount_incremented`
+        Reference.reference(instance)
+        holder.refcounted = True
+
+    Py_INCREF(holder)
+    return <void *>holder
 
 
 cdef api void pythonscript_instance_finish(
     godot_pluginscript_instance_data *p_data
 ) with gil:
-    Py_DECREF(<object>p_data)
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    holder.info.live_instances -= 1
+    if not holder.dying:
+        # The owner is being destroyed, so the Python instance should not
+        # try to access it (e.g. unreferencing it on deallocation)
+        (<Object><object>holder.instance_ptr)._gd_ptr = NULL
+        holder.release_pending = False
+        holder.instance = None
+    Py_DECREF(holder)
+
+
+cdef api void pythonscript_instance_refcount_incremented(
+    godot_pluginscript_instance_data *p_data
+) with gil:
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    if holder.release_pending:
+        # Godot references the owner again before we had time to drop the instance
+        holder.release_pending = False
+    elif holder.instance is None and not holder.dying:
+        holder.instance = <object>holder.instance_ptr
+
+
+cdef api godot_bool pythonscript_instance_refcount_decremented(
+    godot_pluginscript_instance_data *p_data
+) with gil:
+    # Godot only calls this when the refcount gets down to 1 or 0
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    if not holder.refcounted:
+        return True
+
+    if holder.instance is None:
+        # The Python instance is weakly held, so the last reference is the
+        # one it owns and it is released as part of it deallocation
+        holder.dying = True
+    elif not holder.release_pending:
+        # The Python instance is now the last one referencing the owner
+        holder.release_pending = True
+        __instances_pending_release.append(holder)
+
+    return True
 
 
 cdef api godot_bool pythonscript_instance_set_prop(
@@ -47,23 +170,20 @@ cdef api godot_bool pythonscript_instance_set_prop(
     const godot_string *p_name,
     const godot_variant *p_value
 ) with gil:
-    cdef object instance = <object>p_data
-    cdef str key = godot_string_to_pyobj(p_name)
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    cdef object instance = <object>holder.instance_ptr
 
     # Should look among properties added by the script and it parents,
     # not Godot native properties that are handled by the caller
-    try:
-        field = instance.__exported[key]
-    except KeyError:
-        return False
-    if not isinstance(field, ExportedField):
+    cdef PropertyDispatchEntry entry = holder.info.get_property(p_name)
+    if entry is None:
         return False
 
     try:
-        setattr(instance, key, godot_variant_to_pyobj(p_value))
+        entry.set(instance, godot_variant_to_pyobj(p_value))
         return True
     except Exception:
-        traceback.print_exc()
+        report_exception()
         return False
 
 
@@ -72,35 +192,115 @@ cdef api godot_bool pythonscript_instance_get_prop(
     const godot_string *p_name,
     godot_variant *r_ret
 ) with gil:
-    cdef object instance = <object>p_data
-    cdef object ret
-    cdef object field
-    cdef str key = godot_string_to_pyobj(p_name)
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    cdef object instance = <object>holder.instance_ptr
 
     # Should look among properties added by the script and it parents,
-    # not Godot native properties that are handled by the caller
-    try:
-        field = instance.__exported[key]
-    except KeyError:
+    # not Godot native properties that are handled by the caller.
+    # Note signals are not part of the properties table given there is no
+    # way to create a Variant::Signal from GDNative.
+    cdef PropertyDispatchEntry entry = holder.info.get_property(p_name)
+    if entry is None:
         return False
 
     try:
-        if isinstance(field, ExportedField):
-            ret = getattr(instance, godot_string_to_pyobj(p_name))
-            pyobj_to_godot_variant(ret, r_ret)
-        elif isinstance(field, SignalField):
-            # TODO: Not sure how to create a Variant::Signal from GDNative
-            return False
-        else:
-            # TODO: Not sure how to create a Variant::Callable from GDNative
-            return False
+        pyobj_to_godot_variant(entry.get(instance), r_ret)
         return True
-
     except Exception:
-        traceback.print_exc()
+        report_exception()
         return False
 
 
+cdef inline bint _is_arg_type_compatible(int expected, godot_variant_type actual):
+    if expected == ARG_TYPE_ANY:
+        return True
+    elif expected == ARG_TYPE_PYSTR:
+        return actual == godot_variant_type.GODOT_VARIANT_TYPE_STRING
+    elif expected == actual:
+        return True
+    # Same implicit conversions than Godot does when calling a typed function
+    elif expected == godot_variant_type.GODOT_VARIANT_TYPE_REAL:
+        return actual == godot_variant_type.GODOT_VARIANT_TYPE_INT
+    elif expected == godot_variant_type.GODOT_VARIANT_TYPE_OBJECT:
+        return actual == godot_variant_type.GODOT_VARIANT_TYPE_NIL
+    else:
+        return False
+
+
+cdef bint _check_typed_method_args(
+    MethodDispatchEntry entry,
+    const godot_variant **p_args,
+    int p_argcount,
+    godot_variant_call_error *r_error
+):
+    cdef int i
+    cdef int expected
+    if p_argcount > entry.max_args:
+        r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_TOO_MANY_ARGUMENTS
+        r_error.argument = entry.max_args
+        return False
+    if p_argcount < entry.min_args:
+        r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_TOO_FEW_ARGUMENTS
+        r_error.argument = entry.min_args
+        return False
+
+    for i in range(p_argcount):
+        expected = entry.arg_types[i]
+        if not _is_arg_type_compatible(expected, gdapi10.godot_variant_get_type(p_args[i])):
+            r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_ARGUMENT
+            r_error.argument = i
+            if expected == ARG_TYPE_PYSTR:
+                r_error.expected = godot_variant_type.GODOT_VARIANT_TYPE_STRING
+            else:
+                r_error.expected = <godot_variant_type>expected
+            return False
+
+    return True
+
+
+cdef inline object _unmarshall_typed_arg(int expected, const godot_variant *p_arg):
+    # Argument type has already been checked
+    cdef godot_string gdstr
+    if expected == godot_variant_type.GODOT_VARIANT_TYPE_REAL:
+        return gdapi10.godot_variant_as_real(p_arg)
+    elif expected == godot_variant_type.GODOT_VARIANT_TYPE_INT:
+        return gdapi10.godot_variant_as_int(p_arg)
+    elif expected == godot_variant_type.GODOT_VARIANT_TYPE_BOOL:
+        return True if gdapi10.godot_variant_as_bool(p_arg) else False
+    elif expected == ARG_TYPE_PYSTR:
+        gdstr = gdapi10.godot_variant_as_string(p_arg)
+        try:
+            return godot_string_to_pyobj(&gdstr)
+        finally:
+            gdapi10.godot_string_destroy(&gdstr)
+    else:
+        return godot_variant_to_pyobj(p_arg)
+
+
+cdef object _call_typed_method(
+    object instance,
+    MethodDispatchEntry entry,
+    const godot_variant **p_args,
+    int p_argcount
+):
+    # Arguments are passed as a C array to avoid building a list and a tuple
+    cdef PyObject *pyargs[1 + TYPED_METHOD_MAX_ARGS]
+    cdef object pyarg
+    cdef int converted = 0
+    cdef int i
+    pyargs[0] = <PyObject*>instance
+    try:
+        for i in range(p_argcount):
+            pyarg = _unmarshall_typed_arg(entry.arg_types[i], p_args[i])
+            Py_INCREF(pyarg)
+            pyargs[i + 1] = <PyObject*>pyarg
+            converted += 1
+        return __pythonscript_vectorcall(entry.fn, pyargs, p_argcount + 1, NULL)
+    finally:
+        for i in range(converted):
+            Py_XDECREF(pyargs[i + 1])
+
+
 cdef api godot_variant pythonscript_instance_call_method(
     godot_pluginscript_instance_data *p_data,
     const godot_string_name *p_method,
@@ -109,23 +309,33 @@ cdef api godot_variant pythonscript_instance_call_method(
     godot_variant_call_error *r_error
 ) with gil:
     cdef godot_variant var_ret
-    cdef object instance = <object>p_data
-    cdef object fn
-    cdef str key = godot_string_name_to_pyobj(p_method)
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    cdef object instance = <object>holder.instance_ptr
+    cdef MethodDispatchEntry entry = holder.info.get_method(p_method)
+    cdef object fn = entry.fn
 
-    # TODO: optimize this by caching godot_string_name -> method lookup
-    fn = instance.__exported.get(key)
-    if not callable(fn):
+    if __instances_pending_release:
+        _release_pending_instances(holder)
+
+    if fn is None:
         r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_METHOD
         gdapi10.godot_variant_new_nil(&var_ret)
         return var_ret
 
+    # Annotated methods have their arguments checked before any conversion
+    if entry.arg_types != NULL and not _check_typed_method_args(entry, p_args, p_argcount, r_error):
+        gdapi10.godot_variant_new_nil(&var_ret)
+        return var_ret
+
     cdef int i
     cdef list pyargs
     cdef object ret
     try:
-        pyargs = [godot_variant_to_pyobj(p_args[i]) for i in range(p_argcount)]
-        ret = fn(instance, *pyargs)
+        if entry.arg_types != NULL:
+            ret = _call_typed_method(instance, entry, p_args, p_argcount)
+        else:
+            pyargs = [godot_variant_to_pyobj(p_args[i]) for i in range(p_argcount)]
+            ret = fn(instance, *pyargs)
         r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_OK
         pyobj_to_godot_variant(ret, &var_ret)
         return var_ret
@@ -134,13 +344,13 @@ cdef api godot_variant pythonscript_instance_call_method(
         r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_METHOD
 
     except TypeError:
-        traceback.print_exc()
+        report_exception()
         # TODO: handle errors here
         r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_ARGUMENT
         r_error.argument = 1
         r_error.expected = godot_variant_type.GODOT_VARIANT_TYPE_NIL
     except Exception:
-        traceback.print_exc()
+        report_exception()
         r_error.error = godot_variant_call_error_error.GODOT_CALL_ERROR_CALL_ERROR_INVALID_METHOD
 
     # TODO: also catch other exceptions types ?
@@ -154,28 +364,20 @@ cdef api void pythonscript_instance_notification(
     godot_pluginscript_instance_data *p_data,
     int p_notification
 ) with gil:
-    cdef object instance = <object>p_data
-    # Godot's notification should call all parent `_notification`
-    # methods (better not use `super()._notification` in those methods...)
-    # TODO: cache the methods to call ?
-    for parentcls in instance.__class__.__mro__:
-        try:
-            fn = parentcls.__exported["_notification"]
-        except (AttributeError, KeyError):
-            pass
-        else:
-            fn(instance, p_notification)
-
-
-# Useful ?
+    cdef ScriptInstanceHolder holder = <ScriptInstanceHolder>p_data
+    # Handlers are computed once by `@exposed`
+    cdef ExposedClassInfo info = holder.info
+    if holder.dying or not info.notification_handlers:
+        return
+    if info.notification_mask is not None and p_notification not in info.notification_mask:
+        return
 
-# cdef api void pythonscript_instance_refcount_incremented(
-#     godot_pluginscript_instance_data *p_data
-# ) with gil:
-#     pass
+    if __instances_pending_release:
+        _release_pending_instances(holder)
 
-
-# cdef api bool pythonscript_instance_refcount_decremented(
-#     godot_pluginscript_instance_data *p_data
-# ) with gil:
-#     pass
+    cdef object instance = <object>holder.instance_ptr
+    try:
+        for fn in info.notification_handlers:
+            fn(instance, p_notification)
+    except Exception:
+        report_exception()
@@ -228,5 +228,8 @@ cdef api void pythonscript_script_finish(
     cdef object cls = <object>p_data
     if get_pythonscript_verbose():
         # Using print here will cause a crash on editor/game shutdown
-        sys.__stdout__.write(f"Destroying python script {cls.__name__}\n")
+        sys.__stdout__.write(
+            f"Destroying python script {cls.__name__}"
+            f" ({cls.__exposed_info.live_instances} live instances)\n"
+        )
     destroy_exposed_class(cls)
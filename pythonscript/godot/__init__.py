@@ -31,6 +31,7 @@ from godot.tags import (
     export,
     exposed,
 )
+from godot._hazmat.conversion import register_variant_converter
 from godot.pool_arrays import (
     PoolIntArray,
     PoolRealArray,
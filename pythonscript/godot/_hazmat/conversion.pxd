@@ -18,39 +18,72 @@ from godot.builtins cimport GDString, NodePath
 # The sad part is wchar_t is not portable: it is 16bits long on Windows and
 # 32bits long on Linux and MacOS...
 # So we end up with a UCS2 encoding on Windows and UCS4 everywhere else :'(
-IF UNAME_SYSNAME == "Windows":
-    # Specify endianess otherwise `encode` appends a BOM at the start of the converted string
-    DEF _STRING_ENCODING = "UTF-16-LE"
-    DEF _STRING_CODEPOINT_LENGTH = 2
-ELSE:
-    DEF _STRING_ENCODING = "UTF-32-LE"
-    DEF _STRING_CODEPOINT_LENGTH = 4
+# On UCS4 platforms the conversion is done straight from/to Python's
+# internal representation of the string (no intermediary bytes, no codec).
+cdef extern from "Python.h":
+    enum:
+        PyUnicode_4BYTE_KIND
+    int PyUnicode_KIND(object o)
+    void *PyUnicode_DATA(object o)
+    Py_UCS4 PyUnicode_READ(int kind, void *data, Py_ssize_t index)
+    Py_ssize_t PyUnicode_GET_LENGTH(object o)
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+    object PyUnicode_FromWideChar(const wchar_t *w, Py_ssize_t size)
+    Py_ssize_t PyUnicode_AsWideChar(object o, wchar_t *w, Py_ssize_t size) except -1
+    wchar_t *PyUnicode_AsWideCharString(object o, Py_ssize_t *size) except NULL
+    void PyMem_Free(void *p)
+
+
+# Strings up to this length are encoded on the stack
+DEF _STRING_STACK_BUFFER_LENGTH = 64
+
+# Strings up to this length are looked up into a cache when converted
+# from Godot to Python (0 to disable), so frequently used strings such as
+# names are not allocated each time
+cdef int __strings_cache_max_length
+
+
+cdef inline void set_strings_cache_max_length(int max_length):
+    global __strings_cache_max_length
+    __strings_cache_max_length = max_length
+
+
+cdef str _godot_wide_string_to_pyobj_cached(const wchar_t *raw, godot_int length)
+
+
+cdef inline str _godot_wide_string_to_pyobj(const wchar_t *raw, godot_int length):
+    IF UNAME_SYSNAME == "Windows":
+        return PyUnicode_FromWideChar(raw, length)
+    ELSE:
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, raw, length)
 
 
 cdef inline str godot_string_to_pyobj(const godot_string *p_gdstr):
-    # TODO: unicode&windows support is most likely broken...
-    cdef char *raw = <char*>gdapi10.godot_string_wide_str(p_gdstr)
+    cdef const wchar_t *raw = gdapi10.godot_string_wide_str(p_gdstr)
     cdef godot_int length = gdapi10.godot_string_length(p_gdstr)
-    return raw[:length * _STRING_CODEPOINT_LENGTH].decode(_STRING_ENCODING)
-
-    # cdef char *raw = <char*>gdapi10.godot_string_wide_str(p_gdstr)
-    # cdef godot_int length = gdapi10.godot_string_length(p_gdstr)
-    # printf("==========> godot_string_to_pyobj ")
-    # cdef int i
-    # for i in range(length):
-    #     printf("%c ", raw[i * 4]);
-    # printf("\n")
-    # cdef object ret = raw[:length * _STRING_CODEPOINT_LENGTH].decode(_STRING_ENCODING)
-    # print('==>ret: %r' % ret)
-    # return ret
+    if length <= __strings_cache_max_length:
+        return _godot_wide_string_to_pyobj_cached(raw, length)
+    return _godot_wide_string_to_pyobj(raw, length)
 
 
 cdef inline void pyobj_to_godot_string(str pystr, godot_string *p_gdstr):
-    # TODO: unicode&windows support is most likely broken...
-    cdef bytes raw = pystr.encode(_STRING_ENCODING)
-    gdapi10.godot_string_new_with_wide_string(
-        p_gdstr, (<wchar_t*><char*>raw), len(pystr)
-    )
+    cdef wchar_t buff[_STRING_STACK_BUFFER_LENGTH]
+    cdef wchar_t *heap_buff
+    cdef Py_ssize_t length = PyUnicode_GET_LENGTH(pystr)
+    IF UNAME_SYSNAME != "Windows":
+        if PyUnicode_KIND(pystr) == PyUnicode_4BYTE_KIND:
+            gdapi10.godot_string_new_with_wide_string(
+                p_gdstr, <wchar_t*>PyUnicode_DATA(pystr), length
+            )
+            return
+    # On Windows each character may need a surrogate pair
+    if length * 2 < _STRING_STACK_BUFFER_LENGTH:
+        length = PyUnicode_AsWideChar(pystr, buff, _STRING_STACK_BUFFER_LENGTH)
+        gdapi10.godot_string_new_with_wide_string(p_gdstr, buff, length)
+    else:
+        heap_buff = PyUnicode_AsWideCharString(pystr, &length)
+        gdapi10.godot_string_new_with_wide_string(p_gdstr, heap_buff, length)
+        PyMem_Free(heap_buff)
 
 
 cdef inline str godot_string_name_to_pyobj(const godot_string_name *p_gdname):
@@ -1,5 +1,8 @@
 from libc.stddef cimport wchar_t
 from libc.stdio cimport printf
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject
+from cpython.ref cimport Py_INCREF, Py_XDECREF
 
 from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
 from godot._hazmat.gdnative_api_struct cimport (
@@ -23,6 +26,7 @@ from godot.builtins cimport (
     Transform,
     Color,
     NodePath,
+    StringName,
     RID,
     Dictionary,
     Array,
@@ -39,6 +43,38 @@ from godot.builtins cimport (
 from warnings import warn
 
 
+cdef int __strings_cache_max_length = 0
+# Direct-mapped cache: a string replaces the one already in it slot
+DEF _STRINGS_CACHE_SIZE = 256  # Must be a power of 2
+cdef PyObject *__strings_cache[_STRINGS_CACHE_SIZE]
+
+
+cdef str _godot_wide_string_to_pyobj_cached(const wchar_t *raw, godot_int length):
+    cdef size_t str_hash = 5381
+    cdef godot_int i
+    for i in range(length):
+        str_hash = str_hash * 33 + <size_t>raw[i]
+    cdef size_t slot = str_hash & (_STRINGS_CACHE_SIZE - 1)
+
+    cdef PyObject *cached = __strings_cache[slot]
+    cdef int kind
+    cdef void *data
+    if cached != NULL and PyUnicode_GET_LENGTH(<object>cached) == length:
+        kind = PyUnicode_KIND(<object>cached)
+        data = PyUnicode_DATA(<object>cached)
+        for i in range(length):
+            if PyUnicode_READ(kind, data, i) != <Py_UCS4>raw[i]:
+                break
+        else:
+            return <str>cached
+
+    cdef str ret = _godot_wide_string_to_pyobj(raw, length)
+    Py_INCREF(ret)
+    __strings_cache[slot] = <PyObject *>ret
+    Py_XDECREF(cached)
+    return ret
+
+
 GD_PY_TYPES = (
     (godot_variant_type.GODOT_VARIANT_TYPE_NIL, type(None)),
     (godot_variant_type.GODOT_VARIANT_TYPE_BOOL, bool),
@@ -85,12 +121,85 @@ GD_PY_TYPES = (
 )
 
 
+# Python type -> conversion to Variant: a `godot_variant_type` for Godot
+# builtins (and Object) or one of the following special kinds
+cdef enum:
+    _VARIANT_KIND_UNSUPPORTED = -1
+    _VARIANT_KIND_PYSTR = -2
+    _VARIANT_KIND_CUSTOM = -3
+    _VARIANT_KIND_STRING_NAME = -4
+
+
+# Types with a known conversion, subclasses are resolved from their MRO
+cdef dict __base_variant_kinds = {py: gd for gd, py in GD_PY_TYPES}
+__base_variant_kinds[str] = _VARIANT_KIND_PYSTR
+# Godot 3 Variant has no StringName type, it is stored as a String
+__base_variant_kinds[StringName] = _VARIANT_KIND_STRING_NAME
+# Exact type -> variant kind, filled on the fly with the resolved subclasses
+cdef dict __variant_kinds = dict(__base_variant_kinds)
+cdef dict __gdtype_to_pytype = {gd: py for gd, py in GD_PY_TYPES}
+# Exact type -> `(converter, gdtype)` for types registered by the user
+# through `register_variant_converter` (and the resolved subclasses)
+cdef dict __registered_variant_converters = {}
+cdef dict __variant_converters = {}
+
+
+cdef int _resolve_variant_kind(object pytype):
+    # Slow path, only taken once per Python type
+    cdef object kind = _VARIANT_KIND_UNSUPPORTED
+    for base in pytype.__mro__:
+        kind = __base_variant_kinds.get(base)
+        if kind is not None:
+            if kind == _VARIANT_KIND_CUSTOM:
+                __variant_converters[pytype] = __registered_variant_converters[base]
+            break
+    else:
+        kind = _VARIANT_KIND_UNSUPPORTED
+    __variant_kinds[pytype] = kind
+    return kind
+
+
+cdef inline int _get_variant_kind(object pytype):
+    cdef PyObject *kind = PyDict_GetItem(__variant_kinds, pytype)
+    if kind == NULL:
+        return _resolve_variant_kind(pytype)
+    return <int><object>kind
+
+
+def register_variant_converter(pytype, converter, gdtype):
+    """
+    Register a `converter` callable used to convert objects of type `pytype`
+    (and it subclasses) into Godot's Variant. `converter` is called with the
+    object to convert and must return an object of type `gdtype` (e.g. `int`,
+    `Vector2`, `Dictionary`).
+    """
+    if not isinstance(pytype, type):
+        raise TypeError(f"{pytype!r} is not a type")
+    if not callable(converter):
+        raise TypeError(f"{converter!r} is not callable")
+    if __base_variant_kinds.get(pytype, _VARIANT_KIND_CUSTOM) != _VARIANT_KIND_CUSTOM:
+        raise ValueError(f"{pytype!r} type is already natively converted to Godot's Variant")
+    gdtype = GDString if gdtype is str else gdtype
+    # Converters cannot be chained
+    cdef int gdkind = _get_variant_kind(gdtype) if isinstance(gdtype, type) else _VARIANT_KIND_UNSUPPORTED
+    if gdkind < 0:
+        raise ValueError(f"{gdtype!r} type value not compatible with Godot")
+
+    __base_variant_kinds[pytype] = _VARIANT_KIND_CUSTOM
+    __registered_variant_converters[pytype] = (converter, gdkind)
+    # Registered type may change how already resolved subclasses are converted
+    __variant_kinds.clear()
+    __variant_kinds.update(__base_variant_kinds)
+    __variant_converters.clear()
+    __variant_converters.update(__registered_variant_converters)
+
+
 cdef bint is_pytype_compatible_with_godot_variant(object pytype):
-    return next((True for _, py in GD_PY_TYPES if py == pytype), issubclass(pytype, Object))
+    return isinstance(pytype, type) and _get_variant_kind(pytype) != _VARIANT_KIND_UNSUPPORTED
 
 
 cdef object godot_type_to_pytype(godot_variant_type gdtype):
-    cdef pytype = next((py for gd, py in GD_PY_TYPES if gd == gdtype), None)
+    cdef pytype = __gdtype_to_pytype.get(gdtype)
     if pytype is None:
         warn(f"No Python equivalent for Godot type `{gdtype}`")
         return None
@@ -99,15 +208,16 @@ cdef object godot_type_to_pytype(godot_variant_type gdtype):
 
 
 cdef godot_variant_type pytype_to_godot_type(object pytype):
-    cdef gdtype = next((gd for gd, py in GD_PY_TYPES if py == pytype), None)
-    if gdtype is None:
-        if issubclass(pytype, Object):
-            return godot_variant_type.GODOT_VARIANT_TYPE_OBJECT
-        else:
-            warn(f"No Godot equivalent for Python type `{pytype}`")
-            return godot_variant_type.GODOT_VARIANT_TYPE_NIL
-
-    return gdtype
+    cdef int kind = _get_variant_kind(pytype) if isinstance(pytype, type) else _VARIANT_KIND_UNSUPPORTED
+    if kind >= 0:
+        return <godot_variant_type>kind
+    elif kind == _VARIANT_KIND_PYSTR or kind == _VARIANT_KIND_STRING_NAME:
+        return godot_variant_type.GODOT_VARIANT_TYPE_STRING
+    elif kind == _VARIANT_KIND_CUSTOM:
+        return <godot_variant_type>(<int>__variant_converters[pytype][1])
+    else:
+        warn(f"No Godot equivalent for Python type `{pytype}`")
+        return godot_variant_type.GODOT_VARIANT_TYPE_NIL
 
 
 cdef object godot_variant_to_pyobj(const godot_variant *p_gdvar):
@@ -339,61 +449,69 @@ cdef inline PoolColorArray _godot_variant_to_pyobj_pool_color_array(const godot_
 
 
 cdef bint pyobj_to_godot_variant(object pyobj, godot_variant *p_var):
-    if pyobj is None:
+    # Dispatch on the exact type, subclasses are resolved only once
+    cdef int kind = _get_variant_kind(type(pyobj))
+    if kind == _VARIANT_KIND_CUSTOM:
+        pyobj = __variant_converters[type(pyobj)][0](pyobj)
+        kind = _get_variant_kind(type(pyobj))
+
+    if kind == godot_variant_type.GODOT_VARIANT_TYPE_NIL:
         gdapi10.godot_variant_new_nil(p_var)
-    elif isinstance(pyobj, bool):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_BOOL:
         gdapi10.godot_variant_new_bool(p_var, pyobj)
-    elif isinstance(pyobj, int):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_INT:
         gdapi10.godot_variant_new_int(p_var, pyobj)
-    elif isinstance(pyobj, float):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_REAL:
         gdapi10.godot_variant_new_real(p_var, pyobj)
-    elif isinstance(pyobj, str):
+    elif kind == _VARIANT_KIND_PYSTR:
         _pyobj_to_godot_variant_convert_string(pyobj, p_var)
-    elif isinstance(pyobj, GDString):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_STRING:
         gdapi10.godot_variant_new_string(p_var, &(<GDString>pyobj)._gd_data)
-    elif isinstance(pyobj, Vector2):
+    elif kind == _VARIANT_KIND_STRING_NAME:
+        _pyobj_to_godot_variant_convert_string_name(pyobj, p_var)
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_VECTOR2:
         gdapi10.godot_variant_new_vector2(p_var, &(<Vector2>pyobj)._gd_data)
-    elif isinstance(pyobj, Vector3):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_VECTOR3:
         gdapi10.godot_variant_new_vector3(p_var, &(<Vector3>pyobj)._gd_data)
-    elif isinstance(pyobj, Plane):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_PLANE:
         gdapi10.godot_variant_new_plane(p_var, &(<Plane>pyobj)._gd_data)
-    elif isinstance(pyobj, Quat):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_QUAT:
         gdapi10.godot_variant_new_quat(p_var, &(<Quat>pyobj)._gd_data)
-    elif isinstance(pyobj, AABB):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_AABB:
         gdapi10.godot_variant_new_aabb(p_var, &(<AABB>pyobj)._gd_data)
-    elif isinstance(pyobj, Basis):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_BASIS:
         gdapi10.godot_variant_new_basis(p_var, &(<Basis>pyobj)._gd_data)
-    elif isinstance(pyobj, Color):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_COLOR:
         gdapi10.godot_variant_new_color(p_var, &(<Color>pyobj)._gd_data)
-    elif isinstance(pyobj, NodePath):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_NODE_PATH:
         gdapi10.godot_variant_new_node_path(p_var, &(<NodePath>pyobj)._gd_data)
-    elif isinstance(pyobj, RID):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_RID:
         gdapi10.godot_variant_new_rid(p_var, &(<RID>pyobj)._gd_data)
-    elif isinstance(pyobj, Rect2):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_RECT2:
         gdapi10.godot_variant_new_rect2(p_var, &(<Rect2>pyobj)._gd_data)
-    elif isinstance(pyobj, Transform2D):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_TRANSFORM2D:
         gdapi10.godot_variant_new_transform2d(p_var, &(<Transform2D>pyobj)._gd_data)
-    elif isinstance(pyobj, Transform):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_TRANSFORM:
         gdapi10.godot_variant_new_transform(p_var, &(<Transform>pyobj)._gd_data)
-    elif isinstance(pyobj, Dictionary):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_DICTIONARY:
         gdapi10.godot_variant_new_dictionary(p_var, &(<Dictionary>pyobj)._gd_data)
-    elif isinstance(pyobj, Array):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_ARRAY:
         gdapi10.godot_variant_new_array(p_var, &(<Array>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolByteArray):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_BYTE_ARRAY:
         gdapi10.godot_variant_new_pool_byte_array(p_var, &(<PoolByteArray>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolIntArray):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_INT_ARRAY:
         gdapi10.godot_variant_new_pool_int_array(p_var, &(<PoolIntArray>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolRealArray):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_REAL_ARRAY:
         gdapi10.godot_variant_new_pool_real_array(p_var, &(<PoolRealArray>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolStringArray):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_STRING_ARRAY:
         gdapi10.godot_variant_new_pool_string_array(p_var, &(<PoolStringArray>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolVector2Array):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_VECTOR2_ARRAY:
         gdapi10.godot_variant_new_pool_vector2_array(p_var, &(<PoolVector2Array>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolVector3Array):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_VECTOR3_ARRAY:
         gdapi10.godot_variant_new_pool_vector3_array(p_var, &(<PoolVector3Array>pyobj)._gd_data)
-    elif isinstance(pyobj, PoolColorArray):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_POOL_COLOR_ARRAY:
         gdapi10.godot_variant_new_pool_color_array(p_var, &(<PoolColorArray>pyobj)._gd_data)
-    elif isinstance(pyobj, Object):
+    elif kind == godot_variant_type.GODOT_VARIANT_TYPE_OBJECT:
         gdapi10.godot_variant_new_object(p_var, (<Object>pyobj)._gd_ptr)
     else:
         warn(f"Cannot convert `{type(pyobj)}` to Godot's Variant")
@@ -412,23 +530,42 @@ cdef inline void _pyobj_to_godot_variant_convert_string(object pyobj, godot_vari
         gdapi10.godot_string_destroy(&gdstr)
 
 
+cdef inline void _pyobj_to_godot_variant_convert_string_name(StringName pyobj, godot_variant *p_var):
+    cdef godot_string gdstr = gdapi10.godot_string_name_get_name(&pyobj._gd_data)
+    gdapi10.godot_variant_new_string(p_var, &gdstr)
+    gdapi10.godot_string_destroy(&gdstr)
+
+
 cdef GDString ensure_is_gdstring(object gdstring_or_pystr):
-    cdef GDString gdstring_converted
-    try:
-        return <GDString?>gdstring_or_pystr
-    except TypeError:
-        try:
-            return GDString(gdstring_or_pystr)
-        except TypeError:
-            raise TypeError(f"Invalid value {gdstring_or_pystr!r}, must be str or GDString")
+    if isinstance(gdstring_or_pystr, GDString):
+        return <GDString>gdstring_or_pystr
+    elif isinstance(gdstring_or_pystr, str):
+        return GDString(gdstring_or_pystr)
+    elif isinstance(gdstring_or_pystr, StringName):
+        return (<StringName>gdstring_or_pystr).get_name()
+    else:
+        raise TypeError(f"Invalid value {gdstring_or_pystr!r}, must be str or GDString")
+
+
+# Parsing a node path is costly, so the most recently used ones are kept
+DEF _NODEPATH_CACHE_SIZE = 256
+# Ordered from least to most recently used
+cdef dict __nodepath_cache = {}
 
 
 cdef NodePath ensure_is_nodepath(object nodepath_or_pystr):
-    cdef NodePath NodePath_converted
-    try:
-        return <NodePath?>nodepath_or_pystr
-    except TypeError:
-        try:
-            return NodePath(nodepath_or_pystr)
-        except TypeError:
-            raise TypeError(f"Invalid value {nodepath_or_pystr!r}, must be str or NodePath")
+    cdef NodePath nodepath
+    if type(nodepath_or_pystr) is str:
+        nodepath = __nodepath_cache.pop(nodepath_or_pystr, None)
+        if nodepath is None:
+            nodepath = NodePath(nodepath_or_pystr)
+            if len(__nodepath_cache) >= _NODEPATH_CACHE_SIZE:
+                del __nodepath_cache[next(iter(__nodepath_cache))]
+        __nodepath_cache[nodepath_or_pystr] = nodepath
+        return nodepath
+    elif isinstance(nodepath_or_pystr, NodePath):
+        return <NodePath>nodepath_or_pystr
+    elif isinstance(nodepath_or_pystr, (str, GDString)):
+        return NodePath(nodepath_or_pystr)
+    else:
+        raise TypeError(f"Invalid value {nodepath_or_pystr!r}, must be str or NodePath")
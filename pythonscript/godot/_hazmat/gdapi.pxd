@@ -3,6 +3,7 @@ from godot._hazmat.gdnative_api_struct cimport (
     godot_gdnative_core_1_1_api_struct,
     godot_gdnative_core_1_2_api_struct,
     godot_gdnative_ext_nativescript_api_struct,
+    godot_gdnative_ext_nativescript_1_1_api_struct,
     godot_gdnative_ext_pluginscript_api_struct,
     godot_gdnative_ext_android_api_struct,
     godot_gdnative_ext_arvr_api_struct,
@@ -24,6 +25,7 @@ cdef extern from * nogil:
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_core_1_1_api_struct *pythonscript_gdapi11;
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_core_1_2_api_struct *pythonscript_gdapi12;
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_ext_nativescript_api_struct *pythonscript_gdapi_ext_nativescript;
+    PYTHONSCRIPT_IMPORT extern const godot_gdnative_ext_nativescript_1_1_api_struct *pythonscript_gdapi_ext_nativescript_1_1;
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_ext_pluginscript_api_struct *pythonscript_gdapi_ext_pluginscript;
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_ext_android_api_struct *pythonscript_gdapi_ext_android;
     PYTHONSCRIPT_IMPORT extern const godot_gdnative_ext_arvr_api_struct *pythonscript_gdapi_ext_arvr;
@@ -33,6 +35,7 @@ cdef extern from * nogil:
     cdef const godot_gdnative_core_1_1_api_struct *pythonscript_gdapi11
     cdef const godot_gdnative_core_1_2_api_struct *pythonscript_gdapi12
     cdef const godot_gdnative_ext_nativescript_api_struct *pythonscript_gdapi_ext_nativescript
+    cdef const godot_gdnative_ext_nativescript_1_1_api_struct *pythonscript_gdapi_ext_nativescript_1_1
     cdef const godot_gdnative_ext_pluginscript_api_struct *pythonscript_gdapi_ext_pluginscript
     cdef const godot_gdnative_ext_android_api_struct *pythonscript_gdapi_ext_android
     cdef const godot_gdnative_ext_arvr_api_struct *pythonscript_gdapi_ext_arvr
@@ -1,3 +1,6 @@
+from libc.stdint cimport uint32_t
+
+from godot._hazmat.gdnative_api_struct cimport godot_string, godot_string_name
 from godot.bindings cimport Object
 
 
@@ -13,6 +16,57 @@ cdef inline void set_pythonscript_verbose(bint status):
     __pythonscript_verbose = status
 
 
+# Special values (beside `godot_variant_type`) for typed method arguments
+cdef enum:
+    ARG_TYPE_ANY = -1  # No type annotation, use generic conversion
+    ARG_TYPE_PYSTR = -2  # Annotated as `str`, converted from a Godot string
+    TYPED_METHOD_MAX_ARGS = 16
+
+
+cdef class MethodDispatchEntry:
+    # Own reference on the StringName used as key in the dispatch table,
+    # this guarantees it unique data pointer won't be reused for another name
+    cdef godot_string_name name
+    cdef object fn
+    # Expected type of each argument (`godot_variant_type` or `ARG_TYPE_*`),
+    # NULL if the method should be called through the generic path
+    cdef int *arg_types
+    cdef int min_args
+    cdef int max_args
+
+
+cdef class PropertyDispatchEntry:
+    cdef godot_string gdname
+    cdef str name
+    cdef bint is_property
+    cdef object fget
+    cdef object fset
+
+    cdef object get(self, object instance)
+    cdef int set(self, object instance, object value) except -1
+
+
+cdef class ExposedClassInfo:
+    cdef dict exported
+    # Exported properties and their name's hash (same order)
+    cdef tuple properties
+    cdef uint32_t *properties_hash
+    # StringName's unique data pointer -> MethodDispatchEntry
+    cdef dict methods
+    # Method name -> (min args, expected types) for annotated methods
+    cdef dict typed_methods
+    # `_notification` methods to call (from child to parent classes)
+    cdef tuple notification_handlers
+    # Notifications the class handles, `None` if it handles them all
+    cdef frozenset notification_mask
+    # Number of Godot objects currently using the class as script (debug purpose)
+    cdef readonly int live_instances
+
+    cdef MethodDispatchEntry get_method(self, const godot_string_name *p_name)
+    cdef PropertyDispatchEntry get_property(self, const godot_string *p_name)
+    cdef void clear_caches(self)
+
+
 cdef object get_exposed_class(str module_name)
 cdef void set_exposed_class(object cls)
 cdef void destroy_exposed_class(object cls)
@@ -1,5 +1,9 @@
 import threading
 
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from godot._hazmat.gdnative_api_struct cimport godot_string, godot_string_name
+from godot._hazmat.gdapi cimport pythonscript_gdapi10 as gdapi10
+from godot._hazmat.conversion cimport godot_string_to_pyobj, pyobj_to_godot_string
 from godot.bindings cimport Object
 
 
@@ -15,6 +19,129 @@ cdef class ModExposedClass:
         self.refcount = 1
 
 
+cdef class MethodDispatchEntry:
+    def __dealloc__(self):
+        gdapi10.godot_string_name_destroy(&self.name)
+        PyMem_Free(self.arg_types)
+
+
+cdef class PropertyDispatchEntry:
+    def __init__(self, str name, object prop):
+        self.name = name
+        pyobj_to_godot_string(name, &self.gdname)
+        if prop is not None:
+            self.is_property = True
+            self.fget = prop.fget
+            self.fset = prop.fset
+
+    def __dealloc__(self):
+        gdapi10.godot_string_destroy(&self.gdname)
+
+    cdef object get(self, object instance):
+        if not self.is_property:
+            return getattr(instance, self.name)
+        return self.fget(instance)
+
+    cdef int set(self, object instance, object value) except -1:
+        if not self.is_property:
+            setattr(instance, self.name, value)
+        elif self.fset is None:
+            raise AttributeError(f"can't set attribute `{self.name}`")
+        else:
+            self.fset(instance, value)
+        return 0
+
+
+cdef class ExposedClassInfo:
+    """
+    Per-class lookup tables used by the Pluginscript callbacks to dispatch
+    calls from Godot without going through Python strings.
+    """
+
+    def __init__(
+        self,
+        object cls,
+        tuple notification_handlers=(),
+        object notification_mask=None,
+        object properties=(),
+        dict typed_methods=None,
+    ):
+        # Use getattr to avoid name mangling within the class body
+        self.exported = getattr(cls, "__exported")
+        self.methods = {}
+        self.typed_methods = typed_methods or {}
+        self.notification_handlers = notification_handlers
+        if notification_mask is not None:
+            self.notification_mask = frozenset(notification_mask)
+
+        cdef PropertyDispatchEntry entry
+        cdef Py_ssize_t i
+        self.properties = tuple(
+            PropertyDispatchEntry(name, prop) for name, prop in properties
+        )
+        self.properties_hash = <uint32_t*>PyMem_Malloc(
+            len(self.properties) * sizeof(uint32_t)
+        )
+        if self.properties_hash == NULL:
+            raise MemoryError()
+        for i, entry in enumerate(self.properties):
+            self.properties_hash[i] = gdapi10.godot_string_hash(&entry.gdname)
+
+    def __dealloc__(self):
+        PyMem_Free(self.properties_hash)
+
+    cdef PropertyDispatchEntry get_property(self, const godot_string *p_name):
+        # Godot asks for all the properties (including the native ones) the
+        # script may handle, so a miss must be cheap: no allocation, only a
+        # hash and a scan over the (few) exported properties
+        cdef uint32_t name_hash = gdapi10.godot_string_hash(p_name)
+        cdef PropertyDispatchEntry entry
+        cdef Py_ssize_t i
+        for i in range(len(self.properties)):
+            if self.properties_hash[i] == name_hash:
+                entry = <PropertyDispatchEntry>self.properties[i]
+                if gdapi10.godot_string_operator_equal(&entry.gdname, p_name):
+                    return entry
+        return None
+
+    cdef MethodDispatchEntry get_method(self, const godot_string_name *p_name):
+        # StringNames are interned by Godot, so the data pointer is enough to
+        # identify the name (as long as we keep a reference on it)
+        cdef size_t key = <size_t>gdapi10.godot_string_name_get_data_unique_pointer(p_name)
+        cdef MethodDispatchEntry entry = self.methods.get(key)
+        if entry is not None:
+            return entry
+
+        # Cache miss, slow path
+        cdef godot_string gdname = gdapi10.godot_string_name_get_name(p_name)
+        entry = MethodDispatchEntry.__new__(MethodDispatchEntry)
+        gdapi10.godot_string_name_new(&entry.name, &gdname)
+        name = godot_string_to_pyobj(&gdname)
+        gdapi10.godot_string_destroy(&gdname)
+        fn = self.exported.get(name)
+        # Unknown methods are also cached (with `fn` set to None) given
+        # Godot blindly calls `_process`, `_input` etc. on all scripts
+        entry.fn = fn if callable(fn) else None
+
+        cdef int i
+        typed = self.typed_methods.get(name)
+        if entry.fn is not None and typed is not None:
+            min_args, arg_types = typed
+            entry.min_args = min_args
+            entry.max_args = len(arg_types)
+            entry.arg_types = <int*>PyMem_Malloc(entry.max_args * sizeof(int))
+            if entry.arg_types == NULL:
+                raise MemoryError()
+            for i in range(entry.max_args):
+                entry.arg_types[i] = arg_types[i]
+
+        self.methods[key] = entry
+        return entry
+
+    cdef void clear_caches(self):
+        self.methods.clear()
+
+
 # /!\ Those containers are strictly private /!\
 # They contain class objects that are referenced from Godot without refcounting,
 # so droping an item from there will likely cause a segfault !
@@ -70,6 +197,10 @@ cdef void destroy_exposed_class(object cls):
     # Use a threadlock to avoid data races in case godot loads/unloads scripts in multiple threads
     with __exposed_classes_lock:
 
+        # Instances of the class may outlive this call, so the caches are
+        # only dropped (they will be rebuilt on demand) and not disabled
+        (<ExposedClassInfo>cls.__exposed_info).clear_caches()
+
         try:
             mod = __modules_with_exposed_class[modname]
         except KeyError:
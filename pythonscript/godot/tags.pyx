@@ -1,5 +1,6 @@
 import builtins
 import enum
+import inspect
 
 from godot._hazmat.gdnative_api_struct cimport (
     godot_method_rpc_mode,
@@ -13,8 +14,16 @@ from godot._hazmat.conversion cimport (
     is_pytype_compatible_with_godot_variant,
     pyobj_to_godot_variant,
     godot_variant_to_pyobj,
+    pytype_to_godot_type,
+)
+from godot._hazmat.internal cimport (
+    get_exposed_class,
+    set_exposed_class,
+    ExposedClassInfo,
+    ARG_TYPE_ANY,
+    ARG_TYPE_PYSTR,
+    TYPED_METHOD_MAX_ARGS,
 )
-from godot._hazmat.internal cimport get_exposed_class, set_exposed_class
 from godot.builtins cimport Array, Dictionary, GDString
 from godot.bindings cimport Object, Resource
 
@@ -274,18 +283,109 @@ def export(
     )
 
 
-def exposed(cls=None, tool=False):
+cdef int _annotation_to_arg_type(object annotation):
+    if annotation is str:
+        return ARG_TYPE_PYSTR
+    elif annotation is list:
+        annotation = Array
+    elif annotation is dict:
+        annotation = Dictionary
+    if isinstance(annotation, type) and is_pytype_compatible_with_godot_variant(annotation):
+        return pytype_to_godot_type(annotation)
+    # typing constructs, string annotations etc.
+    return ARG_TYPE_ANY
+
+
+cdef object _build_typed_method_signature(object fn):
+    # Only annotated methods with a simple signature (i.e. no `*args` or
+    # mandatory keyword-only arguments) get typed arguments unmarshalling
+    if not inspect.isfunction(fn) or not fn.__annotations__:
+        return None
+
+    cdef int min_args = 0
+    arg_types = []
+    # Skip `self`
+    for param in list(inspect.signature(fn).parameters.values())[1:]:
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            if param.default is param.empty:
+                min_args += 1
+            arg_types.append(_annotation_to_arg_type(param.annotation))
+        elif param.kind == param.VAR_KEYWORD or (
+            param.kind == param.KEYWORD_ONLY and param.default is not param.empty
+        ):
+            continue
+        else:
+            return None
+
+    if len(arg_types) > TYPED_METHOD_MAX_ARGS or all(t == ARG_TYPE_ANY for t in arg_types):
+        return None
+    return (min_args, tuple(arg_types))
+
+
+def _replace_class_cell(object obj, object old_cls, object new_cls):
+    # Zero-argument `super()` relies on a `__class__` cell referencing the
+    # class the function has been defined in
+    if isinstance(obj, ExportedField):
+        obj = obj.property
+    if isinstance(obj, (classmethod, staticmethod)):
+        obj = obj.__func__
+    if isinstance(obj, builtins.property):
+        for fn in (obj.fget, obj.fset, obj.fdel):
+            _replace_class_cell(fn, old_cls, new_cls)
+        return
+    for cell in getattr(obj, "__closure__", None) or ():
+        try:
+            if cell.cell_contents is old_cls:
+                cell.cell_contents = new_cls
+        except ValueError:  # Empty cell
+            pass
+
+
+def _build_slotted_class(object cls, list fields):
+    # `__slots__` cannot be added to an existing class, so we have to create
+    # a new one with the same content
+    cls_dict = dict(cls.__dict__)
+    user_slots = cls_dict.pop("__slots__", ())
+    if isinstance(user_slots, str):
+        user_slots = (user_slots, )
+    # Slot descriptors are created by `type()` and would conflict with the new slots
+    for k in (*fields, *user_slots, "__dict__", "__weakref__"):
+        cls_dict.pop(k, None)
+    cls_dict["__slots__"] = (*fields, *user_slots)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    for v in cls_dict.values():
+        _replace_class_cell(v, cls, new_cls)
+    return new_cls
+
+
+def exposed(cls=None, tool=False, notifications=None, slots=False):
     """
     Decorator used to mark a class as beeing exposed to Godot (hence making
     it available from other Godot languages and the Godot IDE).
     Due to how Godot identifiest classes by their file pathes, only a single
     class can be marked with this decorator per file.
 
+    `notifications` can be used to provide the notification ids handled by
+    the class' `_notification` methods, other notifications are then filtered
+    out before reaching Python.
+
+    `slots` makes the exported attributes (and the names listed in the class'
+    `__slots__` if any) stored in `__slots__` instead of the instance
+    `__dict__`, hence reducing memory usage. Note this means the class is
+    replaced by a new one, and that (unless a parent class provides a
+    `__dict__`) no other attribute can be set on the instances.
+
     usage::
 
         @exposed
         class CustomObject(godot.bindings.Object):
             pass
+
+        @exposed(notifications=[Node.NOTIFICATION_READY])
+        class CustomNode(godot.bindings.Node):
+            def _notification(self, what):
+                pass
     """
     def wrapper(cls):
         if not issubclass(cls, Object):
@@ -301,6 +401,14 @@ def exposed(cls=None, tool=False):
                 f" (already got {existing_cls_for_module!r})"
             )
 
+        # Exported attributes are replaced by slots descriptors in slots mode
+        members = dict(cls.__dict__)
+        if slots:
+            cls = _build_slotted_class(cls, [
+                k for k, v in members.items()
+                if isinstance(v, ExportedField) and not v.property
+            ])
+
         cls.__tool = tool
         cls.__exposed_python_class = True
         cls.__exported = {}
@@ -309,10 +417,8 @@ def exposed(cls=None, tool=False):
         for b in cls.__bases__:
             cls.__exported.update(getattr(b, "__exported", {}))
 
-        init_func_code = "def __init__(self):\n    pass\n"
-
         # Collect exported stuff: attributes (marked with @exported), properties, signals, and methods
-        for k, v in cls.__dict__.items():
+        for k, v in members.items():
             if isinstance(v, ExportedField):
                 cls.__exported[k] = v
                 v.name = k  # hard to bind this earlier...
@@ -320,12 +426,6 @@ def exposed(cls=None, tool=False):
                     # If export has been used to decorate a property, expose it
                     # in the generated class
                     setattr(cls, k, v.property)
-                else:
-                    # Otherwise, the value must be initialized as part of __init__
-                    if v.default is None or isinstance(v.default, (int, float, bool)):
-                        init_func_code += f"    self.{k} = {repr(v.default)}\n"
-                    else:
-                        init_func_code += f"    self.{k} = self.__exported['{k}'].default\n"
             elif isinstance(v, SignalField):
                 v.name = v.name or k
                 cls.__exported[v.name] = v
@@ -336,8 +436,21 @@ def exposed(cls=None, tool=False):
         # Overwrite parent __init__ to avoid creating a Godot object given
         # exported script are always initialized with an existing Godot object
         # On top of that, we must initialize the attributes defined in the class
-        # and it parents
-        g = {}
+        # and it parents (properties excepted). Default values are computed
+        # once and assigned in a single tuple unpacking.
+        fields = {
+            k: v.default
+            for k, v in cls.__exported.items()
+            if isinstance(v, ExportedField) and not v.property
+        }
+        if fields:
+            init_func_code = (
+                "def __init__(self):\n"
+                f"    {', '.join(f'self.{k}' for k in fields)}, = __defaults\n"
+            )
+        else:
+            init_func_code = "def __init__(self):\n    pass\n"
+        g = {"__defaults": tuple(fields.values())}
         exec(init_func_code, g)
         cls.__init__ = g["__init__"]
         # Also overwrite parent new otherwise we would return an instance
@@ -357,6 +470,39 @@ def exposed(cls=None, tool=False):
             # # instance.set_script(???)
         cls.new = new
 
+        # Godot's notification should call all parent `_notification`
+        # methods (better not use `super()._notification` in those methods...)
+        notification_handlers = []
+        for parentcls in cls.__mro__:
+            fn = getattr(parentcls, "__exported", {}).get("_notification")
+            # Exported stuff is inherited, so the same method can show up
+            # multiple times in the MRO
+            if fn is not None and fn not in notification_handlers:
+                notification_handlers.append(fn)
+
+        # Resolve now how each exported property is accessed (i.e. through
+        # a Python property or as a regular attribute)
+        properties = []
+        for k, v in cls.__exported.items():
+            if not isinstance(v, ExportedField):
+                continue
+            for parentcls in cls.__mro__:
+                attr = parentcls.__dict__.get(k)
+                if attr is not None:
+                    break
+            properties.append((k, attr if isinstance(attr, builtins.property) else None))
+
+        # Annotated methods get their arguments checked and converted
+        # according to the annotations when called from Godot
+        typed_methods = {}
+        for k, v in cls.__exported.items():
+            typed = _build_typed_method_signature(v)
+            if typed is not None:
+                typed_methods[k] = typed
+
+        cls.__exposed_info = ExposedClassInfo(
+            cls, tuple(notification_handlers), notifications, properties, typed_methods
+        )
         set_exposed_class(cls)
         return cls
 
@@ -78,6 +78,7 @@ PYTHONSCRIPT_EXPORT const godot_gdnative_core_api_struct *pythonscript_gdapi10 =
 PYTHONSCRIPT_EXPORT const godot_gdnative_core_1_1_api_struct *pythonscript_gdapi11 = NULL;
 PYTHONSCRIPT_EXPORT const godot_gdnative_core_1_2_api_struct *pythonscript_gdapi12 = NULL;
 PYTHONSCRIPT_EXPORT const godot_gdnative_ext_nativescript_api_struct *pythonscript_gdapi_ext_nativescript = NULL;
+PYTHONSCRIPT_EXPORT const godot_gdnative_ext_nativescript_1_1_api_struct *pythonscript_gdapi_ext_nativescript_1_1 = NULL;
 PYTHONSCRIPT_EXPORT const godot_gdnative_ext_pluginscript_api_struct *pythonscript_gdapi_ext_pluginscript = NULL;
 PYTHONSCRIPT_EXPORT const godot_gdnative_ext_android_api_struct *pythonscript_gdapi_ext_android = NULL;
 PYTHONSCRIPT_EXPORT const godot_gdnative_ext_arvr_api_struct *pythonscript_gdapi_ext_arvr = NULL;
@@ -97,6 +98,9 @@ static void _register_gdapi(const godot_gdnative_init_options *options) {
         switch (ext->type) {
             case GDNATIVE_EXT_NATIVESCRIPT:
                 pythonscript_gdapi_ext_nativescript = (const godot_gdnative_ext_nativescript_api_struct *)ext;
+                if (ext->next) {
+                    pythonscript_gdapi_ext_nativescript_1_1 = (const godot_gdnative_ext_nativescript_1_1_api_struct *)ext->next;
+                }
                 break;
             case GDNATIVE_EXT_PLUGINSCRIPT:
                 pythonscript_gdapi_ext_pluginscript = (const godot_gdnative_ext_pluginscript_api_struct *)ext;
@@ -218,8 +222,8 @@ GDN_EXPORT void godot_gdnative_init(godot_gdnative_init_options *options) {
     desc.script_desc.instance_desc.get_prop = pythonscript_instance_get_prop;
     desc.script_desc.instance_desc.call_method = pythonscript_instance_call_method;
     desc.script_desc.instance_desc.notification = pythonscript_instance_notification;
-    desc.script_desc.instance_desc.refcount_incremented = NULL;
-    desc.script_desc.instance_desc.refcount_decremented = NULL;
+    desc.script_desc.instance_desc.refcount_incremented = pythonscript_instance_refcount_incremented;
+    desc.script_desc.instance_desc.refcount_decremented = pythonscript_instance_refcount_decremented;
 
     if (options->in_editor) {
 
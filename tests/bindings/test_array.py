@@ -3,6 +3,7 @@ import pytest
 from godot import (
     GDString,
     Array,
+    Dictionary,
     Vector2,
     PoolColorArray,
     PoolVector3Array,
@@ -15,6 +16,7 @@ from godot import (
     Resource,
     Area2D,
     OS,
+    register_variant_converter,
 )
 
 
@@ -283,6 +285,81 @@ def test_outofrange_delitem():
         del v[2]
 
 
+@pytest.mark.parametrize(
+    "slice_,new_vals",
+    [
+        (slice(1, 3), ["bar", 42]),
+        (slice(1, 3), []),
+        (slice(1, 3), [1, 2, 3, 4]),
+        (slice(None, None), [None]),
+        (slice(4, 4), (1, 2)),
+        (slice(10, None), [OS]),
+        (slice(None, None, 2), [1, 2]),
+        (slice(None, None, -2), [1, "bar"]),
+    ],
+)
+def test_setitem_slice(slice_, new_vals):
+    vals = [GDString("foo"), 0, OS, False]
+    arr = Array(vals)
+    vals[slice_] = [GDString(x) if isinstance(x, str) else x for x in new_vals]
+    arr[slice_] = new_vals
+    assert list(arr) == vals
+    arr = Array([GDString("foo"), 0, OS, False])
+    arr[slice_] = Array(new_vals)
+    assert list(arr) == vals
+
+
+def test_setitem_slice_self():
+    arr = Array(["foo", 0, OS])
+    arr[1:2] = arr
+    assert list(arr) == [GDString("foo"), GDString("foo"), 0, OS, OS]
+
+
+class Unconvertible:
+    pass
+
+
+def _fail_conversion(value):
+    raise RuntimeError("Cannot convert")
+
+
+register_variant_converter(Unconvertible, _fail_conversion, int)
+
+
+def test_setitem_slice_conversion_error():
+    arr = Array(["foo", 0, OS])
+    with pytest.raises(RuntimeError):
+        arr[1:2] = [1, Unconvertible()]
+    assert list(arr) == [GDString("foo"), 0, OS]
+
+
+def test_setitem_bad_extended_slice():
+    arr = Array(["foo", 0, OS])
+    with pytest.raises(ValueError):
+        arr[::2] = [1, 2, 3]
+    assert list(arr) == [GDString("foo"), 0, OS]
+
+
+@pytest.mark.parametrize(
+    "slice_",
+    [
+        slice(1, 3),
+        slice(3, 1),
+        slice(None, None),
+        slice(None, None, 2),
+        slice(1, None, 3),
+        slice(None, None, -2),
+        slice(-1, 1, -1),
+    ],
+)
+def test_delitem_slice(slice_):
+    vals = [GDString("foo"), 0, OS, False, 4.5, None]
+    arr = Array(vals)
+    del vals[slice_]
+    del arr[slice_]
+    assert list(arr) == vals
+
+
 def test_iter():
     items = [GDString("foo"), 0, OS]
     v = Array(items)
@@ -297,3 +374,70 @@ def test_append():
         v.append(item)
     assert len(v) == 3
     assert v == Array(items)
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_to_list(deep):
+    inner = Array([1, Dictionary({"a": Array([2])})])
+    v = Array(["foo", inner, Vector2(1, 2)])
+    items = v.to_list(deep=deep)
+    assert type(items) is list
+    assert items[0] == GDString("foo")
+    assert items[2] == Vector2(1, 2)
+    if deep:
+        assert items[1] == [1, {GDString("a"): [2]}]
+    else:
+        assert items[1] == inner
+
+
+def test_to_list_gdstring_as_str():
+    v = Array(["foo", Array(["bar"])])
+    items = v.to_list(deep=True, gdstring_as_str=True)
+    assert items == ["foo", ["bar"]]
+    assert type(items[0]) is str
+
+
+def test_from_list():
+    v = Array.from_list([1, "foo", [2, (3,)], {"a": [4]}])
+    assert len(v) == 4
+    assert v[:2] == Array([1, "foo"])
+    assert v[2] == Array([2, Array([3])])
+    assert isinstance(v[3], Dictionary)
+    assert v[3]["a"] == Array([4])
+    assert Array.from_list([]) == Array()
+
+
+def test_sort():
+    arr = Array([3, 1, 2])
+    arr.sort()
+    assert list(arr) == [1, 2, 3]
+    arr.sort(reverse=True)
+    assert list(arr) == [3, 2, 1]
+
+
+def test_sort_key():
+    calls = []
+
+    def key(item):
+        calls.append(item)
+        return -item[0]
+
+    items = [Array([1, "a"]), Array([3, "b"]), Array([2, "c"]), Array([3, "d"])]
+    arr = Array(items)
+    arr.sort(key=key)
+    # Key is called once per item, sort is stable
+    assert len(calls) == 4
+    assert [x[1] for x in arr] == [GDString(x) for x in "bdca"]
+    arr.sort(key=lambda x: x[0], reverse=True)
+    assert [x[1] for x in arr] == [GDString(x) for x in "bdca"]
+
+
+def test_sort_key_modified():
+    arr = Array([1, 2, 3])
+
+    def key(item):
+        arr.append(item)
+        return item
+
+    with pytest.raises(ValueError):
+        arr.sort(key=key)
@@ -1,6 +1,6 @@
 import pytest
 
-from godot import Basis, Vector3, Quat
+from godot import Basis, Vector3, Quat, PoolVector3Array
 
 
 def test_default():
@@ -155,3 +155,18 @@ def test_bad_properties(field, bad_value):
     v = Basis()
     with pytest.raises(TypeError):
         setattr(v, field, bad_value)
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_xform_array(inverse):
+    b = Basis.from_euler(Vector3(0.3, -0.2, 1.0))
+    points = [Vector3(1, 0, 0), Vector3(-1, 2, 5)]
+    if inverse:
+        ret = b.xform_inv_array(PoolVector3Array(points))
+        expected = [b.xform_inv(p) for p in points]
+    else:
+        ret = b.xform_array(PoolVector3Array(points))
+        expected = [b.xform(p) for p in points]
+    assert [(v.x, v.y, v.z) for v in ret] == pytest.approx(
+        [(v.x, v.y, v.z) for v in expected], abs=1e-5
+    )
@@ -1,9 +1,11 @@
 import pytest
+from enum import IntFlag
 from math import inf
 from struct import unpack
 
 import godot
 from godot import (
+    Vector2,
     Vector3,
     GDString,
     NodePath,
@@ -12,6 +14,7 @@ from godot import (
     CanvasItem,
     Node2D,
     PluginScript,
+    SpatialMaterial,
     OpenSimplexNoise,
     OS,
     Error,
@@ -124,6 +127,27 @@ def test_call_returns_enum(generate_obj):
     assert isinstance(ret, Error)
 
 
+def test_class_enum():
+    flags = Object.ConnectFlags
+    assert issubclass(flags, IntFlag)
+    assert flags.CONNECT_DEFERRED == 1
+    # Enum is only built once and shared with the subclasses
+    assert Object.ConnectFlags is flags
+    assert Node.ConnectFlags is flags
+
+
+def test_call_varargs(generate_obj):
+    node = generate_obj(Node)
+    node.call("set_name", "foo")
+    assert str(node.call("get_name")) == "foo"
+    assert node.call("has_method", "call") is True
+    # More arguments than what fits on the stack
+    with pytest.raises(TypeError):
+        node.call("get_name", *range(20))
+    with pytest.raises(TypeError):
+        node.call(42)
+
+
 def test_call_with_kwargs(generate_obj):
     node = generate_obj(Node)
     child = generate_obj(Node)
@@ -160,6 +184,37 @@ def test_inheritance(generate_obj):
         assert isinstance(node2d, Node)
 
 
+def test_call_returns_actual_class(generate_obj):
+    node = generate_obj(Node)
+    child = generate_obj(CanvasItem)
+    node.add_child(child)
+    # Second time uses the cached class resolution
+    for _ in range(2):
+        assert type(node.get_child(0)) is CanvasItem
+        (from_variant,) = node.get_children()
+        assert type(from_variant) is CanvasItem
+
+
+def test_wrapper_identity(generate_obj):
+    node = generate_obj(Node)
+    child = generate_obj(Node)
+    node.add_child(child)
+    assert node.get_child(0) is child
+    (from_variant,) = node.get_children()
+    assert from_variant is child
+    assert child.get_parent() is node
+    assert {node, child, node.get_child(0)} == {node, child}
+
+
+def test_script_instance_identity(current_node):
+    assert current_node.get_parent().get_child(current_node.get_index()) is current_node
+
+
+def test_refcounted_wrapper_identity(current_node):
+    script = current_node.get_script()
+    assert current_node.get_script() is script
+
+
 def test_call_with_refcounted_return_value(current_node):
     script = current_node.get_script()
     assert isinstance(script, PluginScript)
@@ -178,6 +233,24 @@ def test_access_property(generate_obj):
     assert node._import_path == path
 
 
+def test_access_property_with_typed_setter(generate_obj):
+    node = generate_obj(Node2D)
+    node.position = Vector2(1, 2)
+    assert node.position == Vector2(1, 2)
+    assert node.get_position() == Vector2(1, 2)
+    with pytest.raises(TypeError):
+        node.position = None
+
+
+def test_access_indexed_property():
+    # Property getter and setter take the flag index as first parameter
+    material = SpatialMaterial()
+    material.flags_unshaded = True
+    assert material.flags_unshaded
+    assert material.get_flag(SpatialMaterial.Flags.FLAG_UNSHADED)
+    assert not material.flags_transparent
+
+
 @pytest.mark.xfail(reason="Create Python class from Python not implemented yet")
 def test_new_on_overloaded_class(generate_obj):
     node = generate_obj(virtualtestbedcls)
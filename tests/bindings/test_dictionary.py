@@ -224,3 +224,31 @@ def test_duplicate(deep):
     else:
         assert d1 == Dictionary({0: Dictionary({0: 0, 1: 1, 2: 2})})
         assert d2 == d1
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_to_dict(deep):
+    inner = Array([1, Dictionary({2: 3})])
+    d = Dictionary({"a": inner, 4: Vector2(1, 2)})
+    items = d.to_dict(deep=deep)
+    assert type(items) is dict
+    assert items[4] == Vector2(1, 2)
+    if deep:
+        assert items[GDString("a")] == [1, {2: 3}]
+    else:
+        assert items[GDString("a")] == inner
+
+
+def test_to_dict_gdstring_as_str():
+    d = Dictionary({"a": "b"})
+    assert d.to_dict(gdstring_as_str=True) == {"a": "b"}
+
+
+def test_from_dict():
+    d = Dictionary.from_dict({"a": [1, {"b": 2}], 3: 4})
+    assert len(d) == 2
+    assert d[3] == 4
+    assert isinstance(d["a"], Array)
+    assert d["a"][0] == 1
+    assert isinstance(d["a"][1], Dictionary)
+    assert d["a"][1]["b"] == 2
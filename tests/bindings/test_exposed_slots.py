@@ -0,0 +1,49 @@
+import pytest
+
+from godot import GDString, Node, exposed, export
+
+
+@exposed(slots=True)
+class SlottedNode(Node):
+    __slots__ = ("not_exported",)
+
+    int_attr = export(int, default=42)
+    str_attr = export(str, default="foo")
+
+    @export(int)
+    @property
+    def prop(self):
+        return self.int_attr
+
+    def get_class_from_super(self):
+        # Zero-argument `super()` must work with the rebuilt class
+        return super().__thisclass__
+
+
+def build_slotted_node():
+    # Python script cannot be instantiated from Python yet, so no Godot
+    # object is involved here
+    node = SlottedNode.__new__(SlottedNode)
+    node.__init__()
+    return node
+
+
+def test_exposed_slots_init():
+    node = build_slotted_node()
+    assert node.int_attr == 42
+    assert node.str_attr == GDString("foo")
+    assert node.prop == 42
+
+
+def test_exposed_slots_no_dict():
+    node = build_slotted_node()
+    assert not hasattr(node, "__dict__")
+    node.not_exported = 1
+    assert node.not_exported == 1
+    with pytest.raises(AttributeError):
+        node.unknown_attr = 1
+
+
+def test_exposed_slots_super():
+    node = build_slotted_node()
+    assert node.get_class_from_super() is SlottedNode
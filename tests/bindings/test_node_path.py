@@ -1,6 +1,6 @@
 import pytest
 
-from godot import Vector3, NodePath, GDString
+from godot import Vector3, NodePath, GDString, Node
 
 
 def test_init():
@@ -82,3 +82,16 @@ def test_as_binding_param(current_node):
 
     assert root.has_node(path) is True
     assert root.has_node(dummy_path) is False
+
+
+def test_str_argument(generate_obj):
+    parent = generate_obj(Node)
+    child = generate_obj(Node)
+    child.set_name("child")
+    parent.add_child(child)
+    # Plain str is converted into a node path without Python wrapper
+    for _ in range(2):
+        assert parent.get_node("child") == child
+        assert parent.has_node("child")
+        assert not parent.has_node("missing")
+    assert parent.get_node(NodePath("child")) == child
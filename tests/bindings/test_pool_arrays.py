@@ -1,6 +1,9 @@
 import sys
+import ctypes
 import pytest
 from random import Random
+from bisect import bisect_left, bisect_right
+from array import array
 from inspect import isfunction
 from functools import partial
 
@@ -17,6 +20,8 @@ from godot import (
     PoolVector3Array,
     PoolColorArray,
     PoolStringArray,
+    Rect2,
+    AABB,
     Node,
 )
 
@@ -119,6 +124,15 @@ def pool_x_array(request):
     return request.param()
 
 
+@pytest.fixture(
+    scope="module",
+    ids=lambda x: x.cls.__name__,
+    params=[PoolIntArrayBench, PoolRealArrayBench, PoolStringArrayBench],
+)
+def sortable_pool_x_array(request):
+    return request.param()
+
+
 def test_empty_init(pool_x_array):
     v1 = pool_x_array.cls()
     v2 = pool_x_array.cls()
@@ -224,7 +238,19 @@ def test_bad_equal(pool_x_array, arg):
     assert pool != other
 
 
+def test_extend(pool_x_array):
+    v0 = pool_x_array.generate_values(2)
+    arr = pool_x_array.cls(v0)
+    v1 = pool_x_array.generate_values(3)
+    arr.extend(pool_x_array.cls(v1))
+    assert arr == pool_x_array.cls(v0 + v1)
+    with pytest.raises(TypeError):
+        arr.extend(v1)
+
+
 def test_add(pool_x_array):
+    if pool_x_array.cls in MATH_POOL_ARRAYS_ITEM:
+        pytest.skip("adding pool arrays is element-wise")
     v0 = pool_x_array.generate_values(2)
     arr = pool_x_array.cls(v0)
     v1 = pool_x_array.generate_values(2)
@@ -235,14 +261,33 @@ def test_add(pool_x_array):
     assert arr2 == pool_x_array.cls(v0 + v1 + v2)
 
 
+# Pool arrays supporting element-wise math with their item type
+MATH_POOL_ARRAYS_ITEM = {
+    PoolRealArray: None,
+    PoolVector2Array: Vector2,
+    PoolVector3Array: Vector3,
+    PoolColorArray: Color,
+}
+
+
+def is_math_operand(cls, arg):
+    return cls in MATH_POOL_ARRAYS_ITEM and (
+        isinstance(arg, (int, float)) or type(arg) is MATH_POOL_ARRAYS_ITEM[cls]
+    )
+
+
 @pytest.mark.parametrize("arg", [None, [], (), Array(), 0, "foo", Vector2(), NODE])
 def test_bad_add(pool_x_array, arg):
+    if is_math_operand(pool_x_array.cls, arg):
+        pytest.skip("valid element-wise operand")
     with pytest.raises(TypeError):
         pool_x_array.cls() + arg
 
 
 @pytest.mark.parametrize("arg", [None, [], (), Array(), 0, "foo", Vector2(), NODE])
 def test_bad_iadd(pool_x_array, arg):
+    if is_math_operand(pool_x_array.cls, arg):
+        pytest.skip("valid element-wise operand")
     arr = pool_x_array.cls()
     with pytest.raises(TypeError):
         arr += arg
@@ -369,6 +414,69 @@ def test_outofrange_delitem(pool_x_array):
         del arr[-3]
 
 
+@pytest.mark.parametrize(
+    "slice_,count",
+    [
+        (slice(1, 3), 2),
+        (slice(1, 3), 0),
+        (slice(1, 3), 5),
+        (slice(None, None), 1),
+        (slice(4, 4), 3),
+        (slice(10, None), 2),
+        (slice(3, 1), 2),
+        (slice(None, None, 2), 3),
+        (slice(None, None, -2), 3),
+        (slice(-1, 1, -1), 4),
+    ],
+)
+def test_setitem_slice(pool_x_array, slice_, count):
+    vals = pool_x_array.generate_values(6)
+    new_vals = pool_x_array.generate_values(count)
+    arr = pool_x_array.cls(vals)
+    vals[slice_] = new_vals
+    arr[slice_] = new_vals
+    assert arr == pool_x_array.cls(vals)
+    arr[slice_] = pool_x_array.cls(new_vals)
+    assert arr == pool_x_array.cls(vals)
+
+
+def test_setitem_slice_self(pool_x_array):
+    vals = pool_x_array.generate_values(4)
+    arr = pool_x_array.cls(vals)
+    arr[1:2] = arr
+    vals[1:2] = vals
+    assert arr == pool_x_array.cls(vals)
+
+
+def test_setitem_bad_extended_slice(pool_x_array):
+    vals = pool_x_array.generate_values(4)
+    arr = pool_x_array.cls(vals)
+    with pytest.raises(ValueError):
+        arr[::2] = pool_x_array.generate_values(3)
+    assert arr == pool_x_array.cls(vals)
+
+
+@pytest.mark.parametrize(
+    "slice_",
+    [
+        slice(1, 3),
+        slice(3, 1),
+        slice(None, None),
+        slice(None, None, 2),
+        slice(1, None, 3),
+        slice(None, None, -2),
+        slice(-1, 1, -1),
+        slice(-10, 10, 1),
+    ],
+)
+def test_delitem_slice(pool_x_array, slice_):
+    vals = pool_x_array.generate_values(6)
+    arr = pool_x_array.cls(vals)
+    del vals[slice_]
+    del arr[slice_]
+    assert arr == pool_x_array.cls(vals)
+
+
 def test_iter(pool_x_array):
     items = pool_x_array.generate_values(3)
     arr = pool_x_array.cls(items)
@@ -401,6 +509,244 @@ def test_raw_access(pool_x_array):
             assert ptr[i] == values[i % len(values)]
 
 
+@pytest.mark.parametrize(
+    "cls,items,fmt,shape",
+    [
+        (PoolByteArray, [1, 2, 3], "B", (3,)),
+        (PoolIntArray, [1, -2, 3], "i", (3,)),
+        (PoolRealArray, [1.5, 2.5], "f", (2,)),
+        (PoolVector2Array, [Vector2(1, 2), Vector2(3, 4)], "f", (2, 2)),
+        (PoolVector3Array, [Vector3(1, 2, 3)], "f", (1, 3)),
+        (PoolColorArray, [Color(0.5, 0.25, 1, 0)], "f", (1, 4)),
+    ],
+)
+def test_buffer_protocol(cls, items, fmt, shape):
+    arr = cls(items)
+    with memoryview(arr) as view:
+        assert view.format == fmt
+        assert view.shape == shape
+        assert view.c_contiguous
+        assert view.readonly
+        flat = view.cast("B").cast(fmt).tolist()
+    expected = []
+    for item in items:
+        if isinstance(item, Vector2):
+            expected += [item.x, item.y]
+        elif isinstance(item, Vector3):
+            expected += [item.x, item.y, item.z]
+        elif isinstance(item, Color):
+            expected += [item.r, item.g, item.b, item.a]
+        else:
+            expected.append(item)
+    assert flat == pytest.approx(expected)
+
+
+def test_buffer_protocol_write():
+    arr = PoolVector2Array([Vector2(1, 2), Vector2(3, 4)])
+    # Unlike memoryview, ctypes requests a writable buffer
+    floats = (ctypes.c_float * 4).from_buffer(arr)
+    floats[2] = 42
+    del floats
+    assert arr[1] == Vector2(42, 4)
+
+
+def test_buffer_protocol_readonly_no_copy_on_write():
+    arr = PoolIntArray([1, 2, 3])
+    copy = PoolIntArray(arr)
+    with memoryview(arr) as view:
+        assert view.readonly
+        with arr.read_access() as a1, copy.read_access() as a2:
+            # Both arrays still share the same data
+            assert a1.get_address() == a2.get_address()
+
+
+def test_buffer_protocol_locks_resize():
+    arr = PoolIntArray([1, 2, 3])
+    with memoryview(arr):
+        arr.resize(10)
+        # Godot refuses to resize a locked pool array
+        assert len(arr) == 3
+    arr.resize(10)
+    assert len(arr) == 10
+
+
+def test_buffer_protocol_empty():
+    with memoryview(PoolIntArray()) as view:
+        assert view.shape == (0,)
+        assert view.tobytes() == b""
+
+
+def test_pool_string_array_no_buffer_protocol():
+    with pytest.raises(TypeError):
+        memoryview(PoolStringArray(["foo"]))
+
+
+def test_from_buffer():
+    assert PoolByteArray.from_buffer(b"\x01\x02\x03") == PoolByteArray([1, 2, 3])
+    assert PoolIntArray.from_buffer(array("i", [1, -2])) == PoolIntArray([1, -2])
+    assert PoolRealArray.from_buffer(array("f", [0.5])) == PoolRealArray([0.5])
+    assert PoolVector2Array.from_buffer(array("f", [1, 2, 3, 4])) == PoolVector2Array(
+        [Vector2(1, 2), Vector2(3, 4)]
+    )
+    assert PoolColorArray.from_buffer(array("f", [1, 0, 0, 1])) == PoolColorArray(
+        [Color(1, 0, 0, 1)]
+    )
+    assert PoolVector3Array.from_buffer(b"") == PoolVector3Array()
+    # Round trip through the buffer protocol
+    arr = PoolVector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+    assert PoolVector3Array.from_buffer(arr) == arr
+    assert PoolVector3Array.from_buffer(memoryview(arr)) == arr
+
+
+def test_from_buffer_bad_buffer():
+    with pytest.raises(TypeError):
+        PoolIntArray.from_buffer([1, 2])
+    with pytest.raises(ValueError):
+        PoolIntArray.from_buffer(array("d", [1.0]))
+    with pytest.raises(ValueError):
+        PoolVector2Array.from_buffer(array("f", [1, 2, 3]))
+
+
+def test_init_from_buffer():
+    assert PoolByteArray(b"\x01\x02") == PoolByteArray([1, 2])
+    assert PoolRealArray(array("f", [1, 2])) == PoolRealArray([1, 2])
+    assert PoolVector2Array(PoolRealArray([1, 2])) == PoolVector2Array([Vector2(1, 2)])
+    # Incompatible buffer falls back on item per item conversion
+    assert PoolRealArray(array("d", [1.5, 2])) == PoolRealArray([1.5, 2])
+    # So does a non contiguous one
+    assert PoolIntArray(memoryview(array("i", [1, 2, 3, 4]))[::2]) == PoolIntArray([1, 3])
+    with pytest.raises(BufferError):
+        PoolIntArray.from_buffer(memoryview(array("i", [1, 2, 3, 4]))[::2])
+
+
+def test_math_operators():
+    arr = PoolVector2Array([Vector2(1, 2), Vector2(3, 4)])
+    assert arr * 2 == PoolVector2Array([Vector2(2, 4), Vector2(6, 8)])
+    assert 2 * arr == arr * 2
+    assert arr + Vector2(1, 1) == PoolVector2Array([Vector2(2, 3), Vector2(4, 5)])
+    assert arr - 1 == PoolVector2Array([Vector2(0, 1), Vector2(2, 3)])
+    assert 1 - arr == PoolVector2Array([Vector2(0, -1), Vector2(-2, -3)])
+    assert arr / Vector2(1, 2) == PoolVector2Array([Vector2(1, 1), Vector2(3, 2)])
+    assert arr - arr == PoolVector2Array([Vector2(), Vector2()])
+    assert arr * arr == PoolVector2Array([Vector2(1, 4), Vector2(9, 16)])
+    assert arr + arr == PoolVector2Array([Vector2(2, 4), Vector2(6, 8)])
+    assert arr.add(arr) == arr + arr
+    with pytest.raises(ValueError):
+        arr + PoolVector2Array([Vector2()])
+    with pytest.raises(ValueError):
+        arr * PoolVector2Array([Vector2()])
+    with pytest.raises(TypeError):
+        arr * "foo"
+    with pytest.raises(TypeError):
+        arr.add(Vector3())
+
+
+def test_math_inplace_operators():
+    arr = PoolRealArray([1, 2, 3])
+    copy = PoolRealArray(arr)
+    arr *= 2
+    arr += 1
+    arr -= PoolRealArray([1, 1, 1])
+    arr += PoolRealArray([0, 0, 0])
+    arr /= 2
+    assert arr == PoolRealArray([1, 2, 3])
+    arr += 1
+    assert arr == PoolRealArray([2, 3, 4])
+    # Copy-on-write preserves the original data
+    assert copy == PoolRealArray([1, 2, 3])
+
+
+def test_math_lerp_clamp():
+    arr = PoolColorArray([Color(0, 0, 0, 0), Color(1, 1, 1, 1)])
+    assert arr.lerp(Color(1, 1, 1, 1), 0.5) == PoolColorArray(
+        [Color(0.5, 0.5, 0.5, 0.5), Color(1, 1, 1, 1)]
+    )
+    assert arr.clamp(0.25, Color(0.5, 0.5, 0.5, 1)) == PoolColorArray(
+        [Color(0.25, 0.25, 0.25, 0.25), Color(0.5, 0.5, 0.5, 1)]
+    )
+    with pytest.raises(TypeError):
+        arr.clamp(arr, 1)
+
+
+def test_math_vector():
+    arr = PoolVector3Array([Vector3(3, 4, 0), Vector3(0, 0, 0)])
+    assert arr.length() == PoolRealArray([5, 0])
+    assert arr.normalized() == PoolVector3Array([Vector3(0.6, 0.8, 0), Vector3(0, 0, 0)])
+    assert arr.dot(Vector3(1, 1, 1)) == PoolRealArray([7, 0])
+    assert arr.dot(arr) == PoolRealArray([25, 0])
+
+
+def test_math_reductions():
+    arr = PoolVector2Array([Vector2(1, 5), Vector2(3, -1)])
+    assert arr.sum() == Vector2(4, 4)
+    assert arr.mean() == Vector2(2, 2)
+    assert arr.min() == Vector2(1, -1)
+    assert arr.max() == Vector2(3, 5)
+    assert arr.bounding_box() == Rect2(1, -1, 2, 6)
+    arr3 = PoolVector3Array([Vector3(1, 2, 3), Vector3(-1, 0, 4)])
+    assert arr3.bounding_box() == AABB(Vector3(-1, 0, 3), Vector3(2, 2, 1))
+    reals = PoolRealArray([1, 2, 6])
+    assert reals.sum() == 9
+    assert reals.mean() == 3
+    assert reals.min() == 1
+    assert reals.max() == 6
+    assert PoolRealArray().sum() == 0
+    with pytest.raises(ValueError):
+        PoolRealArray().mean()
+    with pytest.raises(ValueError):
+        PoolVector2Array().bounding_box()
+
+
+def test_read_access(pool_x_array):
+    values = pool_x_array.generate_values(3)
+    arr = pool_x_array.cls(values)
+    with arr.read_access() as access:
+        assert isinstance(access.get_address(), int)
+        assert len(access) == 3
+        assert [access[i] for i in range(3)] == values
+        assert access[-1] == values[-1]
+        with pytest.raises(IndexError):
+            access[3]
+    with pytest.raises(ValueError):
+        access[0]
+
+
+def test_read_access_no_copy_on_write():
+    arr = PoolIntArray([1, 2, 3])
+    copy = PoolIntArray(arr)
+    with arr.read_access() as a1, copy.read_access() as a2:
+        # Both arrays still share the same data
+        assert a1.get_address() == a2.get_address()
+
+
+def test_read_access_buffer():
+    arr = PoolVector3Array([Vector3(1, 2, 3)])
+    with arr.read_access() as access:
+        view = memoryview(access)
+        assert view.readonly
+        assert view.shape == (1, 3)
+        assert view.tolist() == [[1, 2, 3]]
+        with pytest.raises(BufferError):
+            access.release()
+        view.release()
+
+
+def test_contains(pool_x_array):
+    values = pool_x_array.generate_values(2)
+    missing = next(v for v in pool_x_array.generate_values(50) if v not in values)
+    arr = pool_x_array.cls(values)
+    assert values[0] in arr
+    assert values[1] in arr
+    assert missing not in arr
+    assert "dummy" not in arr
+    assert None not in arr
+
+
+def test_to_list(pool_x_array):
+    values = pool_x_array.generate_values(3)
+    assert pool_x_array.cls(values).to_list() == values
+
+
 def test_pool_byte_array_overflow():
     with pytest.raises(OverflowError):
         PoolByteArray([256])
@@ -411,3 +757,85 @@ def test_pool_byte_array_overflow():
         arr.append(256)
     with pytest.raises(OverflowError):
         arr.push_back(256)
+
+
+def generate_values_with_duplicates(bench, count):
+    values = bench.generate_values(count)
+    return values + values[::2]
+
+
+def test_sort(sortable_pool_x_array):
+    values = generate_values_with_duplicates(sortable_pool_x_array, 20)
+    arr = sortable_pool_x_array.cls(values)
+    arr.sort()
+    assert arr == sortable_pool_x_array.cls(sorted(values))
+    arr.sort(reverse=True)
+    assert arr == sortable_pool_x_array.cls(sorted(values, reverse=True))
+
+
+def test_sort_nan():
+    arr = PoolRealArray([2.0, float("nan"), 1.0])
+    arr.sort()
+    assert arr[0] == 1.0
+    assert arr[1] == 2.0
+    assert arr[2] != arr[2]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_argsort(sortable_pool_x_array, reverse):
+    values = generate_values_with_duplicates(sortable_pool_x_array, 20)
+    arr = sortable_pool_x_array.cls(values)
+    indices = arr.argsort(reverse=reverse)
+    assert isinstance(indices, PoolIntArray)
+    # Sorting is stable
+    assert list(indices) == sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    assert sortable_pool_x_array.cls().argsort() == PoolIntArray()
+
+
+def test_searchsorted(sortable_pool_x_array):
+    values = sorted(generate_values_with_duplicates(sortable_pool_x_array, 20))
+    arr = sortable_pool_x_array.cls(values)
+    for value in values + sortable_pool_x_array.generate_values(5):
+        assert arr.searchsorted(value) == bisect_left(values, value)
+        assert arr.searchsorted(value, side="right") == bisect_right(values, value)
+    with pytest.raises(ValueError):
+        arr.searchsorted(values[0], side="middle")
+    with pytest.raises(TypeError):
+        arr.searchsorted(None)
+
+
+def test_unique(sortable_pool_x_array):
+    values = generate_values_with_duplicates(sortable_pool_x_array, 20)
+    expected = []
+    expected_counts = []
+    for value in sorted(values):
+        if expected and expected[-1] == value:
+            expected_counts[-1] += 1
+        else:
+            expected.append(value)
+            expected_counts.append(1)
+    arr = sortable_pool_x_array.cls(values)
+    assert arr.unique() == sortable_pool_x_array.cls(expected)
+    unique, counts = arr.unique(return_counts=True)
+    assert unique == sortable_pool_x_array.cls(expected)
+    assert counts == PoolIntArray(expected_counts)
+    # Original array is left untouched
+    assert arr == sortable_pool_x_array.cls(values)
+
+
+@pytest.mark.parametrize("cls", [PoolIntArray, PoolRealArray])
+def test_histogram(cls):
+    arr = cls([1, 2, 2, 3, 10])
+    counts, edges = arr.histogram(3)
+    assert counts == PoolIntArray([4, 0, 1])
+    assert edges == PoolRealArray([1, 4, 7, 10])
+    counts, edges = arr.histogram(2, bounds=(0, 4))
+    assert counts == PoolIntArray([1, 3])
+    assert edges == PoolRealArray([0, 2, 4])
+    counts, edges = cls().histogram(2)
+    assert counts == PoolIntArray([0, 0])
+    assert edges == PoolRealArray([0, 0.5, 1])
+    with pytest.raises(ValueError):
+        arr.histogram(0)
+    with pytest.raises(ValueError):
+        arr.histogram(2, bounds=(4, 0))
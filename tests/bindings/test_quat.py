@@ -1,6 +1,6 @@
 import pytest
 
-from godot import Basis, Quat, Vector3
+from godot import Basis, Quat, Vector3, PoolVector3Array, PoolRealArray
 
 
 def test_base():
@@ -260,3 +260,24 @@ def test_equal():
 def test_bad_equal(arg):
     arr = Quat(0.1, 1, 2, 3)
     assert arr != arg
+
+
+def test_xform_array():
+    q = Quat.from_euler(Vector3(0.3, -0.2, 1.0))
+    points = [Vector3(1, 0, 0), Vector3(-1, 2, 5)]
+    ret = q.xform_array(PoolVector3Array(points))
+    expected = [q.xform(p) for p in points]
+    assert [(v.x, v.y, v.z) for v in ret] == pytest.approx(
+        [(v.x, v.y, v.z) for v in expected], abs=1e-5
+    )
+
+
+def test_slerp_array():
+    q1 = Quat.from_euler(Vector3(0.3, -0.2, 1.0))
+    q2 = Quat.from_euler(Vector3(-1, 0.5, 0))
+    weights = [0, 0.25, 0.5, 1]
+    ret = q1.slerp_array(q2, PoolRealArray(weights))
+    expected = [q1.slerp(q2, w) for w in weights]
+    assert [(q.x, q.y, q.z, q.w) for q in ret] == pytest.approx(
+        [(q.x, q.y, q.z, q.w) for q in expected], abs=1e-5
+    )
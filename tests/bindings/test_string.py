@@ -36,3 +36,16 @@ def test_unicode(char):
     gdchar = GDString(char)
     assert str(gdchar) == char
     assert gdchar.length() == len(char)
+
+
+@pytest.mark.parametrize("size", [0, 1, 31, 32, 100])
+@pytest.mark.parametrize("char", ["e", "é", "€", "蛇", "🐍"])
+def test_unicode_sizes(char, size):
+    if len(char.encode("utf8")) > 2 and sys.platform == "win32":
+        pytest.skip("Windows only supports UCS2")
+
+    # Short strings are converted on the stack, long ones on the heap
+    pystr = ("a" + char) * size
+    gdstr = GDString(pystr)
+    assert gdstr.length() == len(pystr)
+    assert str(gdstr) == pystr
@@ -0,0 +1,51 @@
+import pytest
+
+from godot import Array, GDString, Node, StringName
+
+
+def test_init():
+    v1 = StringName("foo")
+    v2 = StringName(GDString("foo"))
+    assert v1 == v2
+    assert str(v1) == "foo"
+    assert repr(v1) == "<StringName(foo)>"
+    assert v1.get_name() == GDString("foo")
+
+
+@pytest.mark.parametrize("arg", [None, 0])
+def test_bad_init(arg):
+    with pytest.raises(TypeError):
+        StringName(arg)
+
+
+def test_equal():
+    v1 = StringName("foo")
+    v2 = StringName("foo")
+    assert v1 == v2
+    other = StringName("bar")
+    assert not v1 == other  # Force use of __eq__
+
+
+@pytest.mark.parametrize("arg", [None, 0, "foo", GDString("foo"), StringName("bar")])
+def test_bad_equal(arg):
+    v = StringName("foo")
+    assert v != arg
+
+
+def test_hash():
+    assert {StringName("foo"), StringName("foo"), StringName("bar")} == {
+        StringName("foo"),
+        StringName("bar"),
+    }
+
+
+def test_as_string_argument(generate_obj):
+    node = generate_obj(Node)
+    node.set_name(StringName("foo"))
+    assert node.get_name() == GDString("foo")
+    assert node.has_method(StringName("get_name"))
+
+
+def test_to_variant():
+    arr = Array([StringName("foo")])
+    assert arr[0] == GDString("foo")
@@ -1,6 +1,6 @@
 import pytest
 
-from godot import Transform, Basis, Vector3
+from godot import Transform, Basis, Quat, Vector3, PoolVector3Array
 
 
 def test_base():
@@ -15,3 +15,34 @@ def test_base():
 def test_repr():
     v = Transform()
     assert repr(v).startswith("<Transform(")
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_xform_array(inverse):
+    t = Transform.from_basis_origin(
+        Basis.from_euler(Vector3(0.1, 0.2, 0.3)), Vector3(1, 2, 3)
+    )
+    points = [Vector3(1, 0, 0), Vector3(-1, 2, 5), Vector3()]
+    if inverse:
+        ret = t.xform_inv_array(PoolVector3Array(points))
+        expected = [t.xform_inv_vector3(p) for p in points]
+    else:
+        ret = t.xform_array(PoolVector3Array(points))
+        expected = [t.xform_vector3(p) for p in points]
+    assert isinstance(ret, PoolVector3Array)
+    assert [(v.x, v.y, v.z) for v in ret] == pytest.approx(
+        [(v.x, v.y, v.z) for v in expected], abs=1e-5
+    )
+
+
+def test_xform_array_out():
+    t = Transform.from_basis_origin(Basis(), Vector3(1, 2, 3))
+    points = PoolVector3Array([Vector3(1, 1, 1)])
+    copy = PoolVector3Array(points)
+    out = PoolVector3Array()
+    assert t.xform_array(points, out) is out
+    assert out == PoolVector3Array([Vector3(2, 3, 4)])
+    # Output can be the input
+    assert t.xform_array(points, points) is points
+    assert points == PoolVector3Array([Vector3(2, 3, 4)])
+    assert copy == PoolVector3Array([Vector3(1, 1, 1)])
@@ -1,6 +1,6 @@
 import pytest
 
-from godot import Transform2D, Vector2, Rect2
+from godot import Transform2D, Vector2, Rect2, PoolVector2Array
 
 
 def test_init():
@@ -127,3 +127,22 @@ def test_not_equal(arg):
     arr = Transform2D(Vector2(1, 2), Vector2(3, 4), Vector2(5, 6))
     assert arr != arg
     assert not arr != arr  # Force use of __ne__
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_xform_array(inverse):
+    t = Transform2D.from_rot_pos(0.5, Vector2(1, 2))
+    points = [Vector2(1, 0), Vector2(-1, 2), Vector2()]
+    if inverse:
+        ret = t.xform_inv_array(PoolVector2Array(points))
+        expected = [t.xform_inv(p) for p in points]
+    else:
+        ret = t.xform_array(PoolVector2Array(points))
+        expected = [t.xform(p) for p in points]
+    assert isinstance(ret, PoolVector2Array)
+    assert [(v.x, v.y) for v in ret] == pytest.approx(
+        [(v.x, v.y) for v in expected], abs=1e-5
+    )
+    out = PoolVector2Array()
+    assert t.xform_array(PoolVector2Array(points), out) is out
+    assert len(out) == len(points)
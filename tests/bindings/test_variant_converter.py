@@ -0,0 +1,62 @@
+import pytest
+from enum import Enum
+from dataclasses import dataclass
+
+from godot import Array, Dictionary, GDString, Vector2, register_variant_converter
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+class Direction(Enum):
+    LEFT = "left"
+    RIGHT = "right"
+
+
+class MyInt(int):
+    pass
+
+
+register_variant_converter(Point, lambda p: Vector2(p.x, p.y), Vector2)
+register_variant_converter(Direction, lambda d: d.value, str)
+
+
+def test_custom_converter():
+    arr = Array([Point(1, 2), Direction.RIGHT])
+    assert arr[0] == Vector2(1, 2)
+    assert arr[1] == GDString("right")
+
+
+def test_custom_converter_subclass():
+    @dataclass
+    class Point3(Point):
+        z: float = 0
+
+    d = Dictionary()
+    d["p"] = Point3(3, 4, 5)
+    assert d["p"] == Vector2(3, 4)
+
+
+def test_builtin_subclass():
+    arr = Array([MyInt(42), True])
+    assert arr[0] == 42
+    assert type(arr[0]) is int
+    assert arr[1] is True
+
+
+@pytest.mark.parametrize(
+    "pytype,converter,gdtype,exc",
+    [
+        (int, str, GDString, ValueError),
+        (Vector2, str, GDString, ValueError),
+        ("foo", str, GDString, TypeError),
+        (MyInt, "not a callable", int, TypeError),
+        (MyInt, str, Point, ValueError),
+    ],
+)
+def test_bad_register(pytype, converter, gdtype, exc):
+    with pytest.raises(exc):
+        register_variant_converter(pytype, converter, gdtype)
@@ -25,6 +25,13 @@ def anynode(request, root_node):
     return root_node.get_node(request.param)
 
 
+@pytest.fixture(params=["/root/main/test/gdnode", "/root/main/test/gdsubnode"])
+def anygdnode(request, root_node):
+    # Python nodes are their script instance, so unlike GDScript nodes
+    # script members are accessed as plain Python attributes
+    return root_node.get_node(request.param)
+
+
 @pytest.fixture(params=["/root/main/test/pynode", "/root/main/test/gdnode"])
 def node(request, root_node):
     return root_node.get_node(request.param)
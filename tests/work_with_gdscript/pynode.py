@@ -4,6 +4,7 @@ from godot import exposed, export, Node
 @exposed
 class PyNode(Node):
     _ready_called = False
+    _ready_notifications = 0
     _overloaded_by_child_prop_value = None
 
     def _ready(self):
@@ -12,12 +13,24 @@ class PyNode(Node):
     def is_ready_called(self):
         return self._ready_called
 
+    def _notification(self, what):
+        if what == Node.NOTIFICATION_READY:
+            self._ready_notifications += 1
+
+    def get_ready_notifications(self):
+        return self._ready_notifications
+
     def meth(self, attr):
         return attr
 
     def overloaded_by_child_meth(self, attr):
         return attr
 
+    def typed_meth(self, value: int, prefix: str = "typed"):
+        # Annotated as `str`, so no GDString here
+        assert type(prefix) is str
+        return f"{prefix}:{value}"
+
     @staticmethod
     def static_meth(attr):
         return f"static:{attr}"
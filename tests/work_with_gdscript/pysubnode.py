@@ -1,11 +1,12 @@
-from godot import exposed, export
+from godot import exposed, export, Node
 
 from pynode import PyNode
 
 
-@exposed
+@exposed(notifications=[Node.NOTIFICATION_READY])
 class PySubNode(PyNode):
     _sub_ready_called = False
+    _sub_ready_notifications = 0
     _overloaded_by_child_prop_value = None
 
     def _ready(self):
@@ -15,6 +16,13 @@ class PySubNode(PyNode):
     def is_sub_ready_called(self):
         return self._sub_ready_called
 
+    def _notification(self, what):
+        if what == Node.NOTIFICATION_READY:
+            self._sub_ready_notifications += 1
+
+    def get_sub_ready_notifications(self):
+        return self._sub_ready_notifications
+
     def overloaded_by_child_meth(self, attr):
         return f"sub:{attr}"
 
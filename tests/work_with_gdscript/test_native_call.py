@@ -3,7 +3,7 @@
 #       - overload native method ?
 import pytest
 
-from godot import GDString, ResourceLoader, GDScript, PluginScript
+from godot import Array, GDString, Node, ResourceLoader, GDScript, PluginScript, OK
 
 
 def test_native_method(node):
@@ -30,36 +30,127 @@ def test_overloaded_native_method(node, subnode):
     assert ret == expected
 
 
+# Python nodes are retrieved as their script instance, so script members
+# are accessed through Godot's `call`/`get`/`set` to go through Godot dispatch
+
+
+def test_python_node_is_script_instance(pynode):
+    from pynode import PyNode
+
+    assert type(pynode) is PyNode
+    assert pynode.meth("foo") == "foo"
+
+
 def test_node_ready_called(node):
-    assert node.is_ready_called()
+    assert node.call("is_ready_called")
 
 
 def test_subnode_ready_called(subnode):
-    assert subnode.is_ready_called()
-    assert subnode.is_sub_ready_called()
+    assert subnode.call("is_ready_called")
+    assert subnode.call("is_sub_ready_called")
+
+
+def test_notification_chain(pynode, pysubnode):
+    assert pynode.call("get_ready_notifications") == 1
+    # Each `_notification` of the class hierarchy is called exactly once
+    assert pysubnode.call("get_ready_notifications") == 1
+    assert pysubnode.call("get_sub_ready_notifications") == 1
 
 
 def test_method_call(anynode):
-    ret = anynode.meth("foo")
+    ret = anynode.call("meth", "foo")
     assert ret == GDString("foo")
 
 
+def test_repeated_method_call(anynode):
+    # Second call goes through the cached method lookup
+    for attr in ("foo", "bar"):
+        ret = anynode.call("meth", attr)
+        assert ret == GDString(attr)
+
+
+def test_undefined_method_call(pynode):
+    # Second call hits the cached missing method, Godot still gets
+    # INVALID_METHOD and `callv` returns nil instead of failing
+    for _ in range(2):
+        assert pynode.callv("missing_meth", Array()) is None
+
+
+def test_bound_method_call(anygdnode):
+    meth = anygdnode.meth
+    assert meth("foo") == GDString("foo")
+    assert meth("bar") == GDString("bar")
+
+
+def test_unknown_attribute(anygdnode):
+    # Missing members are cached as well
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            anygdnode.unknown_attr
+        with pytest.raises(AttributeError):
+            anygdnode.unknown_attr = 42
+
+
+def test_reloaded_script_members():
+    script = GDScript()
+    script.set_source_code("extends Node\n\nfunc foo():\n    return 'foo'\n")
+    assert script.reload() == OK
+    node = Node.new()
+    try:
+        node.set_script(script)
+        assert node.foo() == GDString("foo")
+        script.set_source_code("extends Node\n\nfunc bar():\n    return 'bar'\n")
+        # Keep state, given the script has an instance
+        assert script.reload(True) == OK
+        assert node.bar() == GDString("bar")
+        with pytest.raises(AttributeError):
+            node.foo
+    finally:
+        node.free()
+
+
+def test_typed_method_call(pynode):
+    assert pynode.call("typed_meth", 42) == GDString("typed:42")
+    assert pynode.call("typed_meth", 42, "foo") == GDString("foo:42")
+
+
+def test_typed_method_call_bad_argument(pynode):
+    # Call is rejected with an invalid argument error before reaching Python
+    with pytest.raises(TypeError) as exc:
+        pynode.call("typed_meth", "42")
+    assert str(exc.value) == "call() argument 1 must be of type INT"
+    with pytest.raises(TypeError) as exc:
+        pynode.call("typed_meth")
+    assert str(exc.value) == "call() takes at least 1 arguments"
+
+
 def test_overloaded_method_call(subnode):
-    ret = subnode.overloaded_by_child_meth("foo")
+    ret = subnode.call("overloaded_by_child_meth", "foo")
     assert ret == GDString("sub:foo")
 
 
 def test_property_without_default_value(anynode):
-    value = anynode.prop
+    value = anynode.get("prop")
     assert value is None
 
 
 def test_property(anynode):
-    anynode.prop = 42
-    value = anynode.prop
+    anynode.set("prop", 42)
+    value = anynode.get("prop")
     assert value == 42
 
 
+def test_repeated_property_access(anygdnode):
+    for value in (1, 2):
+        anygdnode.prop = value
+        assert anygdnode.prop == value
+
+
+def test_native_property_on_python_node(pynode):
+    # Not an exported property, must be handled by Godot
+    assert pynode.get("name") == GDString("pynode")
+
+
 @pytest.mark.xfail(reason="default value seems to be only set in .tscn")
 def test_overloaded_property_default_value(pynode, pysubnode):
     # Parent property
@@ -74,18 +165,18 @@ def test_overloaded_property(pynode, pysubnode):
     # Not supported by GDScript
 
     # Parent property
-    pynode.overloaded_by_child_prop = "foo"
-    value = pynode.overloaded_by_child_prop
+    pynode.set("overloaded_by_child_prop", "foo")
+    value = pynode.get("overloaded_by_child_prop")
     assert value == GDString("foo")
 
     # Overloaded property
-    pysubnode.overloaded_by_child_prop = "foo"
-    value = pysubnode.overloaded_by_child_prop
+    pysubnode.set("overloaded_by_child_prop", "foo")
+    value = pysubnode.get("overloaded_by_child_prop")
     assert value == GDString("sub:foo")
 
 
 def test_static_method_call(node):
-    value = node.static_meth("foo")
+    value = node.call("static_meth", "foo")
     assert value == GDString("static:foo")
 
 